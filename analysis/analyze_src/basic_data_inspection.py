@@ -41,10 +41,16 @@ class SummaryStatisticsInspectionStrategy(DataInspection):
         Returns:
         None: This method prints the summary statistics of the dataframe.
         """
+        ## Column statistics attached at ingestion (data.attrs["column_stats"]) replace a rescan
+        ## while the data is unchanged; describe() returns None when they are stale
+        stats = data.attrs.get("column_stats")
+        numerical_summary = stats.describe(data) if stats is not None else None
+        categorical_summary = stats.describe(data, include=["object", "category"]) if stats is not None else None
+
         print("Summary Statistics (Numerical Features):")
-        print(data.describe())
+        print(numerical_summary if numerical_summary is not None else data.describe())
         print("\nSummary Statistics (Categorical Features):")
-        print(data.describe(include=["object"]))
+        print(categorical_summary if categorical_summary is not None else data.describe(include=["object"]))
 
 ## Context Class for Data Inspection
 class DataInspector:
@@ -85,7 +91,7 @@ class DataInspector:
 ## Example Usage
 if __name__ == "__main__":
     ## Read the data into a pandas dataframe
-    df = pd.read_csv("../../extracted_data/AmesHousing.csv")
+    df = pd.read_csv("../../data/archive.zip")
 
     ## Create a DataInspector with the DataTypeInspectionStrategy
     inspector = DataInspector(DataTypeInspectionStrategy())
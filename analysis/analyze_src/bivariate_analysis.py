@@ -124,7 +124,7 @@ class BivariateAnalyzer:
 # Example usage of the class
 if __name__ == "__main__":
     # Load the dataset
-    df = pd.read_csv("../../extracted_data/AmesHousing.csv")
+    df = pd.read_csv("../../data/archive.zip")
 
     # Perform bi-variate analysis
     numerical_numerical_analyser = NumericalBivariateAnalysisStrategy()
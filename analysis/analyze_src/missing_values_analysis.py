@@ -38,7 +38,7 @@ class SimpleMissingValuesAnalysis(MissingValuesAnalysis):
 # Example usage of the class
 if __name__ == "__main__":
     # Load the dataset
-    df = pd.read_csv("../../extracted_data/AmesHousing.csv")
+    df = pd.read_csv("../../data/archive.zip")
 
     # Perform missing value analysis
     missing_values_analyser = SimpleMissingValuesAnalysis()
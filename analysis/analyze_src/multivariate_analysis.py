@@ -74,7 +74,7 @@ class SimpleMultiVariateAnalysis(MultivariateAnalysis):
 
 # Example usage
 if __name__ == '__main__':
-    df = pd.read_csv('../../extracted_data/AmesHousing.csv')  # Read the dataset from the specified location
+    df = pd.read_csv('../../data/archive.zip')  # Read the dataset from the specified location
     
     # Create an instance of the concrete class
     MultivariateAnalysis = SimpleMultiVariateAnalysis()  
@@ -102,7 +102,7 @@ class UnivariateAnalyzer:
 ##Example usage of the class
 if __name__ == "__main__":
     # Load the dataset
-    df = pd.read_csv("../../extracted_data/AmesHousing.csv")
+    df = pd.read_csv("../../data/archive.zip")
 
     # Perform univariate analysis on the 'SalePrice' feature
     univariate_analyzer = UnivariateAnalyzer(SimpleUnivariateAnalysisStrategy())  ##Create an instance of the UnivariateAnalyzer with the SimpleUnivariateAnalysisStrategy
@@ -0,0 +1,150 @@
+import json
+import os
+import resource
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import click
+import pandas as pd
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(root_dir)
+
+from src.ingest_data import ENGINES, IngestCSVData
+from src.ingest_schema import IngestSchema
+
+AMES_ARCHIVE = os.path.join(root_dir, "data", "archive.zip")
+DEFAULT_ROWS = (100_000, 1_000_000, 10_000_000)
+
+
+def make_synthetic(rows: int, out_dir: str, block_rows: int = 100_000) -> str:
+    """
+    Writes an archive holding the Ames rows repeated up to `rows` rows.
+
+    Values are copied unchanged, so a schema inferred from Ames (with its downcast integer types) fits every file.
+
+    Parameters:
+    rows (int): The number of rows to write.
+    out_dir (str): The directory receiving the archive. Existing archives are reused.
+    block_rows (int): Rows serialized per write.
+
+    Returns:
+    str: The path of the archive.
+    """
+    path = os.path.join(out_dir, f"ames_{rows}.zip")
+    if os.path.exists(path):
+        return path
+
+    ames = IngestCSVData().ingest(AMES_ARCHIVE)
+    block = pd.concat([ames] * -(-block_rows // len(ames)), ignore_index=True).iloc[:block_rows]
+    tmp_path = f"{path}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        with zip_ref.open(f"ames_{rows}.csv", "w", force_zip64=True) as member:
+            for start in range(0, rows, block_rows):
+                chunk = block.iloc[: min(block_rows, rows - start)]
+                member.write(chunk.to_csv(index=False, header=start == 0).encode())
+    os.replace(tmp_path, path)
+    return path
+
+
+def csv_bytes(path: str) -> int:
+    """Uncompressed size of the CSV member, which throughput is measured against"""
+    if path.endswith(".csv"):
+        return os.path.getsize(path)
+    with zipfile.ZipFile(path) as zip_ref:
+        return sum(info.file_size for info in zip_ref.infolist() if info.filename.endswith(".csv"))
+
+
+def _run_trial(path: str, engine: str, schema_path: str) -> dict:
+    """Ingests the file once; runs in a fresh process so the peak RSS belongs to this trial alone"""
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    df = IngestCSVData(schema_path=schema_path, engine=engine).ingest(path)
+    seconds = time.perf_counter() - start
+    ## ru_maxrss is in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "seconds": seconds,
+        "peak_rss_mb": peak_rss / 1024,
+        "ingest_rss_mb": (peak_rss - baseline_rss) / 1024,
+        "frame_mb": df.memory_usage(deep=True).sum() / 1024**2,
+        "rows": len(df),
+    }
+
+
+def benchmark(path: str, engines, schema_path: str = None, repeat: int = 3) -> list:
+    """
+    Measures every engine on one file, keeping the fastest of `repeat` runs.
+
+    Parameters:
+    path (str): The archive or CSV file to ingest.
+    engines (list): The engines to compare.
+    schema_path (str): Ingest schema applied while parsing. None parses without a schema.
+    repeat (int): The number of runs per engine.
+
+    Returns:
+    list: One result dict per engine.
+    """
+    size_mb = csv_bytes(path) / 1024**2
+    results = []
+    for engine in engines:
+        trials = []
+        for _ in range(repeat):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                trials.append(executor.submit(_run_trial, path, engine, schema_path).result())
+        best = min(trials, key=lambda trial: trial["seconds"])
+        best.update(
+            file=os.path.basename(path),
+            engine=engine,
+            csv_mb=size_mb,
+            mb_per_s=size_mb / best["seconds"],
+            peak_rss_mb=max(trial["peak_rss_mb"] for trial in trials),
+        )
+        results.append(best)
+        print(
+            f"{best['file']:>20} {engine:>15} {best['rows']:>10} rows {size_mb:9.1f} MB "
+            f"{best['seconds']:8.2f} s {best['mb_per_s']:8.1f} MB/s "
+            f"peak RSS {best['peak_rss_mb']:8.1f} MB (ingest {best['ingest_rss_mb']:8.1f} MB)"
+        )
+    return results
+
+
+@click.command()
+@click.option("--rows", "-r", multiple=True, type=int, default=DEFAULT_ROWS, show_default=True,
+              help="Synthetic file sizes in rows. Pass several times; 0 benchmarks the Ames file only.")
+@click.option("--engine", "-e", "engines", multiple=True, type=click.Choice(ENGINES), default=ENGINES,
+              show_default=True, help="Engines to compare.")
+@click.option("--schema-path", default=None, help="Ingest schema applied while parsing; inferred from Ames if missing.")
+@click.option("--repeat", default=3, show_default=True, help="Runs per engine; the fastest is reported.")
+@click.option("--data-dir", default=os.path.join(root_dir, "data", "benchmark"), show_default=True,
+              help="Directory holding the generated synthetic archives.")
+@click.option("--output", default=None, help="Write the results as JSON to this file.")
+def main(rows, engines, schema_path, repeat, data_dir, output):
+    """
+    Compare CSV parser backends on throughput and peak memory, on Ames and on synthetic files.
+    """
+    if schema_path is not None and not os.path.exists(schema_path):
+        ## Inferring the schema up front so no trial pays for it
+        IngestSchema.infer(IngestCSVData().ingest(AMES_ARCHIVE)).save(schema_path)
+
+    os.makedirs(data_dir, exist_ok=True)
+    paths = [AMES_ARCHIVE] + [make_synthetic(n, data_dir) for n in rows if n > 0]
+
+    results = []
+    for path in paths:
+        file_results = benchmark(path, engines, schema_path=schema_path, repeat=repeat)
+        fastest = max(file_results, key=lambda result: result["mb_per_s"])
+        print(f"Fastest engine for {fastest['file']}: {fastest['engine']}\n")
+        results.extend(file_results)
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import click
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(root_dir)
+
+from benchmarks.ingest_benchmark import AMES_ARCHIVE, make_synthetic
+from src.feature_engineering import FeatureEngineer, LogTransformation, MinMaxScaling, StandardScaling
+from src.feature_store import FrameHandle
+from src.handle_missing_values import FillMissingValues, MissingValueHandler
+from src.ingest_data import IngestCSVData
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+FEATURES = ["SalePrice", "Gr Liv Area", "Lot Frontage", "Lot Area"]
+
+## The benchmarked chain, one entry per pipeline step: (name, function(frame, inplace) -> frame)
+STEPS = [
+    ("fill_mean", lambda df, inplace: MissingValueHandler(FillMissingValues("mean"), inplace).handle_missing_values(df)),
+    ("log", lambda df, inplace: FeatureEngineer(LogTransformation(FEATURES), inplace).apply_feature_engineering(df)),
+    ("standard_scaling", lambda df, inplace: FeatureEngineer(StandardScaling(FEATURES), inplace).apply_feature_engineering(df)),
+    ("minmax_scaling", lambda df, inplace: FeatureEngineer(MinMaxScaling(FEATURES), inplace).apply_feature_engineering(df)),
+    ("cap_outliers", lambda df, inplace: OutlierDetector(ZScoreOutlierDetection(), inplace).handle_outliers(
+        df.select_dtypes(include=[np.number]), method="cap")),
+]
+
+
+def _rss_mb(field: str) -> float:
+    """Current ("VmRSS") or peak ("VmHWM") resident set size of this process in MB (Linux)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError(f"{field} is not reported by /proc/self/status")
+
+
+def _run_step(step_index: int, inplace: bool, in_path: str, out_path: str) -> dict:
+    """Runs one step like the pipeline does: map the input, transform it, write the output"""
+    name, func = STEPS[step_index]
+    ## ru_maxrss survives fork and exec, so it would report the parent's peak; reset this process's own peak instead
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    baseline_rss = _rss_mb("VmRSS")
+    start = time.perf_counter()
+    df = func(FrameHandle.open(in_path).load(), inplace)
+    FrameHandle.write(df, out_path)
+    return {
+        "step": name,
+        "inplace": inplace,
+        "seconds": time.perf_counter() - start,
+        "step_rss_mb": _rss_mb("VmHWM") - baseline_rss,
+    }
+
+
+def benchmark(path: str, work_dir: str, schema_path: str = None) -> list:
+    """
+    Runs the step chain on one file with copying strategies and with in-place strategies.
+
+    Every step runs in a fresh process reading the previous step's Arrow output, so its peak RSS is
+    what that step adds on top of the mapped input, as in a pipeline run.
+
+    Parameters:
+    path (str): The archive to ingest.
+    work_dir (str): Directory receiving the intermediate Arrow files.
+    schema_path (str): Ingest schema applied while parsing. None parses without a schema.
+
+    Returns:
+    list: One result dict per step and mode.
+    """
+    source = os.path.join(work_dir, "source.arrow")
+    handle = FrameHandle.write(IngestCSVData(schema_path=schema_path).ingest(path), source)
+
+    results = []
+    for inplace in (False, True):
+        in_path = source
+        for step_index in range(len(STEPS)):
+            out_path = os.path.join(work_dir, f"step{step_index}_{int(inplace)}.arrow")
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                result = executor.submit(_run_step, step_index, inplace, in_path, out_path).result()
+            result.update(file=os.path.basename(path), rows=len(handle))
+            results.append(result)
+            in_path = out_path
+
+    for name, _ in STEPS:
+        copied, inplace = [result for result in results if result["step"] == name]
+        print(
+            f"{copied['file']:>20} {name:>17} copy {copied['step_rss_mb']:8.1f} MB {copied['seconds']:6.2f} s"
+            f"   inplace {inplace['step_rss_mb']:8.1f} MB {inplace['seconds']:6.2f} s"
+        )
+    for mode in (False, True):
+        print(
+            f"{'':>20} {'peak step RSS':>17} {'inplace' if mode else 'copy':>7} "
+            f"{max(result['step_rss_mb'] for result in results if result['inplace'] == mode):8.1f} MB"
+        )
+    return results
+
+
+@click.command()
+@click.option("--rows", "-r", multiple=True, type=int, default=DEFAULT_ROWS, show_default=True,
+              help="Synthetic file sizes in rows. Pass several times; 0 benchmarks the Ames file only.")
+@click.option("--schema-path", default=None, help="Ingest schema applied while parsing.")
+@click.option("--data-dir", default=os.path.join(root_dir, "data", "benchmark"), show_default=True,
+              help="Directory holding the generated synthetic archives and intermediate step outputs.")
+@click.option("--output", default=None, help="Write the results as JSON to this file.")
+def main(rows, schema_path, data_dir, output):
+    """
+    Compare the peak memory of the preprocessing steps with copying and with in-place strategies.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    paths = [AMES_ARCHIVE] + [make_synthetic(n, data_dir) for n in rows if n > 0]
+
+    results = []
+    for path in paths:
+        results.extend(benchmark(path, data_dir, schema_path=schema_path))
+        print()
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
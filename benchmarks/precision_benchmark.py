@@ -0,0 +1,132 @@
+import json
+import os
+import sys
+import time
+
+import click
+import numpy as np
+from sklearn.metrics import mean_squared_error, r2_score
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(root_dir)
+
+from benchmarks.ingest_benchmark import AMES_ARCHIVE, make_synthetic
+from src.data_splitter import DataSplitter, SimpleTrainTestSplitStrategy
+from src.feature_engineering import FeatureEngineer, LogTransformation, StandardScaling
+from src.handle_missing_values import FillMissingValues, MissingValueHandler
+from src.ingest_data import IngestCSVData
+from src.model_building import LinearRegressionStrategy
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+DEFAULT_ROWS = (1_000_000,)
+PRECISIONS = ("float64", "float32")
+TARGET = "SalePrice"
+LOG_FEATURES = ["SalePrice", "Gr Liv Area"]
+SCALED_FEATURES = ["Gr Liv Area", "Lot Area", "Total Bsmt SF", "Garage Area"]
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB since the last reset (Linux)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmHWM is not reported by /proc/self/status")
+
+
+def run_pipeline(path: str, precision: str, schema_path: str = None) -> dict:
+    """
+    Runs the steps of ml_pipeline in one precision and evaluates the model on the held-out rows.
+
+    Parameters:
+    path (str): The archive to ingest.
+    precision (str): "float64" or "float32".
+    schema_path (str): Ingest schema applied while parsing. None parses without a schema.
+
+    Returns:
+    dict: Timing, peak RSS, test metrics and the test predictions (in the log space of the target).
+    """
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    start = time.perf_counter()
+    df = IngestCSVData(schema_path=schema_path, precision=precision).ingest(path)
+    df = MissingValueHandler(FillMissingValues("mean"), inplace=True).handle_missing_values(df)
+    df = FeatureEngineer(LogTransformation(LOG_FEATURES, precision=precision), inplace=True).apply_feature_engineering(df)
+    df = FeatureEngineer(
+        StandardScaling(SCALED_FEATURES, precision=precision), inplace=True
+    ).apply_feature_engineering(df)
+    df = OutlierDetector(ZScoreOutlierDetection(threshold=3)).handle_outliers(
+        df.select_dtypes(include=[np.number]), method="remove"
+    )
+    numeric_bytes = int(df.memory_usage(index=False).sum())
+    X_train, X_test, y_train, y_test = DataSplitter(SimpleTrainTestSplitStrategy()).split(df, TARGET)
+    model = LinearRegressionStrategy(precision=precision).build_and_train_model(X_train, y_train)
+    predictions = model.predict(X_test).astype(np.float64)
+    seconds = time.perf_counter() - start
+
+    y_test = y_test.to_numpy(dtype=np.float64)
+    return {
+        "precision": precision,
+        "rows": len(df),
+        "seconds": seconds,
+        "peak_rss_mb": _peak_rss_mb(),
+        "numeric_mb": numeric_bytes / 1024**2,
+        "r2": r2_score(y_test, predictions),
+        "rmse": float(np.sqrt(mean_squared_error(y_test, predictions))),
+        "predictions": predictions,
+    }
+
+
+def benchmark(path: str, schema_path: str = None) -> list:
+    """
+    Runs the pipeline on one file in every precision and compares the models with the float64 one.
+
+    Parameters:
+    path (str): The archive to ingest.
+    schema_path (str): Ingest schema applied while parsing. None parses without a schema.
+
+    Returns:
+    list: One result dict per precision.
+    """
+    results = [run_pipeline(path, precision, schema_path) for precision in PRECISIONS]
+    reference = results[0]["predictions"]
+    for result in results:
+        predictions = result.pop("predictions")
+        ## Errors in the target's log space; exp(delta) - 1 is the relative price error
+        result["max_prediction_delta"] = float(np.max(np.abs(predictions - reference)))
+        result["file"] = os.path.basename(path)
+        print(
+            f"{result['file']:>20} {result['precision']:>8} {result['seconds']:6.2f} s "
+            f"{result['peak_rss_mb']:8.1f} MB peak {result['numeric_mb']:8.1f} MB numeric   "
+            f"R² {result['r2']:.6f}  RMSE {result['rmse']:.6f}  max Δ {result['max_prediction_delta']:.2e}"
+        )
+    return results
+
+
+@click.command()
+@click.option("--rows", "-r", multiple=True, type=int, default=DEFAULT_ROWS, show_default=True,
+              help="Synthetic file sizes in rows. Pass several times; 0 benchmarks the Ames file only.")
+@click.option("--schema-path", default=None, help="Ingest schema applied while parsing.")
+@click.option("--data-dir", default=os.path.join(root_dir, "data", "benchmark"), show_default=True,
+              help="Directory holding the generated synthetic archives.")
+@click.option("--output", default=None, help="Write the results as JSON to this file.")
+def main(rows, schema_path, data_dir, output):
+    """
+    Compare the accuracy, speed and peak memory of the pipeline in float64 and in float32.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    paths = [AMES_ARCHIVE] + [make_synthetic(n, data_dir) for n in rows if n > 0]
+
+    results = []
+    for path in paths:
+        results.extend(benchmark(path, schema_path=schema_path))
+        print()
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,33 +21,40 @@ from steps.model_building_step import model_building_step
         name='insightflow',
     ),
 )
-def ml_pipeline():
+def ml_pipeline(precision: str = "float64"):
     '''Define a pipeline
     
     This pipeline is used to train a model on the insightflow dataset.
+
+    Args:
+        precision (str): Floating-point type of the numeric columns from ingestion to model fitting:
+            "float64" or "float32", which halves their memory (see the Ames accuracy deltas in the README).
     '''
 
     ## Data Ingestion
     raw_data = data_ingestion_step(
-        file_path="data/archive.zip"
+        file_path="data/archive.zip", schema_path="data/ames_schema.json", precision=precision
     )
 
     ## Handle Missing Values
-    filled_data = handle_missing_values_step(raw_data)
+    ## Every step loads its own copy of its input, so the steps may transform it in place
+    ## Unchanged inputs reuse the TransformCache results of earlier runs
+    filled_data = handle_missing_values_step(raw_data, inplace=True, transform_cache=True)
 
     ## Feature Engineering
     engineered_data = feature_engineering_step(
-        filled_data, strategy="log", features=['SalePrice', 'Gr Liv Area']
+        filled_data, strategy="log", features=['SalePrice', 'Gr Liv Area'], inplace=True,
+        transform_cache=True, precision=precision,
     )
 
     ## Outlier Detection
-    clean_data = outlier_detection_step(engineered_data, column_name="SalePrice")
+    clean_data = outlier_detection_step(engineered_data, column_name="SalePrice", transform_cache=True)
 
     # Data Splitting Step
     X_train, X_test, y_train, y_test = data_splitter_step(clean_data, target_column="SalePrice")
 
     ## Model Building
-    model = model_building_step(X_train=X_train, y_train=y_train)
+    model = model_building_step(X_train=X_train, y_train=y_train, precision=precision)
 
 # Run the pipeline
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+## Re-iterable stream of DataFrame chunks
+# Each iteration re-reads the source from the start, so strategies that need statistics over the
+# whole dataset can make a fitting pass and then a transforming pass while holding only one chunk
+# in memory at a time.
+class ChunkedData:
+    def __init__(self, chunk_factory: Callable[[], Iterable[pd.DataFrame]]):
+        """
+        Initializes the ChunkedData with a factory producing a fresh chunk iterator.
+
+        Parameters:
+        chunk_factory (Callable): A zero-argument callable returning an iterable of DataFrame chunks.
+        """
+        self._chunk_factory = chunk_factory
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self._chunk_factory())
+
+    def map(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> "ChunkedData":
+        """
+        Lazily applies a function to every chunk.
+
+        Parameters:
+        func (Callable): The function applied to each chunk.
+
+        Returns:
+        ChunkedData: A new chunk stream yielding the transformed chunks.
+        """
+        return ChunkedData(lambda: (func(chunk) for chunk in self))
+
+    def fold(self, new_state: Callable[[], Any], update: Callable[[Any, pd.DataFrame], None], n_jobs: int = 1) -> Any:
+        """
+        Folds every chunk into mergeable state, such as sketches, on n_jobs threads.
+
+        Each thread owns one state object and folds the chunks it is handed into it; the states are
+        merged with state.merge(other) at the end. Chunks are read on the calling thread, and at most
+        n_jobs chunks are held at once, so memory stays bounded by the chunk size.
+
+        Parameters:
+        new_state (Callable): A zero-argument callable returning an empty state.
+        update (Callable): Called as update(state, chunk) to fold a chunk into a state.
+        n_jobs (int): The number of threads. 1 folds every chunk on the calling thread.
+
+        Returns:
+        Any: The merged state.
+        """
+        if n_jobs <= 1:
+            state = new_state()
+            for chunk in self:
+                update(state, chunk)
+            return state
+
+        states = [new_state() for _ in range(n_jobs)]
+        idle = queue.Queue()
+        for state in states:
+            idle.put(state)
+
+        def run(state, chunk: pd.DataFrame):
+            try:
+                update(state, chunk)
+            finally:
+                idle.put(state)
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = []
+            for chunk in self:
+                ## Waiting for an idle state bounds the chunks in flight to n_jobs
+                futures.append(executor.submit(run, idle.get(), chunk))
+            for future in futures:
+                future.result()
+        for state in states[1:]:
+            states[0].merge(state)
+        return states[0]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Concatenates all chunks into a single DataFrame.
+
+        Returns:
+        pd.DataFrame: The fully materialized data, empty when the stream has no chunks (e.g. no row matched a filter).
+        """
+        logging.info("Materializing chunk stream into a single DataFrame.")
+        chunks = list(self)
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
@@ -0,0 +1,128 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.frame_buffers import column_buffer
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+## Below this many values per block, starting a thread costs more than it saves
+MIN_BLOCK_VALUES = 256 * 1024
+
+## Worker threads of executors created with n_jobs=None in the current context; None uses all cores
+_default_n_jobs: ContextVar[Optional[int]] = ContextVar("column_executor_n_jobs", default=None)
+
+
+@contextmanager
+def thread_budget(n_jobs: int) -> Iterator[None]:
+    """
+    Caps the worker threads of executors created with n_jobs=None inside the block.
+
+    The cap only applies to the current thread (context), so threads running side by side can each
+    take a share of the cores without touching the configuration of the strategies they run.
+
+    Parameters:
+    n_jobs (int): The number of worker threads.
+    """
+    token = _default_n_jobs.set(max(n_jobs, 1))
+    try:
+        yield
+    finally:
+        _default_n_jobs.reset(token)
+
+
+## Column-sharded execution of per-column kernels
+# The features are split into contiguous blocks, one per worker, and every block runs its column
+# kernel on a thread of its own. NumPy ufuncs release the GIL, so the blocks scale across cores.
+# Workers only write into the column buffers they were handed or return new arrays; columns are
+# replaced on the calling thread, because pandas does not support concurrent column assignment.
+# Each column is transformed by the same call in any block layout, so the result does not depend
+# on the number of workers.
+class ColumnShardedExecutor:
+    def __init__(self, n_jobs: Optional[int] = None, min_block_values: int = MIN_BLOCK_VALUES):
+        """
+        Initializes the ColumnShardedExecutor.
+
+        Parameters:
+        n_jobs (int): The number of worker threads. None uses the thread_budget() in effect, or all cores
+            without one; -1 uses all cores, 1 runs on the calling thread.
+        min_block_values (int): The smallest number of values (rows times columns) worth a block of its own.
+        """
+        self.n_jobs = n_jobs
+        self.min_block_values = min_block_values
+
+    def blocks(self, n_rows: int, features: list) -> List[list]:
+        """
+        Splits features into contiguous blocks, one per worker.
+
+        Parameters:
+        n_rows (int): The number of rows of every column.
+        features (list): The features to split.
+
+        Returns:
+        list: The blocks of features, in order.
+        """
+        if not features:
+            return []
+        n_jobs = _default_n_jobs.get() if self.n_jobs is None else self.n_jobs
+        n_jobs = (os.cpu_count() or 1) if n_jobs in (None, -1) else max(n_jobs, 1)
+        n_blocks = min(n_jobs, len(features), max(n_rows * len(features) // self.min_block_values, 1))
+        return [
+            [features[i] for i in positions] for positions in np.array_split(np.arange(len(features)), n_blocks)
+        ]
+
+    def map_columns(
+        self,
+        df: pd.DataFrame,
+        features: list,
+        function: Callable[[int, pd.Series, Optional[np.ndarray]], Any],
+    ) -> list:
+        """
+        Calls a column kernel on every feature of df, block by block on the worker threads.
+
+        Parameters:
+        df (pd.DataFrame): The frame holding the features.
+        features (list): The features to process.
+        function (callable): Called as function(index, series, buffer) for every feature, with its
+            position in features, its Series and its writable buffer (None when it has none).
+
+        Returns:
+        list: The results of function, in the order of features.
+        """
+        ## Column lookups touch the frame's caches, so they stay on the calling thread
+        columns = [(i, df[feature], column_buffer(df, feature)) for i, feature in enumerate(features)]
+
+        def run_block(block: list) -> list:
+            return [function(*columns[i]) for i in block]
+
+        blocks = self.blocks(len(df), list(range(len(features))))
+        if len(blocks) <= 1:
+            results = [run_block(block) for block in blocks]
+        else:
+            with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+                results = list(executor.map(run_block, blocks))
+        return [result for block_results in results for result in block_results]
+
+    def transform_columns(
+        self,
+        df: pd.DataFrame,
+        features: list,
+        transform: Callable[[int, pd.Series, Optional[np.ndarray]], Optional[ArrayLike]],
+    ):
+        """
+        Transforms the features of df in place, block by block on the worker threads.
+
+        Parameters:
+        df (pd.DataFrame): The frame to modify.
+        features (list): The features to transform.
+        transform (callable): Called like the function of map_columns(). It either overwrites the
+            buffer and returns None, or returns the new values of the column.
+        """
+        for feature, values in zip(features, self.map_columns(df, features, transform)):
+            if values is not None:
+                df[feature] = values
@@ -0,0 +1,326 @@
+import copy
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.sketches import DistinctCounter, HeavyHitters, QuantileSketch, RunningMoments
+from src.transform_cache import series_checksum
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+## Key under which the statistics travel in DataFrame.attrs
+ATTRS_KEY = "column_stats"
+
+DESCRIBE_ROWS = ["count", "unique", "top", "freq", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+def column_fingerprint(series: pd.Series) -> tuple:
+    """
+    Computes the fingerprint of a column: length, dtype and a checksum of its values.
+
+    Any cast, filter, imputation or edit of a value changes the fingerprint. Typed columns are checksummed
+    straight from their buffers, so checking a column costs about as much as its mean; the reuse only pays
+    off for the statistics that sort or count (quantiles, modes, describe()).
+
+    Parameters:
+    series (pd.Series): The column to fingerprint.
+
+    Returns:
+    tuple: The fingerprint.
+    """
+    return (len(series), str(series.dtype), series_checksum(series))
+
+
+def is_numeric_column(series: pd.Series) -> bool:
+    """Whether moments and quantiles are tracked for a column"""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+## Statistics of a single column, accumulated from one or more chunks
+class ColumnSummary:
+    def __init__(
+        self, numeric: bool, quantile_k: int, top_k_capacity: int, distinct_precision: int, counted: bool = True
+    ):
+        """
+        Initializes the ColumnSummary.
+
+        Parameters:
+        numeric (bool): Whether moments and quantiles are tracked for the column.
+        quantile_k (int): Level size of the quantile sketch.
+        top_k_capacity (int): Number of counters kept for the most frequent values.
+        distinct_precision (int): Register bits of the distinct-count estimator.
+        counted (bool): Whether the most frequent values and the distinct count are tracked.
+        """
+        self.quantile_k = quantile_k
+        self.top_k_capacity = top_k_capacity
+        self.distinct_precision = distinct_precision
+        self.count = 0
+        self.null_count = 0
+        self._set_numeric(numeric)
+        self._set_counted(counted)
+        self.fingerprint = None
+
+    def _set_counted(self, counted: bool):
+        self.top_k = HeavyHitters(self.top_k_capacity) if counted else None
+        self.distinct = DistinctCounter(self.distinct_precision) if counted else None
+
+    def _set_numeric(self, numeric: bool):
+        self.numeric = numeric
+        self.moments = RunningMoments() if numeric else None
+        self.quantiles = QuantileSketch(self.quantile_k) if numeric else None
+
+    def update(self, series: pd.Series):
+        numeric = is_numeric_column(series)
+        if numeric != self.numeric:
+            if self.count > 0 and self.numeric:
+                raise TypeError(
+                    f"Column '{series.name}' mixes numeric and non-numeric values across chunks; "
+                    "parse it with an ingest schema."
+                )
+            if self.count == 0:
+                ## Only missing values so far (e.g. a chunk parsed as all-NaN float): the first values decide
+                self._set_numeric(numeric)
+                if not numeric and self.top_k is None:
+                    self._set_counted(True)
+        null_count = int(series.isna().sum())
+        self.null_count += null_count
+        self.count += len(series) - null_count
+        if self.numeric:
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        if self.top_k is not None:
+            self.top_k.update(series)
+            self.distinct.update(series)
+
+    def merge(self, other: "ColumnSummary"):
+        if other.numeric != self.numeric:
+            if self.count > 0 and other.count > 0:
+                raise TypeError("Cannot merge statistics of a numeric and a non-numeric column.")
+            if self.count == 0:
+                self._set_numeric(other.numeric)
+            else:
+                other = copy.deepcopy(other)
+                other._set_numeric(self.numeric)
+        self.count += other.count
+        self.null_count += other.null_count
+        if self.numeric:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+        if self.top_k is not None and other.top_k is not None:
+            self.top_k.merge(other.top_k)
+            self.distinct.merge(other.distinct)
+        else:
+            ## Counts over only some of the shards would be wrong; none are kept
+            self.top_k = self.distinct = None
+
+    @property
+    def cardinality(self) -> Optional[float]:
+        """The number of distinct values, or None when they are not counted"""
+        if self.top_k is None:
+            return None
+        ## Every distinct value has its own counter until the heavy hitters overflow
+        return len(self.top_k.counts) if self.top_k.is_exact else self.distinct.estimate()
+
+    @property
+    def mode(self):
+        """The most frequent value, or None when values are not counted or the counts are no longer exact"""
+        if self.top_k is None or not self.top_k.is_exact or self.top_k.counts.empty:
+            return None
+        return self.top_k.top(1).index[0]
+
+
+## Single-pass column statistics that travel with the DataFrame
+# Built once at ingestion (or accumulated over chunks and merged), then attached to the frame through
+# DataFrame.attrs. Strategies look them up with ColumnStats.for_frame(), which only returns them when
+# the fingerprints of the requested columns still match, and otherwise fall back to rescanning.
+class ColumnStats:
+    def __init__(
+        self, quantile_k: int = 4096, top_k_capacity: int = 256, distinct_precision: int = 12, count_floats: bool = False
+    ):
+        """
+        Initializes the ColumnStats.
+
+        Parameters:
+        quantile_k (int): Level size of the quantile sketches. Quantiles are exact up to this many values.
+        top_k_capacity (int): Number of counters kept for the most frequent values of each column.
+        distinct_precision (int): Register bits of the distinct-count estimators.
+        count_floats (bool): Also track the most frequent values and distinct counts of float columns.
+            Continuous values are nearly all distinct, so counting them costs most of the pass and
+            their modes and cardinalities are rarely used.
+        """
+        self.quantile_k = quantile_k
+        self.top_k_capacity = top_k_capacity
+        self.distinct_precision = distinct_precision
+        self.count_floats = count_floats
+        self.columns: Dict[str, ColumnSummary] = {}
+        self._attached = False
+
+    def __deepcopy__(self, memo):
+        ## pandas may deep-copy attrs on every operation. Attached statistics are read-only, so copies of
+        ## a frame share them; statistics still being accumulated are copied.
+        if self._attached:
+            return self
+        clone = copy.copy(self)
+        clone.columns = copy.deepcopy(self.columns, memo)
+        return clone
+
+    def _check_writable(self):
+        if self._attached:
+            raise ValueError(
+                "Column statistics attached to a frame are read-only; build new ColumnStats for other data."
+            )
+
+    def update(self, df: pd.DataFrame):
+        """
+        Folds a DataFrame or chunk into the statistics.
+
+        Parameters:
+        df (pd.DataFrame): The data to add.
+        """
+        self._check_writable()
+        for column in df.columns:
+            if column not in self.columns:
+                self.columns[column] = ColumnSummary(
+                    is_numeric_column(df[column]), self.quantile_k, self.top_k_capacity, self.distinct_precision,
+                    counted=self.count_floats or not pd.api.types.is_float_dtype(df[column]),
+                )
+            self.columns[column].update(df[column])
+
+    def merge(self, other: "ColumnStats"):
+        """
+        Merges statistics computed over another shard of the same columns.
+
+        Parameters:
+        other (ColumnStats): The statistics to merge.
+        """
+        self._check_writable()
+        for column, summary in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(summary)
+            else:
+                self.columns[column] = copy.deepcopy(summary)
+
+    def attach(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Records the fingerprints of the frame the statistics describe and attaches them to it.
+
+        From then on the statistics are read-only, so every copy of the frame can share them.
+
+        Parameters:
+        df (pd.DataFrame): The frame the statistics were computed from.
+
+        Returns:
+        pd.DataFrame: The same frame, with the statistics in df.attrs.
+        """
+        self._check_writable()
+        for column, summary in self.columns.items():
+            if column in df.columns:
+                summary.fingerprint = column_fingerprint(df[column])
+        df.attrs[ATTRS_KEY] = self
+        self._attached = True
+        return df
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **kwargs) -> "ColumnStats":
+        """
+        Computes the statistics of a frame in one pass and attaches them to it.
+
+        Parameters:
+        df (pd.DataFrame): The frame to describe.
+        kwargs: Sketch sizes forwarded to the constructor.
+
+        Returns:
+        ColumnStats: The attached statistics.
+        """
+        logging.info("Computing column statistics.")
+        stats = cls(**kwargs)
+        stats.update(df)
+        stats.attach(df)
+        return stats
+
+    @staticmethod
+    def for_frame(df: pd.DataFrame, columns: Optional[List[str]] = None) -> Optional["ColumnStats"]:
+        """
+        Returns the statistics attached to a frame if they are still valid for the given columns.
+
+        Parameters:
+        df (pd.DataFrame): The frame to look up.
+        columns (list): The columns that will be read from the statistics. All columns when None.
+
+        Returns:
+        ColumnStats: The attached statistics, or None when absent or stale.
+        """
+        stats = df.attrs.get(ATTRS_KEY)
+        if not isinstance(stats, ColumnStats):
+            return None
+        for column in df.columns if columns is None else columns:
+            summary = stats.columns.get(column)
+            if summary is None or summary.fingerprint != column_fingerprint(df[column]):
+                logging.info(f"Column statistics are stale for column '{column}'; rescanning.")
+                return None
+        return stats
+
+    def mean(self, columns: List[str]) -> pd.Series:
+        return pd.Series({column: self.columns[column].moments.mean for column in columns}, dtype="float64")
+
+    def std(self, columns: List[str], ddof: int = 1) -> pd.Series:
+        return pd.Series({column: self.columns[column].moments.std(ddof) for column in columns}, dtype="float64")
+
+    def quantile(self, q: float, columns: List[str]) -> pd.Series:
+        return pd.Series(
+            {column: float(self.columns[column].quantiles.quantile(q)) for column in columns}, dtype="float64"
+        )
+
+    def mode(self, columns: List[str]) -> pd.Series:
+        """Exact modes of the given columns. Columns whose counts are no longer exact are left out."""
+        modes = {column: self.columns[column].mode for column in columns}
+        return pd.Series({column: mode for column, mode in modes.items() if mode is not None}, dtype="object")
+
+    def describe(self, df: pd.DataFrame, include=None) -> Optional[pd.DataFrame]:
+        """
+        Builds the equivalent of df.describe(include=include) from the statistics.
+
+        Parameters:
+        df (pd.DataFrame): The frame the statistics are attached to.
+        include: "all", or dtypes passed to df.select_dtypes to pick the columns. Numeric columns when None.
+
+        Returns:
+        pd.DataFrame: The summary, or None when the statistics are stale.
+        """
+        if include == "all":
+            columns = list(df.columns)
+        else:
+            columns = list(df.select_dtypes(include=include or "number").columns)
+        if self.for_frame(df, columns) is not self:
+            return None
+
+        summary = {}
+        for column in columns:
+            column_summary = self.columns[column]
+            if column_summary.numeric:
+                quartiles = column_summary.quantiles.quantile([0.25, 0.5, 0.75])
+                summary[column] = {
+                    "count": column_summary.count,
+                    "mean": column_summary.moments.mean,
+                    "std": column_summary.moments.std(),
+                    "min": column_summary.moments.min,
+                    "25%": quartiles[0],
+                    "50%": quartiles[1],
+                    "75%": quartiles[2],
+                    "max": column_summary.moments.max,
+                }
+            else:
+                top = column_summary.top_k.top(1)
+                summary[column] = {
+                    "count": column_summary.count,
+                    "unique": column_summary.cardinality,
+                    "top": top.index[0] if len(top) else np.nan,
+                    "freq": top.iloc[0] if len(top) else np.nan,
+                }
+        ## Rows in the order DataFrame.describe() prints them
+        rows = [row for row in DESCRIBE_ROWS if any(row in values for values in summary.values())]
+        return pd.DataFrame(summary, index=rows)
@@ -101,7 +101,7 @@ class DataSplitter:
 # Example usage
 if __name__ == "__main__":
     # Example dataframe 
-    df = pd.read_csv('../extracted_data/AmesHousing.csv')
+    df = pd.read_csv('../data/archive.zip')
 
     # Initialize data splitter with a specific strategy
     data_splitter = DataSplitter(SimpleTrainTestSplitStrategy(test_size=0.2, random_state=42))
@@ -1,118 +1,442 @@
+import json
 import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
 
+from src.chunked_data import ChunkedData
+from src.column_executor import ColumnShardedExecutor, thread_budget
+from src.feature_kernels import (
+    AffineKernel,
+    FeatureKernel,
+    HashingKernel,
+    LogKernel,
+    OneHotKernel,
+    TargetEncodingKernel,
+)
+from src.frame_buffers import write_column
+from src.precision import float_dtype
+from src.transform_cache import TransformCache
+
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 ## Abstract Base Class for Feature Engineering Strategy
 #This class defines a common interface for different feature engineering strategies.
 #Subclasses must implement the apply_transformation method.
+#Strategies that learn parameters also implement fit() and transform(), so the parameters learned on
+#the training data can be saved, loaded and reused at inference, and compile() into a NumPy kernel.
 
 class FeatureEngineeringStrategy(ABC):
+    ## Part of the transform cache key: bump it in a class whenever a change alters that class's results
+    cache_version = 1
+
     @abstractmethod
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Abstract method to apply feature engineering transformation to the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Modify df and reuse its column buffers instead of copying it first.
 
         Returns:
         pd.DataFrame: A dataframe with the applied transformations.
         """
         pass
 
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Learns the parameters of the transformation from the DataFrame. Stateless transformations have none.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        FeatureEngineeringStrategy: The fitted strategy itself.
+        """
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Applies the transformation with the parameters learned by fit(), without refitting.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Modify df and reuse its column buffers instead of copying it first.
+
+        Returns:
+        pd.DataFrame: A dataframe with the applied transformations.
+        """
+        return self.apply_transformation(df, inplace=inplace)
+
+    def input_columns(self) -> list:
+        """
+        The columns apply_transformation() reads: the features, plus the target for supervised strategies.
+
+        Returns:
+        list: The column names.
+        """
+        return list(self.features)
+
+    def compile(self) -> FeatureKernel:
+        """
+        Compiles the fitted transformation into a NumPy kernel transforming raw arrays.
+
+        Returns:
+        FeatureKernel: The kernel, taking the strategy's features in order.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be compiled into a kernel.")
+
+    def to_dict(self) -> dict:
+        """
+        The constructor arguments recreating this strategy, including its fitted parameters, as plain JSON values.
+
+        Returns:
+        dict: The arguments, passed back to the constructor by from_dict().
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be serialized.")
+
+    @classmethod
+    def from_dict(cls, params: dict) -> "FeatureEngineeringStrategy":
+        return cls(**params)
+
+    def save(self, path: str):
+        """
+        Saves the strategy and its fitted parameters as JSON.
+
+        Parameters:
+        path (str): The JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(strategy_to_dict(self), f, indent=2)
+        logging.info(f"Saved {type(self).__name__} to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "FeatureEngineeringStrategy":
+        """
+        Loads a strategy saved with save().
+
+        Parameters:
+        path (str): The JSON file to read.
+
+        Returns:
+        FeatureEngineeringStrategy: The fitted strategy.
+        """
+        with open(path) as f:
+            strategy = strategy_from_dict(json.load(f))
+        if not isinstance(strategy, cls):
+            raise ValueError(f"{path} holds a {type(strategy).__name__}, not a {cls.__name__}.")
+        return strategy
+
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Applies the transformation to a stream of DataFrame chunks.
+
+        By default each chunk is transformed independently, which is only correct for
+        row-wise transformations. Strategies that learn parameters from the data override this
+        with a fitting pass followed by a lazy transforming pass.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with the applied transformations.
+        """
+        return chunks.map(self.apply_transformation)
+
+
+## Per-column statistics of the scalers, with StandardScaler's and MinMaxScaler's own arithmetic
+# Every feature is reduced on its own contiguous values, so fitting runs column-sharded and gives
+# the same parameters for any number of threads.
+_EPS = np.finfo(np.float64).eps
+
+
+def _standard_statistics(feature: str, series: pd.Series) -> tuple:
+    """The mean and standard deviation of a feature, 1 for constant features"""
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    count = len(values) - np.count_nonzero(np.isnan(values))
+    total = np.nansum(values)
+    if not np.isfinite(total) and np.isinf(values).any():
+        raise ValueError(f"Feature '{feature}' contains infinity and cannot be scaled.")
+    mean = total / count
+    centered = values - mean
+    correction = np.nansum(centered)
+    np.square(centered, out=centered)
+    var = (np.nansum(centered) - correction**2 / count) / count
+    ## The same constant-feature bound as scikit-learn, so rounding noise does not become a tiny scale
+    constant = var <= count * _EPS * var + (count * mean * _EPS) ** 2
+    return mean, 1.0 if constant else np.sqrt(var)
+
+
+def _minmax_statistics(feature: str, series: pd.Series, feature_range: tuple) -> tuple:
+    """The multiplier and offset mapping a feature's observed range onto feature_range"""
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    data_min, data_max = np.nanmin(values), np.nanmax(values)
+    if np.isinf(data_min) or np.isinf(data_max):
+        raise ValueError(f"Feature '{feature}' contains infinity and cannot be scaled.")
+    data_range = data_max - data_min
+    scale = (feature_range[1] - feature_range[0]) / (data_range if data_range >= 10 * _EPS else 1.0)
+    return scale, feature_range[0] - data_min * scale
+
+
+def _scale_columns(
+    df: pd.DataFrame, kernel: AffineKernel, n_jobs: Optional[int] = None, precision: Optional[str] = None
+):
+    """Scales the kernel's features of df into the precision (float64 by default), in place for writable columns of that type"""
+    dtype = float_dtype(precision) or np.dtype("float64")
+
+    def scale(index: int, series: pd.Series, buffer: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if buffer is not None and buffer.dtype == dtype:
+            kernel.transform_column(index, buffer, out=buffer, dtype=dtype)
+            return None
+        return kernel.transform_column(index, series.to_numpy(dtype=dtype, na_value=np.nan), dtype=dtype)
+
+    ColumnShardedExecutor(n_jobs).transform_columns(df, kernel.features, scale)
+
 
 ## Concrete Strategy for Log Transformation
 #This strategy applies a logarithmic transformation to skewed features to normalize the distribution.
 #LogTransformation method is used to apply a log transformation to the specified features in the DataFrame.
 class LogTransformation(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    ## 2: integer features are transformed in float64, not in the type np.log1p picks (float32 for int16)
+    cache_version = 2
+
+    def __init__(self, features, n_jobs=None, precision=None):
         """
         Initializes the LogTransformation with the specific features to transform.
 
         Parameters:
         features (list): The list of features to apply the log transformation to.
+        n_jobs (int): Threads transforming blocks of features. None uses all cores, 1 runs serially.
+        precision (str): Store the transformed features as "float32" or "float64". None keeps float features
+            in their own type and makes integer features float64.
         """
         self.features = features
+        self.n_jobs = n_jobs
+        self.precision = precision
+        float_dtype(precision)  ## Validates the precision
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Applies a log transformation to the specified features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Transform df itself; float features are overwritten in their own buffers.
 
         Returns:
         pd.DataFrame: The dataframe with log-transformed features.
         """
         logging.info(f"Applying log transformation to features: {self.features}")
-        df_transformed = df.copy()
-        for feature in self.features:
-            df_transformed[feature] = np.log1p(
-                df[feature]
-            )  # log1p handles log(0) by calculating log(1+x)
+        df_transformed = df if inplace else df.copy()
+
+        dtype = float_dtype(self.precision)
+
+        def log1p(index: int, series: pd.Series, buffer: Optional[np.ndarray]) -> Optional[pd.Series]:
+            if buffer is not None and (buffer.dtype == dtype if dtype is not None else buffer.dtype.kind == "f"):
+                np.log1p(buffer, out=buffer)
+                return None
+            ## Integer features, and features of another precision, need a new column. Without a precision,
+            ## float features keep their type and integers become float64 (np.log1p would pick float32 for int16)
+            target = dtype
+            if target is None:
+                own = getattr(series.dtype, "numpy_dtype", series.dtype)
+                target = own if pd.api.types.is_float_dtype(own) else np.dtype("float64")
+            return np.log1p(series.to_numpy(dtype=target, na_value=np.nan))  # log1p handles log(0) as log(1+x)
+
+        ColumnShardedExecutor(self.n_jobs).transform_columns(df_transformed, self.features, log1p)
         logging.info("Log transformation completed.")
         return df_transformed
 
+    def compile(self) -> LogKernel:
+        return LogKernel(self.features)
+
+    def to_dict(self) -> dict:
+        return {"features": list(self.features), "n_jobs": self.n_jobs, "precision": self.precision}
+
 
 ## Concrete Strategy for Standard Scaling
 #This strategy applies standard scaling to features, transforming them to have a mean of 0 and a standard deviation of 1.
 #StandardScaler method is used to standardize features by removing the mean and scaling to unit variance.
 
 class StandardScaling(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, mean=None, scale=None, n_jobs=None, precision=None):
         """
         Initializes the StandardScaling with the specific features to scale.
 
         Parameters:
         features (list): The list of features to apply the standard scaling to.
+        mean (list): Means learned by an earlier fit, one per feature. Default is None.
+        scale (list): Standard deviations learned by an earlier fit, one per feature. Default is None.
+        n_jobs (int): Threads scaling blocks of features. None uses all cores, 1 runs serially.
+        precision (str): Scale and store the features as "float32" or "float64" (the default when None).
+            The statistics are always accumulated in float64.
         """
         self.features = features
+        self.n_jobs = n_jobs
+        self.precision = precision
+        float_dtype(precision)  ## Validates the precision
         self.scaler = StandardScaler()
+        self.mean_ = None if mean is None else np.asarray(mean, dtype="float64")
+        self.scale_ = None if scale is None else np.asarray(scale, dtype="float64")
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame) -> "StandardScaling":
+        """
+        Learns the mean and standard deviation of every feature.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        StandardScaling: The fitted strategy itself.
+        """
+        statistics = ColumnShardedExecutor(self.n_jobs).map_columns(
+            df, self.features, lambda i, series, buffer: _standard_statistics(self.features[i], series)
+        )
+        self.mean_, self.scale_ = np.array(statistics, dtype="float64").reshape(-1, 2).T
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Scales the features with the mean and standard deviation learned by fit().
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Transform df itself; features already in the output precision are overwritten in their own buffers.
+
+        Returns:
+        pd.DataFrame: The dataframe with scaled features.
+        """
+        kernel = self.compile()
+        df_transformed = df if inplace else df.copy()
+        _scale_columns(df_transformed, kernel, self.n_jobs, self.precision)
+        return df_transformed
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Applies standard scaling to the specified features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Transform df itself; features already in the output precision are overwritten in their own buffers.
 
         Returns:
         pd.DataFrame: The dataframe with scaled features.
         """
         logging.info(f"Applying standard scaling to features: {self.features}")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed = self.fit(df).transform(df, inplace=inplace)
         logging.info("Standard scaling completed.")
         return df_transformed
 
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Fits the scaler incrementally over all chunks, then scales each chunk lazily.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with scaled features.
+        """
+        logging.info(f"Fitting standard scaling over chunks for features: {self.features}")
+        for chunk in chunks:
+            self.scaler.partial_fit(chunk[self.features])
+        self.mean_, self.scale_ = self.scaler.mean_, self.scaler.scale_
+        return chunks.map(self.transform)
+
+    def compile(self) -> AffineKernel:
+        """
+        Compiles the fitted scaling into x * (1 / std) - mean / std per feature.
+
+        Returns:
+        AffineKernel: The scaling kernel.
+        """
+        if self.mean_ is None:
+            raise ValueError("StandardScaling must be fitted before it is compiled or applied with transform().")
+        return AffineKernel(self.features, 1.0 / self.scale_, -self.mean_ / self.scale_)
+
+    def to_dict(self) -> dict:
+        return {
+            "features": list(self.features),
+            "mean": None if self.mean_ is None else self.mean_.tolist(),
+            "scale": None if self.scale_ is None else self.scale_.tolist(),
+            "n_jobs": self.n_jobs,
+            "precision": self.precision,
+        }
+
 
 ##Concrete Strategy for Min-Max Scaling
 #This strategy applies Min-Max scaling to features, scaling them to a specified range (default is 0 to 1).
 #MinMaxScaler method is used to scale the features to a specified range.
 class MinMaxScaling(FeatureEngineeringStrategy):
-    def __init__(self, features, feature_range=(0, 1)):
+    def __init__(self, features, feature_range=(0, 1), scale=None, offset=None, n_jobs=None, precision=None):
         """
         Initializes the MinMaxScaling with the specific features to scale and the target range.
 
         Parameters:
         features (list): The list of features to apply the Min-Max scaling to.
         feature_range (tuple): The target range for scaling, default is (0, 1).
+        scale (list): Multipliers learned by an earlier fit, one per feature. Default is None.
+        offset (list): Offsets learned by an earlier fit, added after scaling, one per feature. Default is None.
+        n_jobs (int): Threads scaling blocks of features. None uses all cores, 1 runs serially.
+        precision (str): Scale and store the features as "float32" or "float64" (the default when None).
         """
         self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
+        self.n_jobs = n_jobs
+        self.precision = precision
+        float_dtype(precision)  ## Validates the precision
+        self.scaler = MinMaxScaler(feature_range=tuple(feature_range))
+        self.scale_ = None if scale is None else np.asarray(scale, dtype="float64")
+        self.offset_ = None if offset is None else np.asarray(offset, dtype="float64")
+
+    def fit(self, df: pd.DataFrame) -> "MinMaxScaling":
+        """
+        Learns the minimum and maximum of every feature.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        MinMaxScaling: The fitted strategy itself.
+        """
+        feature_range = self.scaler.feature_range
+        if feature_range[0] >= feature_range[1]:
+            raise ValueError(f"Minimum of feature_range {feature_range} must be smaller than its maximum.")
+        statistics = ColumnShardedExecutor(self.n_jobs).map_columns(
+            df, self.features, lambda i, series, buffer: _minmax_statistics(self.features[i], series, feature_range)
+        )
+        self.scale_, self.offset_ = np.array(statistics, dtype="float64").reshape(-1, 2).T
+        return self
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Scales the features with the minimum and maximum learned by fit().
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Transform df itself; features already in the output precision are overwritten in their own buffers.
+
+        Returns:
+        pd.DataFrame: The dataframe with Min-Max scaled features.
+        """
+        kernel = self.compile()
+        df_transformed = df if inplace else df.copy()
+        _scale_columns(df_transformed, kernel, self.n_jobs, self.precision)
+        return df_transformed
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Applies Min-Max scaling to the specified features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Transform df itself; features already in the output precision are overwritten in their own buffers.
 
         Returns:
         pd.DataFrame: The dataframe with Min-Max scaled features.
@@ -120,58 +444,795 @@ class MinMaxScaling(FeatureEngineeringStrategy):
         logging.info(
             f"Applying Min-Max scaling to features: {self.features} with range {self.scaler.feature_range}"
         )
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        df_transformed = self.fit(df).transform(df, inplace=inplace)
         logging.info("Min-Max scaling completed.")
         return df_transformed
 
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Fits the scaler incrementally over all chunks, then scales each chunk lazily.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with scaled features.
+        """
+        logging.info(f"Fitting Min-Max scaling over chunks for features: {self.features}")
+        for chunk in chunks:
+            self.scaler.partial_fit(chunk[self.features])
+        self.scale_, self.offset_ = self.scaler.scale_, self.scaler.min_
+        return chunks.map(self.transform)
+
+    def compile(self) -> AffineKernel:
+        """
+        Compiles the fitted scaling into x * scale + offset per feature, the same arithmetic as MinMaxScaler.
+
+        Returns:
+        AffineKernel: The scaling kernel.
+        """
+        if self.scale_ is None:
+            raise ValueError("MinMaxScaling must be fitted before it is compiled or applied with transform().")
+        return AffineKernel(self.features, self.scale_, self.offset_)
+
+    def to_dict(self) -> dict:
+        return {
+            "features": list(self.features),
+            "feature_range": list(self.scaler.feature_range),
+            "scale": None if self.scale_ is None else self.scale_.tolist(),
+            "offset": None if self.offset_ is None else self.offset_.tolist(),
+            "n_jobs": self.n_jobs,
+            "precision": self.precision,
+        }
+
+def _replace_features(df: pd.DataFrame, features: list, encoded_df: pd.DataFrame, inplace: bool) -> pd.DataFrame:
+    """Drops the encoded features and appends their encoding, with a fresh RangeIndex"""
+    if inplace:
+        ## Deleting columns splits the blocks into views instead of copying the rest of the frame
+        df_transformed = df
+        for feature in features:
+            del df_transformed[feature]
+    else:
+        df_transformed = df.drop(columns=features)
+    df_transformed.index = pd.RangeIndex(len(df_transformed))
+    return pd.concat([df_transformed, encoded_df], axis=1, copy=False)
+
+
+def _factorize(series: pd.Series) -> tuple:
+    """Codes and distinct values of a column; missing values are one of the distinct values (NaN)"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return codes, np.asarray(uniques, dtype=object)
+
+
 ## Concrete Strategy for One-Hot Encoding
 
 # This strategy applies one-hot encoding to categorical features, creating binary columns for each category.
 #OneHotEncoding method is used to convert categorical features into binary vectors.
+#The learned categories compile into a lookup table (OneHotKernel); categorical columns are looked up
+#once per category and expanded through their codes.
+#With sparse=True the indicators become sparse-backed columns storing only their ones, which keeps wide
+#encodings (Neighborhood, Exterior 1st, ...) small all the way to model training.
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, categories=None, sparse=False):
         """
         Initializes the OneHotEncoding with the specific features to encode.
 
         Parameters:
         features (list): The list of categorical features to apply the one-hot encoding to.
+        categories (list): Categories learned by an earlier fit, one list per feature. Default is None.
+        sparse (bool): Produce sparse-backed indicator columns (Sparse[float64, 0]) instead of dense ones.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.sparse = sparse
+        ## Only used to learn the categories; the indicators are built by the compiled kernel
+        self.encoder = OneHotEncoder(drop="first")
+        self.categories_ = None if categories is None else [list(values) for values in categories]
+
+    def fit(self, df: pd.DataFrame) -> "OneHotEncoding":
+        """
+        Learns the categories of every feature.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        OneHotEncoding: The fitted strategy itself.
+        """
+        self.encoder.fit(df[self.features])
+        self._set_categories()
+        return self
+
+    def _set_categories(self):
+        self.categories_ = [
+            [value.item() if isinstance(value, np.generic) else value for value in values]
+            for values in self.encoder.categories_
+        ]
+
+    def _encode(self, df: pd.DataFrame, index: pd.Index = None) -> pd.DataFrame:
+        """The indicator columns of df's features, built by the compiled lookup table"""
+        kernel = self.compile()
+        indices = []
+        for i, feature in enumerate(self.features):
+            series = df[feature]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                ## Only the categories present are looked up; rows take their column through the codes
+                codes = series.cat.codes.to_numpy()
+                categories = np.asarray(series.cat.categories, dtype=object)
+                used = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+                lookup = np.full(len(categories) + 1, -1)
+                lookup[:-1][used] = kernel.column_indices(i, categories[used])
+                if (codes < 0).any():
+                    lookup[-1] = kernel.column_indices(i, np.array([np.nan], dtype=object))[0]
+                indices.append(lookup[codes])
+            else:
+                values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.to_numpy(
+                    dtype=object, na_value=np.nan
+                )
+                indices.append(kernel.column_indices(i, values))
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(
+                kernel.indicators(indices, sparse=True), index=index, columns=kernel.feature_names_out
+            )
+        return pd.DataFrame(kernel.indicators(indices), columns=kernel.feature_names_out, index=index)
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Encodes the features with the categories learned by fit().
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Remove the encoded features from df and reuse its remaining columns without copying them.
+
+        Returns:
+        pd.DataFrame: The dataframe with one-hot encoded features.
+        """
+        return _replace_features(df, self.features, self._encode(df), inplace)
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Applies one-hot encoding to the specified categorical features in the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Remove the encoded features from df and reuse its remaining columns without copying them.
 
         Returns:
         pd.DataFrame: The dataframe with one-hot encoded features.
         """
         logging.info(f"Applying one-hot encoding to features: {self.features}")
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features),
-        )
-        df_transformed = df_transformed.drop(columns=self.features).reset_index(drop=True)
-        df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
+        df_transformed = self.fit(df).transform(df, inplace=inplace)
         logging.info("One-hot encoding completed.")
         return df_transformed
 
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Collects the categories of every feature over all chunks, then encodes each chunk lazily
+        so that all chunks share the same set of output columns.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with one-hot encoded features.
+        """
+        logging.info(f"Collecting categories over chunks for features: {self.features}")
+        categories = {}
+        for chunk in chunks:
+            for feature in self.features:
+                seen = pd.Series(chunk[feature].unique())
+                if feature in categories:
+                    seen = pd.Series(pd.concat([categories[feature], seen]).unique())
+                categories[feature] = seen
+
+        ## Fit on a small frame holding every category of every feature
+        n_rows = max(len(values) for values in categories.values())
+        self.encoder.fit(
+            pd.DataFrame({feature: np.resize(values.to_numpy(), n_rows) for feature, values in categories.items()})
+        )
+        self._set_categories()
+        return chunks.map(self._transform_chunk)
+
+    def _transform_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        encoded_chunk = self._encode(chunk, index=chunk.index)
+        return pd.concat([chunk.drop(columns=self.features), encoded_chunk], axis=1)
+
+    def compile(self) -> OneHotKernel:
+        """
+        Compiles the learned categories into a category -> output column lookup table per feature.
+
+        Returns:
+        OneHotKernel: The encoding kernel.
+        """
+        if self.categories_ is None:
+            raise ValueError("OneHotEncoding must be fitted before it is compiled or applied with transform().")
+        return OneHotKernel(self.features, self.categories_)
+
+    def to_dict(self) -> dict:
+        return {"features": list(self.features), "categories": self.categories_, "sparse": self.sparse}
+
+
+## Concrete Strategy for Feature Hashing
+# This strategy hashes "feature=value" tokens of categorical features into a fixed number of columns.
+# Nothing is learned and no vocabulary is kept, so the width stays n_features however many categories
+# (ZIP codes, street names, ...) the data holds; only each batch's distinct values are hashed.
+class FeatureHashing(FeatureEngineeringStrategy):
+    def __init__(self, features, n_features=64, alternate_sign=True, prefix=None, sparse=False):
+        """
+        Initializes the FeatureHashing with the specific features to hash.
+
+        Parameters:
+        features (list): The list of categorical features to hash.
+        n_features (int): The number of output columns, shared by all features. Default is 64.
+        alternate_sign (bool): Sign every entry by its hash so that collisions tend to cancel out. Default is True.
+        prefix (str): The output column prefix. The features joined by "_" when None.
+        sparse (bool): Produce sparse-backed output columns (Sparse[float64, 0]) instead of dense ones.
+        """
+        self.features = features
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+        self.prefix = prefix
+        self.sparse = sparse
+
+    def _hash(self, df: pd.DataFrame, index: pd.Index = None) -> pd.DataFrame:
+        """The hashed columns of df's features"""
+        kernel = self.compile()
+        indices, signs = [], []
+        for i, feature in enumerate(self.features):
+            codes, uniques = _factorize(df[feature])
+            buckets, value_signs = kernel.hash_values(i, uniques)
+            indices.append(buckets[codes])
+            signs.append(value_signs[codes])
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(
+                kernel.hashed(indices, signs, sparse=True), index=index, columns=kernel.feature_names_out
+            )
+        return pd.DataFrame(kernel.hashed(indices, signs), columns=kernel.feature_names_out, index=index)
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Replaces the specified features with their hashed columns.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Remove the hashed features from df and reuse its remaining columns without copying them.
+
+        Returns:
+        pd.DataFrame: The dataframe with hashed features.
+        """
+        return _replace_features(df, self.features, self._hash(df), inplace)
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Applies feature hashing to the specified categorical features in the DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Remove the hashed features from df and reuse its remaining columns without copying them.
+
+        Returns:
+        pd.DataFrame: The dataframe with hashed features.
+        """
+        logging.info(f"Applying feature hashing to features: {self.features} with {self.n_features} columns")
+        df_transformed = self.transform(df, inplace=inplace)
+        logging.info("Feature hashing completed.")
+        return df_transformed
+
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Hashes each chunk lazily; the chunks keep their index.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with hashed features.
+        """
+        return chunks.map(self._transform_chunk)
+
+    def _transform_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        return pd.concat([chunk.drop(columns=self.features), self._hash(chunk, index=chunk.index)], axis=1)
+
+    def compile(self) -> HashingKernel:
+        return HashingKernel(self.features, self.n_features, alternate_sign=self.alternate_sign, prefix=self.prefix)
+
+    def to_dict(self) -> dict:
+        return {
+            "features": list(self.features),
+            "n_features": self.n_features,
+            "alternate_sign": self.alternate_sign,
+            "prefix": self.prefix,
+            "sparse": self.sparse,
+        }
+
+
+def _smoothed_mean(sums: np.ndarray, counts: np.ndarray, prior, smoothing: float) -> np.ndarray:
+    """(sums + smoothing * prior) / (counts + smoothing), or the prior where there is nothing to average"""
+    prior = np.broadcast_to(prior, np.broadcast(sums, prior).shape)
+    denominator = counts + smoothing
+    ## Without smoothing, a category with no rows (in the other folds) would be 0 / 0
+    return np.divide(
+        sums + smoothing * prior, denominator, out=np.array(prior, dtype="float64"), where=denominator > 0
+    )
+
+
+## Per-category target statistics for target encoding
+# Counts and sums of the target per category and fold, grown as new categories appear, so the same
+# accumulator serves one frame or a stream of chunks.
+class _TargetStatistics:
+    def __init__(self, n_folds: int):
+        self.n_folds = n_folds
+        self.categories = pd.Index([], dtype=object)
+        self.counts = np.zeros((0, n_folds))
+        self.sums = np.zeros((0, n_folds))
+
+    def ids(self, series: pd.Series) -> np.ndarray:
+        """The category id of every row, -1 for categories not seen by update()"""
+        codes, uniques = _factorize(series)
+        return self.categories.get_indexer(uniques)[codes]
+
+    def update(self, series: pd.Series, y: np.ndarray, folds: np.ndarray):
+        codes, uniques = _factorize(series)
+        ids = self.categories.get_indexer(uniques)
+        new = ids < 0
+        if new.any():
+            ids[new] = len(self.categories) + np.arange(new.sum())
+            self.categories = self.categories.append(pd.Index(uniques[new], dtype=object))
+            padding = np.zeros((new.sum(), self.n_folds))
+            self.counts, self.sums = np.vstack([self.counts, padding]), np.vstack([self.sums, padding])
+        ## Rows without a target count for no category
+        observed = ~np.isnan(y)
+        cells = ids[codes][observed] * self.n_folds + folds[observed]
+        self.counts += np.bincount(cells, minlength=self.counts.size).reshape(self.counts.shape)
+        self.sums += np.bincount(cells, weights=y[observed], minlength=self.sums.size).reshape(self.sums.shape)
+
+    def encodings(self, smoothing: float) -> tuple:
+        """Smoothed target mean of every category over all folds, and the prior (the overall target mean)"""
+        counts, sums = self.counts.sum(axis=1), self.sums.sum(axis=1)
+        prior = sums.sum() / counts.sum()
+        return _smoothed_mean(sums, counts, prior, smoothing), prior
+
+    def out_of_fold(self, smoothing: float) -> np.ndarray:
+        """Smoothed target mean of every category (rows) computed without each fold (columns)"""
+        fold_counts, fold_sums = self.counts.sum(axis=0), self.sums.sum(axis=0)
+        priors = (fold_sums.sum() - fold_sums) / (fold_counts.sum() - fold_counts)
+        other_counts = self.counts.sum(axis=1, keepdims=True) - self.counts
+        other_sums = self.sums.sum(axis=1, keepdims=True) - self.sums
+        return _smoothed_mean(other_sums, other_counts, priors, smoothing)
+
+
+## Concrete Strategy for Target Encoding
+# This strategy replaces every categorical feature by one float column: the smoothed mean of the target
+# over the rows of the same category, (sum + smoothing * prior) / (count + smoothing). The width never
+# grows with the number of categories. To keep the target from leaking into the training rows,
+# apply_transformation() encodes every row with the statistics of the other folds only (out-of-fold);
+# the encodings kept for transform() on new data use all rows. Folds are derived from the row labels,
+# so a chunk stream with the same index gets the same folds as the whole frame.
+class TargetEncoding(FeatureEngineeringStrategy):
+    ## 2: categories with nothing to average get the prior instead of NaN
+    cache_version = 2
+
+    def __init__(self, features, target, n_folds=5, smoothing=10.0, random_state=0,
+                 categories=None, values=None, prior=None):
+        """
+        Initializes the TargetEncoding with the specific features to encode and the target to encode them with.
+
+        Parameters:
+        features (list): The list of categorical features to encode.
+        target (str): The target column, needed to fit but not to transform.
+        n_folds (int): The number of folds of the out-of-fold encoding. Default is 5.
+        smoothing (float): The weight of the prior in every category's mean, in rows. Default is 10.0.
+        random_state (int): Seed of the fold assignment. Default is 0.
+        categories (list): Categories learned by an earlier fit, one list per feature. Default is None.
+        values (list): Encodings learned by an earlier fit, one list per feature. Default is None.
+        prior (float): The overall target mean learned by an earlier fit, used for unknown categories. Default is None.
+        """
+        if n_folds < 2:
+            raise ValueError("TargetEncoding needs at least 2 folds.")
+        self.features = features
+        self.target = target
+        self.n_folds = n_folds
+        self.smoothing = smoothing
+        self.random_state = random_state
+        self.categories_ = categories
+        self.values_ = values
+        self.prior_ = prior
+
+    def input_columns(self) -> list:
+        return list(self.features) + [self.target]
+
+    def _folds(self, index: pd.Index) -> np.ndarray:
+        """The fold of every row, from a multiplicative hash of its integer label (its position otherwise)"""
+        keys = index.to_numpy() if index.dtype.kind in "iu" else np.arange(len(index))
+        mixed = (keys.astype("uint64") * np.uint64(0x9E3779B97F4A7C15) + np.uint64(self.random_state)) >> np.uint64(32)
+        return (mixed % np.uint64(self.n_folds)).astype(np.int64)
+
+    def _collect(self, frames) -> list:
+        """Target statistics of every feature over the frames"""
+        statistics = [_TargetStatistics(self.n_folds) for _ in self.features]
+        for frame in frames:
+            y = frame[self.target].to_numpy(dtype="float64", na_value=np.nan)
+            folds = self._folds(frame.index)
+            for feature, feature_statistics in zip(self.features, statistics):
+                feature_statistics.update(frame[feature], y, folds)
+        self.categories_, self.values_ = [], []
+        for feature_statistics in statistics:
+            values, self.prior_ = feature_statistics.encodings(self.smoothing)
+            self.categories_.append(
+                [value.item() if isinstance(value, np.generic) else value for value in feature_statistics.categories]
+            )
+            self.values_.append(values.tolist())
+        return statistics
+
+    def _encode_out_of_fold(self, df: pd.DataFrame, statistics: list, inplace: bool) -> pd.DataFrame:
+        df_transformed = df if inplace else df.copy()
+        folds = self._folds(df.index)
+        for feature, feature_statistics in zip(self.features, statistics):
+            df_transformed[feature] = feature_statistics.out_of_fold(self.smoothing)[feature_statistics.ids(df[feature]), folds]
+        return df_transformed
+
+    def fit(self, df: pd.DataFrame) -> "TargetEncoding":
+        """
+        Learns the smoothed target mean of every category over all rows.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from, including the target column.
+
+        Returns:
+        TargetEncoding: The fitted strategy itself.
+        """
+        self._collect([df])
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Replaces the specified features with the encodings learned by fit(); unknown categories get the prior.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform. The target is not needed.
+        inplace (bool): Replace the features in df itself instead of a copy.
+
+        Returns:
+        pd.DataFrame: The dataframe with target-encoded features.
+        """
+        kernel = self.compile()
+        df_transformed = df if inplace else df.copy()
+        for i, feature in enumerate(self.features):
+            codes, uniques = _factorize(df_transformed[feature])
+            df_transformed[feature] = kernel.encode(i, uniques)[codes]
+        return df_transformed
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Fits the encodings and replaces the specified features with out-of-fold encodings.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform, including the target column.
+        inplace (bool): Replace the features in df itself instead of a copy.
+
+        Returns:
+        pd.DataFrame: The dataframe with target-encoded features.
+        """
+        logging.info(f"Applying {self.n_folds}-fold target encoding with target '{self.target}' to features: {self.features}")
+        df_transformed = self._encode_out_of_fold(df, self._collect([df]), inplace)
+        logging.info("Target encoding completed.")
+        return df_transformed
+
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Collects the target statistics over all chunks, then encodes each chunk out-of-fold lazily.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform, including the target column.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with target-encoded features.
+        """
+        logging.info(f"Collecting target statistics over chunks for features: {self.features}")
+        statistics = self._collect(chunks)
+        return chunks.map(lambda chunk: self._encode_out_of_fold(chunk, statistics, inplace=False))
+
+    def compile(self) -> TargetEncodingKernel:
+        """
+        Compiles the learned encodings into a category -> value lookup table per feature.
+
+        Returns:
+        TargetEncodingKernel: The encoding kernel.
+        """
+        if self.categories_ is None:
+            raise ValueError("TargetEncoding must be fitted before it is compiled or applied with transform().")
+        return TargetEncodingKernel(self.features, self.categories_, self.values_, self.prior_)
+
+    def to_dict(self) -> dict:
+        return {
+            "features": list(self.features),
+            "target": self.target,
+            "n_folds": self.n_folds,
+            "smoothing": self.smoothing,
+            "random_state": self.random_state,
+            "categories": self.categories_,
+            "values": self.values_,
+            "prior": self.prior_,
+        }
+
+
+## Registry of the strategies a feature engineering spec can name
+STRATEGIES = {
+    "log": LogTransformation,
+    "standard_scaling": StandardScaling,
+    "minmax_scaling": MinMaxScaling,
+    "onehot_encoding": OneHotEncoding,
+    "feature_hashing": FeatureHashing,
+    "target_encoding": TargetEncoding,
+}
+
+
+def make_strategy(name: str, features: list, **params) -> FeatureEngineeringStrategy:
+    """
+    Creates a feature engineering strategy from its registered name.
+
+    Parameters:
+    name (str): The strategy name, one of the keys of STRATEGIES.
+    features (list): The features the strategy transforms.
+    **params: Further arguments of the strategy, e.g. feature_range for "minmax_scaling".
+
+    Returns:
+    FeatureEngineeringStrategy: The configured strategy.
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unsupported feature engineering strategy: {name}")
+    return STRATEGIES[name](features, **params)
+
+
+## Composite Strategy running several strategies in one pass
+# Each group is an ordered list of strategies over a set of columns. Groups sharing a column depend on
+# each other and are merged into one stage that keeps their order; the stages are independent. Every
+# stage reads its columns once into a private frame, runs its strategies in place on it, and the results
+# are written back into a single output frame, so the whole spec costs at most one copy of the input
+# instead of one per strategy. The stages run concurrently on a thread pool.
+class FeatureEngineeringPipeline(FeatureEngineeringStrategy):
+    def __init__(self, groups: List[List[FeatureEngineeringStrategy]], n_jobs: Optional[int] = None):
+        """
+        Initializes the FeatureEngineeringPipeline with ordered strategies per column group.
+
+        Parameters:
+        groups (list): One list of strategies per column group, applied in order. A group covers the
+            features of its strategies.
+        n_jobs (int): Threads running independent groups. None uses one per group, up to the CPU count.
+        """
+        self.groups = [list(strategies) for strategies in groups]
+        self.n_jobs = n_jobs
+
+    @classmethod
+    def from_spec(cls, spec: List[dict], n_jobs: Optional[int] = None) -> "FeatureEngineeringPipeline":
+        """
+        Builds the pipeline from a serializable spec, e.g.
+        [{"features": ["SalePrice", "Gr Liv Area"], "strategies": ["log", "standard_scaling"]},
+         {"features": ["Neighborhood"], "strategies": ["onehot_encoding"]}].
+
+        A strategy is either its name or a dict with a "name" key and further arguments of the strategy,
+        e.g. {"name": "minmax_scaling", "feature_range": [0, 1]}.
+
+        Parameters:
+        spec (list): One dict per column group with its "features" and ordered "strategies".
+        n_jobs (int): Threads running independent groups.
+
+        Returns:
+        FeatureEngineeringPipeline: The configured pipeline.
+        """
+        groups = []
+        for group in spec:
+            strategies = []
+            for strategy in group["strategies"]:
+                params = {"name": strategy} if isinstance(strategy, str) else dict(strategy)
+                strategies.append(make_strategy(params.pop("name"), list(group["features"]), **params))
+            groups.append(strategies)
+        return cls(groups, n_jobs=n_jobs)
+
+    def plan(self, fitting: bool = True) -> List[tuple]:
+        """
+        Merges the groups sharing columns into stages that can run independently of each other.
+
+        Parameters:
+        fitting (bool): Plan for fitting, where supervised strategies also read the target column.
+
+        Returns:
+        list: One (columns, strategies) tuple per stage, with the strategies in spec order.
+        """
+        stages = []
+        for strategies in self.groups:
+            columns = list(dict.fromkeys(
+                column for strategy in strategies
+                for column in (strategy.input_columns() if fitting else strategy.features)
+            ))
+            dependent = [i for i, (stage_columns, _) in enumerate(stages) if set(stage_columns) & set(columns)]
+            if not dependent:
+                stages.append((columns, strategies))
+                continue
+            ## The merged stage takes the place of the first one it depends on
+            merged_columns = [column for i in dependent for column in stages[i][0]] + columns
+            merged_strategies = [strategy for i in dependent for strategy in stages[i][1]] + strategies
+            stages[dependent[0]] = (list(dict.fromkeys(merged_columns)), merged_strategies)
+            for i in reversed(dependent[1:]):
+                del stages[i]
+        return stages
+
+    @staticmethod
+    def _run_stage(df: pd.DataFrame, columns: list, strategies: list, refit: bool, threads: int) -> pd.DataFrame:
+        ## Selecting copies the stage's columns only; the shallow copy drops pandas' slice marker so the
+        ## strategies may write into it without SettingWithCopyWarning
+        stage_df = df[columns].copy(deep=False)
+        ## Strategies left on all cores get the stage's share instead, so concurrent stages do not
+        ## oversubscribe the CPU. The budget is local to this thread; the strategies are not modified.
+        with thread_budget(threads):
+            for strategy in strategies:
+                if refit:
+                    stage_df = strategy.apply_transformation(stage_df, inplace=True)
+                else:
+                    stage_df = strategy.transform(stage_df, inplace=True)
+        return stage_df
+
+    def _run_stages(self, df: pd.DataFrame, refit: bool) -> tuple:
+        """Runs every stage on its own columns of df, concurrently; returns the stages and their frames"""
+        stages = self.plan(fitting=refit)
+        logging.info(f"Applying {len(stages)} independent feature engineering stages.")
+        cores = os.cpu_count() or 1
+        n_jobs = max(self.n_jobs or min(len(stages), cores), 1)
+        ## The cores are split between the stages running at the same time
+        threads = max(cores // max(min(n_jobs, len(stages)), 1), 1)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(lambda stage: self._run_stage(df, *stage, refit, threads), stages))
+        return stages, results
+
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringPipeline":
+        """
+        Fits every strategy, each on the output of the strategies before it in its group.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        FeatureEngineeringPipeline: The fitted pipeline itself.
+        """
+        self._run_stages(df, refit=True)
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Applies every group's fitted strategies without refitting them.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Write the results into df itself instead of a single copy of it.
+
+        Returns:
+        pd.DataFrame: The dataframe with all transformations applied.
+        """
+        return self._assemble(df, *self._run_stages(df, refit=False), inplace=inplace)
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Fits and applies every group's strategies, running independent groups concurrently.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+        inplace (bool): Write the results into df itself instead of a single copy of it.
+
+        Returns:
+        pd.DataFrame: The dataframe with all transformations applied.
+        """
+        return self._assemble(df, *self._run_stages(df, refit=True), inplace=inplace)
+
+    @staticmethod
+    def _assemble(df: pd.DataFrame, stages: list, results: list, inplace: bool) -> pd.DataFrame:
+        """Writes the stage frames back into df or a single copy of it"""
+        df_transformed = df if inplace else df.copy()
+        added, reset_index = [], False
+        for columns, _ in stages:
+            stage_df = results.pop(0)
+            reset_index |= not stage_df.index.equals(df.index)
+            for column in columns:
+                if column in stage_df.columns:
+                    write_column(df_transformed, column, stage_df[column].to_numpy())
+                    del stage_df[column]
+                else:
+                    ## Consumed by an encoding; the rest of the frame is split into views, not copied
+                    del df_transformed[column]
+            ## What is left are the columns the stage added, e.g. one-hot indicators
+            if len(stage_df.columns):
+                added.append(stage_df)
+
+        if reset_index:
+            df_transformed.index = pd.RangeIndex(len(df_transformed))
+        if added:
+            for frame in added:
+                frame.index = df_transformed.index
+            df_transformed = pd.concat([df_transformed] + added, axis=1, copy=False)
+        logging.info("Feature engineering pipeline completed.")
+        return df_transformed
+
+    def to_dict(self) -> dict:
+        return {
+            "groups": [[strategy_to_dict(strategy) for strategy in strategies] for strategies in self.groups],
+            "n_jobs": self.n_jobs,
+        }
+
+    @classmethod
+    def from_dict(cls, params: dict) -> "FeatureEngineeringPipeline":
+        groups = [[strategy_from_dict(strategy) for strategy in strategies] for strategies in params["groups"]]
+        return cls(groups, n_jobs=params.get("n_jobs"))
+
+    def apply_transformation_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Chains the strategies over a stream of chunks in spec order.
+
+        Each fitting strategy makes its own pass over the lazily transformed stream of the strategies before it.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with all transformations applied.
+        """
+        for strategies in self.groups:
+            for strategy in strategies:
+                chunks = strategy.apply_transformation_chunks(chunks)
+        return chunks
+
+
+## Serialization of fitted strategies
+# A saved strategy is its to_dict() plus its registered name under "strategy".
+SAVED_STRATEGIES = {**STRATEGIES, "pipeline": FeatureEngineeringPipeline}
+
+
+def strategy_to_dict(strategy: FeatureEngineeringStrategy) -> dict:
+    """
+    The strategy's name and constructor arguments, including its fitted parameters, as plain JSON values.
+
+    Parameters:
+    strategy (FeatureEngineeringStrategy): The strategy to serialize.
+
+    Returns:
+    dict: The serialized strategy.
+    """
+    names = [name for name, strategy_class in SAVED_STRATEGIES.items() if type(strategy) is strategy_class]
+    if not names:
+        raise ValueError(f"{type(strategy).__name__} is not a registered feature engineering strategy.")
+    return {"strategy": names[0], **strategy.to_dict()}
+
+
+def strategy_from_dict(params: dict) -> FeatureEngineeringStrategy:
+    """
+    Recreates a strategy serialized by strategy_to_dict().
+
+    Parameters:
+    params (dict): The serialized strategy.
+
+    Returns:
+    FeatureEngineeringStrategy: The strategy, fitted if it was fitted when serialized.
+    """
+    params = dict(params)
+    name = params.pop("strategy")
+    if name not in SAVED_STRATEGIES:
+        raise ValueError(f"Unsupported feature engineering strategy: {name}")
+    return SAVED_STRATEGIES[name].from_dict(params)
+
 
 ## Context Class for Feature Engineering
 class FeatureEngineer:
-    def __init__(self, strategy: FeatureEngineeringStrategy):
+    def __init__(self, strategy: FeatureEngineeringStrategy, inplace: bool = False, cache: TransformCache = None):
         """
         Initializes the FeatureEngineer with a specific feature engineering strategy.
 
         Parameters:
         strategy (FeatureEngineeringStrategy): The strategy to be used for feature engineering.
+        inplace (bool): Let the strategy modify the input frame and reuse its column buffers instead of
+            copying it. The input must not be used afterwards.
+        cache (TransformCache): Reuse the result, and the fitted parameters, when the same strategy was
+            already applied to a frame with the same contents. No caching when None.
         """
         self._strategy = strategy
+        self.inplace = inplace
+        self.cache = cache
 
     def set_strategy(self, strategy: FeatureEngineeringStrategy):
         """
@@ -194,13 +1255,31 @@ class FeatureEngineer:
         pd.DataFrame: The dataframe with applied feature engineering transformations.
         """
         logging.info("Applying feature engineering strategy.")
-        return self._strategy.apply_transformation(df)
+        if self.cache is not None:
+            return self.cache.apply(
+                df, "feature_engineering", self._strategy,
+                lambda frame: self._strategy.apply_transformation(frame, inplace=self.inplace),
+            )
+        return self._strategy.apply_transformation(df, inplace=self.inplace)
+
+    def apply_feature_engineering_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        """
+        Executes the feature engineering transformation over a stream of DataFrame chunks.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features to transform.
+
+        Returns:
+        ChunkedData: A lazy chunk stream with applied feature engineering transformations.
+        """
+        logging.info("Applying feature engineering strategy over chunks.")
+        return self._strategy.apply_transformation_chunks(chunks)
 
 
 # Example usage
 if __name__ == "__main__":
     # Example dataframe
-      df = pd.read_csv('../../extracted_data/AmesHousing.csv')
+      df = pd.read_csv('../data/archive.zip')
 
     # Log Transformation Example
       log_transformer = FeatureEngineer(LogTransformation(features=['SalePrice', 'Gr Liv Area']))
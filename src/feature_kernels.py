@@ -0,0 +1,338 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence, Union
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.utils import murmurhash3_32
+
+
+## Compiled transforms for scoring
+# A fitted feature engineering strategy compiles into one of these kernels: plain NumPy arrays holding
+# the learned parameters (affine coefficients, category lookup tables) and a transform working on raw
+# arrays. Scoring a small batch then skips building DataFrames and going through sklearn's validation.
+# Kernels take the strategy's features in order, either as a 2D array (one column per feature) or as a
+# sequence of 1D arrays, and return a float64 matrix with one column per output feature.
+
+Columns = Union[np.ndarray, Sequence[np.ndarray]]
+
+
+def _as_columns(X: Columns, n_features: int) -> List[np.ndarray]:
+    """The input as a list of 1D arrays, one per feature"""
+    if isinstance(X, np.ndarray) and X.ndim == 2:
+        columns = list(X.T)
+    else:
+        columns = [np.asarray(column) for column in X]
+    if len(columns) != n_features:
+        raise ValueError(f"Expected {n_features} feature columns, got {len(columns)}.")
+    return columns
+
+
+def _scatter(n_rows: int, n_out: int, indices: List[np.ndarray], values: List[np.ndarray] = None,
+             sparse: bool = False) -> Union[np.ndarray, sp.csr_matrix]:
+    """
+    Builds a matrix from one output column per row and feature (negative: none), summing collisions.
+
+    Parameters:
+    n_rows (int): The number of rows.
+    n_out (int): The number of output columns.
+    indices (list): One array of output columns per feature.
+    values (list): One array of values per feature. Ones when None.
+    sparse (bool): Return a CSR matrix storing only the entries instead of a dense matrix.
+
+    Returns:
+    np.ndarray or sp.csr_matrix: The float64 matrix.
+    """
+    rows = np.arange(n_rows)
+    if values is None:
+        values = [np.ones(n_rows)] * len(indices)
+    hits = [feature_indices >= 0 for feature_indices in indices]
+    if sparse:
+        row_indices = np.concatenate([rows[hit] for hit in hits] + [np.empty(0, dtype=int)])
+        column_indices = np.concatenate(
+            [feature_indices[hit] for feature_indices, hit in zip(indices, hits)] + [np.empty(0, dtype=int)]
+        )
+        data = np.concatenate([feature_values[hit] for feature_values, hit in zip(values, hits)] + [np.empty(0)])
+        ## Duplicate entries (hash collisions) are summed by the conversion to CSR
+        return sp.csr_matrix((data, (row_indices, column_indices)), shape=(n_rows, n_out))
+    out = np.zeros((n_rows, n_out))
+    for feature_indices, feature_values, hit in zip(indices, values, hits):
+        ## Every row appears once per feature, so the buffered += cannot drop a collision
+        out[rows[hit], feature_indices[hit]] += feature_values[hit]
+    return out
+
+
+def _is_missing(values: np.ndarray) -> np.ndarray:
+    """NaN or None entries of a column"""
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "O":
+        return (values != values) | np.equal(values, None)
+    return np.zeros(len(values), dtype=bool)
+
+
+class FeatureKernel(ABC):
+    def __init__(self, features: list, feature_names_out: list):
+        """
+        Parameters:
+        features (list): The input features, in the order the kernel expects them.
+        feature_names_out (list): The names of the output columns.
+        """
+        self.features = list(features)
+        self.feature_names_out = list(feature_names_out)
+
+    @abstractmethod
+    def transform(self, X: Columns) -> np.ndarray:
+        """
+        Transforms a batch of rows.
+
+        Parameters:
+        X (np.ndarray or sequence): The features, as a 2D array or one 1D array per feature.
+
+        Returns:
+        np.ndarray: A float64 matrix with one row per input row and one column per output feature.
+        """
+        pass
+
+
+## Kernel for the log transformation: log(1 + x) per value
+class LogKernel(FeatureKernel):
+    def __init__(self, features: list):
+        super().__init__(features, features)
+
+    def transform(self, X: Columns) -> np.ndarray:
+        columns = _as_columns(X, len(self.features))
+        return np.log1p(np.column_stack(columns).astype("float64", copy=False))
+
+
+## Kernel for scaling: x * scale + offset per feature
+# Standard scaling compiles to scale = 1 / std and offset = -mean / std, Min-Max scaling to sklearn's
+# own scale_ and min_. Missing values stay NaN.
+class AffineKernel(FeatureKernel):
+    def __init__(self, features: list, scale: np.ndarray, offset: np.ndarray):
+        """
+        Parameters:
+        features (list): The features to scale.
+        scale (np.ndarray): The multiplier of every feature.
+        offset (np.ndarray): The value added to every feature after scaling.
+        """
+        super().__init__(features, features)
+        self.scale = np.asarray(scale, dtype="float64")
+        self.offset = np.asarray(offset, dtype="float64")
+
+    def transform(self, X: Columns) -> np.ndarray:
+        columns = _as_columns(X, len(self.features))
+        out = np.column_stack(columns).astype("float64", copy=False)  ## always a new array
+        out *= self.scale
+        out += self.offset
+        return out
+
+    def transform_column(
+        self, index: int, values: np.ndarray, out: np.ndarray = None, dtype: np.dtype = np.float64
+    ) -> np.ndarray:
+        """
+        Scales a single feature, optionally into an existing buffer of dtype (which may be values itself).
+
+        Parameters:
+        index (int): The position of the feature in features.
+        values (np.ndarray): The feature's values.
+        out (np.ndarray): The buffer receiving the result. A new array when None.
+        dtype (np.dtype): The floating-point type the scaling is computed and stored in. Default is float64.
+
+        Returns:
+        np.ndarray: The scaled values.
+        """
+        out = np.multiply(values, self.scale[index], out=out, dtype=dtype)
+        out += self.offset[index]
+        return out
+
+
+## Lookup of values in a list of known categories
+# Binary search over the sorted known categories; missing values (NaN or None) match the missing-value
+# category when the list has one.
+class _CategoryLookup:
+    def __init__(self, categories: list):
+        missing = [i for i, category in enumerate(categories) if category is None or category != category]
+        known = [i for i in range(len(categories)) if i not in missing]
+        known_values = np.array([categories[i] for i in known], dtype=object)
+        if len(known_values) and all(isinstance(value, (int, float, np.number)) for value in known_values):
+            known_values = known_values.astype("float64")
+        order = np.argsort(known_values, kind="stable")
+        self.sorted_values = known_values[order]
+        self.sorted_positions = np.array(known, dtype=int)[order]
+        self.missing_position = missing[0] if missing else -1
+
+    def positions(self, values: np.ndarray) -> np.ndarray:
+        """The position of every value in the categories, -1 for unknown values"""
+        values = np.asarray(values)
+        positions = np.full(len(values), -1)
+        missing = _is_missing(values)
+        present = np.flatnonzero(~missing)
+        if len(self.sorted_values) and len(present):
+            found = values[present]
+            candidates = np.minimum(np.searchsorted(self.sorted_values, found), len(self.sorted_values) - 1)
+            matched = np.asarray(self.sorted_values[candidates] == found, dtype=bool)
+            positions[present[matched]] = self.sorted_positions[candidates[matched]]
+        positions[missing] = self.missing_position
+        return positions
+
+
+## Kernel for one-hot encoding: a category -> output column lookup table per feature
+# The first category of every feature is dropped (it has no output column), as with
+# OneHotEncoder(drop="first"). Categories that were not seen during fitting raise a ValueError.
+class OneHotKernel(FeatureKernel):
+    def __init__(self, features: list, categories: List[list]):
+        """
+        Parameters:
+        features (list): The categorical features to encode.
+        categories (list): The known categories of every feature, in output order; the first one is dropped.
+        """
+        names, self._lookups, self._columns, n_out = [], [], [], 0
+        for feature, feature_categories in zip(features, categories):
+            feature_categories = list(feature_categories)
+            self._lookups.append(_CategoryLookup(feature_categories))
+            ## Output column of every category, -1 for the dropped first one
+            self._columns.append(np.concatenate([[-1], n_out + np.arange(len(feature_categories) - 1)]))
+            names.extend(f"{feature}_{category}" for category in feature_categories[1:])
+            n_out += len(feature_categories) - 1
+        super().__init__(features, names)
+        self.categories = [list(feature_categories) for feature_categories in categories]
+
+    def column_indices(self, index: int, values: np.ndarray) -> np.ndarray:
+        """
+        Looks up the output column of every value of one feature.
+
+        Parameters:
+        index (int): The position of the feature in features.
+        values (np.ndarray): The feature's values.
+
+        Returns:
+        np.ndarray: The output column per value, -1 for the dropped first category.
+        """
+        positions = self._lookups[index].positions(values)
+        if (positions < 0).any():
+            unknown = np.asarray(values)[positions < 0][:5]
+            raise ValueError(f"Found unknown categories {list(unknown)} in feature '{self.features[index]}'.")
+        return self._columns[index][positions]
+
+    def indicators(self, indices: List[np.ndarray], sparse: bool = False) -> Union[np.ndarray, sp.csr_matrix]:
+        """
+        Builds the indicator matrix from the output column of every value, as found by column_indices().
+
+        Parameters:
+        indices (list): One array of output columns per feature.
+        sparse (bool): Return a CSR matrix storing only the ones instead of a dense matrix.
+
+        Returns:
+        np.ndarray or sp.csr_matrix: A float64 matrix with a 1 in the column of every value's category.
+        """
+        n_rows = len(indices[0]) if indices else 0
+        return _scatter(n_rows, len(self.feature_names_out), indices, sparse=sparse)
+
+    def transform(self, X: Columns, sparse: bool = False) -> Union[np.ndarray, sp.csr_matrix]:
+        columns = _as_columns(X, len(self.features))
+        return self.indicators(
+            [self.column_indices(index, values) for index, values in enumerate(columns)], sparse=sparse
+        )
+
+
+## Kernel for feature hashing: "feature=value" tokens hashed into a fixed number of columns
+# The same signed 32-bit MurmurHash3 as sklearn's FeatureHasher: the column is |hash| % n_features
+# and, with alternate_sign, the sign of the hash is the sign of the entry, so collisions tend to
+# cancel out instead of adding up. Nothing is learned, so the width never depends on the data.
+class HashingKernel(FeatureKernel):
+    def __init__(self, features: list, n_features: int, alternate_sign: bool = True, prefix: str = None):
+        """
+        Parameters:
+        features (list): The categorical features to hash.
+        n_features (int): The number of output columns.
+        alternate_sign (bool): Sign every entry by its hash. Default is True.
+        prefix (str): The output column prefix. The features joined by "_" when None.
+        """
+        prefix = prefix or "_".join(str(feature) for feature in features)
+        super().__init__(features, [f"{prefix}_hash_{i}" for i in range(n_features)])
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+
+    def hash_values(self, index: int, values: np.ndarray) -> tuple:
+        """
+        Hashes values of one feature; meant for the distinct values, hashing each once.
+
+        Parameters:
+        index (int): The position of the feature in features.
+        values (np.ndarray): The feature's values. Missing values hash as "nan".
+
+        Returns:
+        tuple: The output column and the sign (+1.0 or -1.0) of every value.
+        """
+        values = np.asarray(values)
+        missing = _is_missing(values)
+        feature = self.features[index]
+        hashes = np.array(
+            [murmurhash3_32(f"{feature}={'nan' if is_missing else value}", seed=0)
+             for value, is_missing in zip(values, missing)],
+            dtype="int64",
+        )
+        signs = np.where((hashes >= 0) | (not self.alternate_sign), 1.0, -1.0)
+        return np.abs(hashes) % self.n_features, signs
+
+    def hashed(self, indices: List[np.ndarray], signs: List[np.ndarray], sparse: bool = False) -> Union[np.ndarray, sp.csr_matrix]:
+        """
+        Builds the hashed matrix from the output column and sign of every value, as found by hash_values().
+
+        Parameters:
+        indices (list): One array of output columns per feature.
+        signs (list): One array of signs per feature.
+        sparse (bool): Return a CSR matrix storing only the entries instead of a dense matrix.
+
+        Returns:
+        np.ndarray or sp.csr_matrix: The float64 matrix, with colliding entries summed.
+        """
+        n_rows = len(indices[0]) if indices else 0
+        return _scatter(n_rows, self.n_features, indices, signs, sparse=sparse)
+
+    def transform(self, X: Columns, sparse: bool = False) -> Union[np.ndarray, sp.csr_matrix]:
+        columns = _as_columns(X, len(self.features))
+        indices, signs = [], []
+        for index, values in enumerate(columns):
+            ## Hash every distinct value once; missing values hash as "nan", like in hash_values()
+            values = np.asarray(values, dtype=object)
+            tokens = np.where(_is_missing(values), "nan", values.astype(str))
+            distinct, inverse = np.unique(tokens, return_inverse=True)
+            buckets, value_signs = self.hash_values(index, distinct)
+            indices.append(buckets[inverse])
+            signs.append(value_signs[inverse])
+        return self.hashed(indices, signs, sparse=sparse)
+
+
+## Kernel for target encoding: a category -> encoded value lookup table per feature
+# Categories that were not seen during fitting get the default, the smoothed prior (the target mean).
+class TargetEncodingKernel(FeatureKernel):
+    def __init__(self, features: list, categories: List[list], values: List[list], default: float):
+        """
+        Parameters:
+        features (list): The categorical features to encode.
+        categories (list): The known categories of every feature.
+        values (list): The encoded value of every category, one list per feature.
+        default (float): The value of unknown categories.
+        """
+        super().__init__(features, features)
+        self._lookups = [_CategoryLookup(list(feature_categories)) for feature_categories in categories]
+        ## The extra last entry is read by unknown categories (position -1)
+        self._values = [np.append(np.asarray(feature_values, dtype="float64"), default) for feature_values in values]
+
+    def encode(self, index: int, values: np.ndarray) -> np.ndarray:
+        """
+        Looks up the encoded value of every value of one feature.
+
+        Parameters:
+        index (int): The position of the feature in features.
+        values (np.ndarray): The feature's values.
+
+        Returns:
+        np.ndarray: The encoded values, float64.
+        """
+        return self._values[index][self._lookups[index].positions(values)]
+
+    def transform(self, X: Columns) -> np.ndarray:
+        columns = _as_columns(X, len(self.features))
+        return np.column_stack([self.encode(index, values) for index, values in enumerate(columns)])
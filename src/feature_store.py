@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+## Local copies of remote feature store artifacts, evicted least recently used first above the size cap
+DEFAULT_STORE_DIR = os.path.join(tempfile.gettempdir(), "insightflow", "feature_store")
+DEFAULT_STORE_MAX_BYTES = 4 * 1024**3
+## Schema metadata key listing the sparse columns and their fill values
+SPARSE_METADATA_KEY = b"insightflow.sparse"
+
+
+def frame_to_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Converts a DataFrame to an Arrow table that maps back to pandas without copying numeric columns.
+
+    Float columns keep NaN as a value instead of becoming Arrow nulls, which would force pandas
+    to allocate a new array on every load. Arrow has no sparse columns, so sparse-backed columns are
+    stored dense and listed in the schema metadata; FrameHandle.load() makes them sparse again.
+
+    Parameters:
+    df (pd.DataFrame): The frame to convert. Its index is preserved.
+
+    Returns:
+    pa.Table: The table, carrying the pandas metadata needed to rebuild the frame.
+    """
+    sparse = {str(column): dtype.fill_value for column, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)}
+    if sparse:
+        ## Only the sparse columns are densified; the shallow copy shares every other column
+        df = df.copy(deep=False)
+        for column, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.SparseDtype):
+                df[column] = df[column].sparse.to_dense()
+    table = pa.Table.from_pandas(df)
+    if sparse:
+        table = table.replace_schema_metadata({**table.schema.metadata, SPARSE_METADATA_KEY: json.dumps(sparse)})
+    ## Looking the dtypes up directly; select_dtypes() would copy every float column
+    for column, dtype in df.dtypes.items():
+        if not (isinstance(dtype, np.dtype) and dtype.kind == "f"):
+            continue
+        index = table.schema.get_field_index(str(column))
+        table = table.set_column(
+            index, table.schema.field(index), pa.array(df[column].to_numpy(), from_pandas=False)
+        )
+    return table
+
+
+## Lightweight reference to a frame stored as an uncompressed Arrow IPC (Feather v2) file
+# Only the path and the shape travel between steps. load() memory-maps the file, so null-free
+# numeric columns (including floats holding NaN) become read-only views of the mapped pages, and
+# the operating system shares those pages between every process that loads the same handle.
+class FrameHandle:
+    def __init__(self, path: str, columns: List[str], num_rows: int):
+        """
+        Initializes the FrameHandle.
+
+        Parameters:
+        path (str): The Arrow file holding the frame.
+        columns (list): The column names of the frame.
+        num_rows (int): The number of rows of the frame.
+        """
+        self.path = path
+        self.columns = columns
+        self.num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"FrameHandle(path={self.path!r}, rows={self.num_rows}, columns={len(self.columns)})"
+
+    @classmethod
+    def write(cls, df: pd.DataFrame, path: str) -> "FrameHandle":
+        """
+        Writes a frame to an Arrow file and returns its handle.
+
+        Parameters:
+        df (pd.DataFrame): The frame to store.
+        path (str): The Arrow file to write. It is replaced atomically.
+
+        Returns:
+        FrameHandle: The handle of the stored frame.
+        """
+        ## Write to a temporary file first so a concurrent reader never maps a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        os.close(fd)
+        try:
+            ## One record batch: columns split over several batches would be concatenated (copied) on load
+            feather.write_feather(
+                frame_to_table(df), tmp_path, compression="uncompressed", chunksize=max(len(df), 1)
+            )
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        return cls(path, [str(column) for column in df.columns], len(df))
+
+    @classmethod
+    def open(cls, path: str) -> "FrameHandle":
+        """
+        Returns the handle of an existing Arrow file, reading only its schema and row count.
+
+        Parameters:
+        path (str): The Arrow file.
+
+        Returns:
+        FrameHandle: The handle of the stored frame.
+        """
+        table = feather.read_table(path, memory_map=True)
+        index_columns = (table.schema.pandas_metadata or {}).get("index_columns", [])
+        columns = [name for name in table.column_names if name not in index_columns]
+        return cls(path, columns, table.num_rows)
+
+    def load_table(self, columns: Optional[List[str]] = None) -> pa.Table:
+        """
+        Memory-maps the stored frame as an Arrow table.
+
+        Parameters:
+        columns (list): Only these columns (plus the stored index). All columns when None.
+
+        Returns:
+        pa.Table: The memory-mapped table.
+        """
+        table = feather.read_table(self.path, memory_map=True)
+        if columns is not None:
+            index_columns = [
+                name for name in (table.schema.pandas_metadata or {}).get("index_columns", [])
+                if isinstance(name, str)
+            ]
+            table = table.select(list(columns) + index_columns)
+        return table
+
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Rebuilds the frame from the memory-mapped file.
+
+        Numeric columns are read-only views of the file; assign new columns instead of modifying them in place.
+        Columns stored from sparse-backed columns are sparse again.
+
+        Parameters:
+        columns (list): Only rebuild these columns. All columns when None.
+
+        Returns:
+        pd.DataFrame: The frame.
+        """
+        table = self.load_table(columns)
+        df = table.to_pandas(split_blocks=True)
+        sparse = json.loads((table.schema.metadata or {}).get(SPARSE_METADATA_KEY, b"{}"))
+        for column, fill_value in sparse.items():
+            if column in df.columns:
+                df[column] = pd.arrays.SparseArray(df[column].to_numpy(), fill_value=fill_value)
+        return df
@@ -0,0 +1,45 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+## Helpers for strategies running in place
+# A column can be overwritten in its own buffer when it is backed by a writable NumPy array.
+# Columns memory-mapped from the feature store are read-only and extension-typed columns have no
+# plain buffer; those are replaced by a freshly allocated column instead, which still only costs
+# that one column rather than a copy of the whole frame (copy-on-write, column by column).
+
+
+def column_buffer(df: pd.DataFrame, column: str) -> Optional[np.ndarray]:
+    """
+    Returns the NumPy array backing a column when it can be written in place.
+
+    Parameters:
+    df (pd.DataFrame): The frame holding the column.
+    column (str): The column name.
+
+    Returns:
+    np.ndarray: A writable view of the column's values, or None when the column must be replaced instead.
+    """
+    series = df[column]
+    if not isinstance(series.dtype, np.dtype):
+        return None
+    values = series.to_numpy(copy=False)
+    return values if values.flags.writeable else None
+
+
+def write_column(df: pd.DataFrame, column: str, values: np.ndarray):
+    """
+    Stores new values in a column, reusing its buffer when the dtype is unchanged and it is writable.
+
+    Parameters:
+    df (pd.DataFrame): The frame to modify.
+    column (str): The column name.
+    values (np.ndarray): The new values, one per row.
+    """
+    buffer = column_buffer(df, column)
+    if buffer is not None and buffer.dtype == values.dtype:
+        np.copyto(buffer, values)
+    else:
+        df[column] = values
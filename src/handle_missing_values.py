@@ -1,26 +1,53 @@
+import json  ## for saving fill values
 import logging  ## for logging information
+import numpy as np  ## for vectorized filling
 import pandas as pd  ## for data manipulation
 from abc import ABC, abstractmethod
+from sklearn.neighbors import NearestNeighbors  ## for indexed neighbor search
+
+from src.chunked_data import ChunkedData
+from src.column_stats import ColumnStats
+from src.frame_buffers import column_buffer
+from src.transform_cache import TransformCache
 
 ## Setting up the logger
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')  ## asctime is the time of the event, name is the name of the logger, levelname is the level of the message, message is the message
 
 ## Abstract class for handling missing values
 class MissingValuesHandler(ABC):
+    ## Part of the transform cache key: bump it in a class whenever a change alters that class's results
+    cache_version = 1
+
     @abstractmethod
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         '''Handle Missing Values
         
         This method is used to handle missing values in a dataframe.
         
         Args:
             df (pd.DataFrame): The dataframe to handle missing values for.
+            inplace (bool): Allow modifying df and reusing its column buffers instead of copying it. Default is False.
             
         Returns:
             pd.DataFrame: The dataframe with missing values handled.
         '''
         pass
 
+    def handle_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        '''Handle Missing Values over Chunks
+
+        This method is used to handle missing values in a stream of dataframe chunks.
+        By default the strategy is applied to every chunk independently, which is only correct
+        for strategies that do not depend on statistics of the whole dataset.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to handle missing values for.
+
+        Returns:
+            ChunkedData: A lazy chunk stream with missing values handled.
+        '''
+        return chunks.map(self.handle)
+
 ## Concrete class for handling missing values
 class DropMissingValues(MissingValuesHandler):
     def __init__(self, axis=0):  ## axis=0 means drop rows, axis=1 means drop columns
@@ -33,13 +60,14 @@ class DropMissingValues(MissingValuesHandler):
         '''
         self.axis = axis
 
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         '''Handle Missing Values
 
         This method is used to handle missing values in a dataframe.
 
         Args:
             df (pd.DataFrame): The dataframe to handle missing values for.
+            inplace (bool): Unused; dropping always builds the remaining rows or columns anew. Default is False.
 
         Returns:
             pd.DataFrame: The dataframe with missing values handled.
@@ -47,9 +75,34 @@ class DropMissingValues(MissingValuesHandler):
         logging.info(f"Dropping missing values with axis: {self.axis}")
         return df.dropna(axis=self.axis)
 
+    def handle_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        '''Handle Missing Values over Chunks
+
+        Dropping rows is applied chunk by chunk. Dropping columns first scans all chunks to find
+        every column holding a missing value, so all chunks end up with the same columns.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to handle missing values for.
+
+        Returns:
+            ChunkedData: A lazy chunk stream with missing values dropped.
+        '''
+        if self.axis == 0:
+            return chunks.map(self.handle)
+
+        logging.info("Scanning chunks for columns with missing values")
+        columns_with_missing = set()
+        for chunk in chunks:
+            columns_with_missing.update(chunk.columns[chunk.isna().any()])
+        columns_with_missing = list(columns_with_missing)
+        return chunks.map(lambda chunk: chunk.drop(columns=columns_with_missing))
+
 ## Concrete class for filling missing values
+# The fill values are learned once by fit() (or fit_chunks()) and kept in fill_values_, a plain
+# column -> value mapping that can be saved as JSON. transform() only looks the values up, so
+# imputing a single row at inference costs O(rows) and never aggregates.
 class FillMissingValues(MissingValuesHandler):
-    def __init__(self, method="mean", fill_value=None):  ## method is the method to use to fill missing values, fill_value is the value to fill missing values with
+    def __init__(self, method="mean", fill_value=None, fill_values=None):  ## method is the method to use to fill missing values, fill_value is the value to fill missing values with
         '''Fill Missing Values
 
         This class is used to fill missing values in a dataframe.
@@ -57,52 +110,642 @@ class FillMissingValues(MissingValuesHandler):
         Args:
             method (str): The method to use to fill missing values. Default is "mean".
             fill_value (int): The value to fill missing values with. Default is None.
+            fill_values (dict): Fill values learned by an earlier fit(), mapping column name to value. Default is None.
         '''
         self.method = method
         self.fill_value = fill_value
+        self.fill_values_ = fill_values
+
+    def fit(self, df: pd.DataFrame) -> "FillMissingValues":
+        '''Fit Fill Values
+
+        This method is used to learn the fill value of every column from a dataframe.
+
+        Args:
+            df (pd.DataFrame): The dataframe to learn the fill values from.
+
+        Returns:
+            FillMissingValues: The fitted strategy.
+        '''
+        logging.info(f"Fitting fill values with method: {self.method} and fill_value: {self.fill_value}")
+
+        ## Selecting on an empty slice lists the columns without copying them
+        numeric_columns = df.iloc[:0].select_dtypes(include='number').columns
+        ## Column statistics attached at ingestion replace a rescan while the data is unchanged. Checking
+        ## that costs as much as a mean, so only medians and modes, which sort or count, look them up.
+        stats = None
+        if self.method in ("median", "mode"):
+            stats = ColumnStats.for_frame(df, numeric_columns if self.method == "median" else None)
+
+        ## Reducing column by column avoids materializing a numeric copy of the frame
+        if self.method == "mean":
+            fill_values = pd.Series({column: df[column].mean() for column in numeric_columns}, dtype="float64")
+        elif self.method == "median":
+            fill_values = stats.quantile(0.5, numeric_columns) if stats else \
+                pd.Series({column: df[column].median() for column in numeric_columns}, dtype="float64")
+        elif self.method == "mode":
+            fill_values = stats.mode(df.columns) if stats else pd.Series(dtype="object")
+            for column in df.columns.difference(fill_values.index, sort=False):
+                mode = df[column].mode()
+                if not mode.empty:
+                    fill_values[column] = mode.iloc[0]
+        elif self.method == "constant":
+            fill_values = pd.Series(self.fill_value, index=df.columns, dtype="object")
+        else:
+            logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = pd.Series(dtype="object")
+
+        self.fill_values_ = self._to_fill_dict(fill_values)
+        return self
+
+    def fit_chunks(self, chunks: ChunkedData) -> "FillMissingValues":
+        '''Fit Fill Values over Chunks
+
+        The fill values are learned in one pass over the chunks: exact sums and counts for "mean",
+        accumulated value counts for "mode". The "median" method needs the whole column at once
+        and is not supported on chunks.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to learn the fill values from.
+
+        Returns:
+            FillMissingValues: The fitted strategy.
+        '''
+        logging.info(f"Fitting fill values over chunks with method: {self.method}")
+
+        if self.method == "constant":
+            ## Only the column names are needed, which the first chunk already has
+            columns = next(iter(chunks), pd.DataFrame()).columns
+            fill_values = pd.Series(self.fill_value, index=columns, dtype="object")
+        elif self.method == "mean":
+            sums, counts = pd.Series(dtype="float64"), pd.Series(dtype="float64")
+            for chunk in chunks:
+                numeric_chunk = chunk.select_dtypes(include='number')
+                sums = sums.add(numeric_chunk.sum(), fill_value=0)
+                counts = counts.add(numeric_chunk.count(), fill_value=0)
+            fill_values = sums / counts
+        elif self.method == "mode":
+            value_counts = {}
+            for chunk in chunks:
+                for column in chunk.columns:
+                    column_counts = chunk[column].value_counts()
+                    if column in value_counts:
+                        column_counts = value_counts[column].add(column_counts, fill_value=0)
+                    value_counts[column] = column_counts
+            ## Ties resolve to the smallest value, like Series.mode()
+            fill_values = pd.Series({
+                column: counts[counts == counts.max()].sort_index().index[0]
+                for column, counts in value_counts.items()
+                if not counts.empty
+            }, dtype="object")
+        elif self.method == "median":
+            raise ValueError(
+                "Median imputation needs the whole column in memory and is not supported on chunks; "
+                "use StreamingFillMissingValues for approximate medians."
+            )
+        else:
+            logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = pd.Series(dtype="object")
+
+        self.fill_values_ = self._to_fill_dict(fill_values)
+        return self
 
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _to_fill_dict(fill_values: pd.Series) -> dict:
+        '''Plain Python values, without the columns that have nothing to fill with, so the mapping serializes as JSON'''
+        return {
+            column: value.item() if isinstance(value, np.generic) else value
+            for column, value in fill_values.items()
+            if not pd.isna(value)
+        }
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        '''Apply Fill Values
+
+        This method is used to fill missing values with the fill values learned by fit().
+        Float columns are filled with one vectorized masked write each and keep their dtype.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy, writing into the existing column buffers. Default is False.
+
+        Returns:
+            pd.DataFrame: The dataframe with missing values filled.
+        '''
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValues must be fitted before transform() is called.")
+
+        df_filled = df if inplace else df.copy()
+        for column, value in self.fill_values_.items():
+            if column not in df_filled.columns:
+                continue
+            series = df_filled[column]
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind == "f" \
+                    and isinstance(value, (int, float)) and not isinstance(value, bool):
+                values = series.to_numpy()
+                missing = np.isnan(values)
+                if not missing.any():
+                    continue
+                buffer = column_buffer(df_filled, column)
+                if buffer is not None:
+                    np.putmask(buffer, missing, values.dtype.type(value))
+                else:
+                    ## Read-only (memory-mapped) column: only this column is reallocated
+                    df_filled[column] = np.where(missing, values.dtype.type(value), values)
+            elif series.hasnans:
+                ## Categorical, object and nullable columns are replaced, and only when they have gaps
+                df_filled[column] = series.fillna(value)
+
+        return df_filled
+
+    def handle(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         '''Fill Missing Values
 
-        This method is used to fill missing values in a dataframe.
+        This method is used to fill missing values in a dataframe, with fill values learned from the same dataframe.
+        Use fit() on training data and transform() on new data to reuse the learned values instead.
 
         Args:
             df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy. Default is False.
 
         Returns:
             pd.DataFrame: The dataframe with missing values filled.
         '''
         logging.info(f"Filling missing values with method: {self.method} and fill_value: {self.fill_value}")
+        df_cleaned = self.fit(df).transform(df, inplace=inplace)
+        logging.info("Missing values filled.")
+        return df_cleaned
+
+    def handle_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        '''Fill Missing Values over Chunks
+
+        The fill values are learned in a first pass over the chunks (see fit_chunks()) and applied
+        lazily in a second pass.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to fill missing values for.
+
+        Returns:
+            ChunkedData: A lazy chunk stream with missing values filled.
+        '''
+        logging.info(f"Filling missing values over chunks with method: {self.method}")
+        return chunks.map(self.fit_chunks(chunks).transform)
+
+    def to_dict(self) -> dict:
+        return {"method": self.method, "fill_value": self.fill_value, "fill_values": self.fill_values_}
+
+    @classmethod
+    def load(cls, path: str) -> "FillMissingValues":
+        '''Load Fill Values
+
+        This method is used to load a strategy fitted and saved with save().
+
+        Args:
+            path (str): The JSON file to read.
+
+        Returns:
+            FillMissingValues: The fitted strategy.
+        '''
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str):
+        '''Save Fill Values
+
+        This method is used to save the method and the learned fill values as JSON.
+
+        Args:
+            path (str): The JSON file to write.
+        '''
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValues must be fitted before it is saved.")
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved fill values to {path}.")
+
+## Concrete class for filling missing values over data that does not fit in memory
+# The first pass folds every chunk into mergeable sketches (the same ColumnStats built at ingestion):
+# exact running means and counts, a KLL quantile sketch for medians and Misra-Gries heavy hitters for
+# modes. Memory is bounded by the sketch sizes, not by the number of rows. The second pass reuses
+# FillMissingValues.transform() on each chunk.
+class StreamingFillMissingValues(FillMissingValues):
+    def __init__(self, method="mean", fill_value=None, fill_values=None, quantile_k=4096, top_k_capacity=256):
+        '''Streaming Fill Missing Values
+
+        This class is used to fill missing values in a stream of dataframe chunks with bounded memory.
+
+        Args:
+            method (str): The method to use to fill missing values. Default is "mean".
+            fill_value (int): The value to fill missing values with. Default is None.
+            fill_values (dict): Fill values learned by an earlier fit, mapping column name to value. Default is None.
+            quantile_k (int): Level size of the quantile sketches. Medians are exact up to this many values per column. Default is 4096.
+            top_k_capacity (int): Number of counters kept per column for the modes. Modes are exact while a column has at most this many distinct values. Default is 256.
+        '''
+        super().__init__(method, fill_value, fill_values)
+        self.quantile_k = quantile_k
+        self.top_k_capacity = top_k_capacity
+
+    def fit_chunks(self, chunks: ChunkedData) -> "StreamingFillMissingValues":
+        '''Fit Fill Values over Chunks
+
+        This method is used to learn the fill values in one pass over the chunks, holding one chunk at a time.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to learn the fill values from.
+
+        Returns:
+            StreamingFillMissingValues: The fitted strategy.
+        '''
+        if self.method not in ("mean", "median", "mode"):
+            return super().fit_chunks(chunks)
+
+        logging.info(f"Fitting fill values over chunks with method: {self.method} using sketches")
+        stats = ColumnStats(
+            quantile_k=self.quantile_k, top_k_capacity=self.top_k_capacity, count_floats=self.method == "mode"
+        )
+        for chunk in chunks:
+            stats.update(chunk)
 
-        df_cleaned = df.copy()
+        numeric_columns = [column for column, summary in stats.columns.items() if summary.numeric]
         if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include=['int64', 'float64']).columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].mean())
+            fill_values = stats.mean(numeric_columns)
         elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include=['int64', 'float64']).columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(df_cleaned[numeric_columns].median())
-        elif self.method == "mode":
-            for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df_cleaned[column].mode().iloc[0], inplace=True)
-        elif self.method == "constant":
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            fill_values = stats.quantile(0.5, numeric_columns)
         else:
-            logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = pd.Series(dtype="object")
+            for column, summary in stats.columns.items():
+                if not summary.top_k.is_exact:
+                    logging.info(f"Column '{column}' has more than {self.top_k_capacity} distinct values; its mode is approximate.")
+                top = summary.top_k.top(1)
+                if not top.empty:
+                    fill_values[column] = top.index[0]
+
+        self.fill_values_ = self._to_fill_dict(fill_values)
+        return self
+
+    def to_dict(self) -> dict:
+        return {**super().to_dict(), "quantile_k": self.quantile_k, "top_k_capacity": self.top_k_capacity}
+
+def _numeric_columns(df: pd.DataFrame) -> list:
+    '''Numeric columns of a frame, listed from an empty slice so no data is copied'''
+    return list(df.iloc[:0].select_dtypes(include='number').columns)
+
+
+def _batch_matrix(df: pd.DataFrame, columns: list, start: int, stop: int) -> np.ndarray:
+    '''Rows start:stop of the given columns as a float64 matrix, with NaN for missing values'''
+    return np.column_stack([
+        df[column].iloc[start:stop].to_numpy(dtype="float64", na_value=np.nan) for column in columns
+    ]) if columns else np.empty((stop - start, 0))
+
+
+def _write_imputed(df: pd.DataFrame, column: str, rows: np.ndarray, values: np.ndarray):
+    '''Stores imputed values at the given row positions, in the column's own buffer when it is writable'''
+    buffer = column_buffer(df, column)
+    if buffer is not None and buffer.dtype.kind == "f":
+        buffer[rows] = values
+    else:
+        ## Read-only or non-float column: only this column is reallocated, float columns keep their precision
+        dtype = df[column].dtype if isinstance(df[column].dtype, np.dtype) and df[column].dtype.kind == "f" else "float64"
+        filled = df[column].to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+        filled[rows] = values
+        df[column] = filled
+
+
+## Concrete class for filling missing values from the nearest complete rows
+# Only numeric columns are imputed. The complete rows (optionally sampled down to max_donors) are
+# standardized and become the donors. Rows to fill are grouped by their pattern of missing columns,
+# and each pattern gets a KD- or ball-tree over the donors restricted to the columns that pattern
+# observes. Queries run in batches of batch_size rows, spread over n_jobs threads, so memory is
+# bounded by the donors and one batch instead of growing with n^2 like pairwise distances.
+class KNNFillMissingValues(MissingValuesHandler):
+    def __init__(self, n_neighbors=5, features=None, weights="uniform", algorithm="ball_tree",
+                 batch_size=10_000, n_jobs=-1, max_donors=100_000, random_state=0):
+        '''KNN Fill Missing Values
+
+        This class is used to fill missing numeric values with the mean of the nearest complete rows.
+
+        Args:
+            n_neighbors (int): The number of neighbors averaged for each fill. Default is 5.
+            features (list): The numeric columns used as coordinates and filled. All numeric columns when None.
+            weights (str): "uniform" for a plain mean, "distance" to weight neighbors by inverse distance. Default is "uniform".
+            algorithm (str): The neighbor index, "ball_tree" or "kd_tree". Default is "ball_tree".
+            batch_size (int): The number of rows queried at a time. Default is 10000.
+            n_jobs (int): The number of threads answering each batch of queries; -1 uses all cores. Default is -1.
+            max_donors (int): Sample at most this many complete rows into the index. All of them when None. Default is 100000.
+            random_state (int): Seed of the donor sample. Default is 0.
+        '''
+        if weights not in ("uniform", "distance"):
+            raise ValueError(f"Unknown weights '{weights}'. Use 'uniform' or 'distance'.")
+        if algorithm not in ("ball_tree", "kd_tree"):
+            raise ValueError(f"Unknown algorithm '{algorithm}'. Use 'ball_tree' or 'kd_tree'.")
+        self.n_neighbors = n_neighbors
+        self.features = features
+        self.weights = weights
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.max_donors = max_donors
+        self.random_state = random_state
+        self.columns_ = None
+
+    def fit(self, df: pd.DataFrame) -> "KNNFillMissingValues":
+        '''Fit Donors
+
+        This method is used to collect and standardize the complete rows that fills are taken from.
+
+        Args:
+            df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+            KNNFillMissingValues: The fitted strategy.
+        '''
+        columns = self.features if self.features is not None else _numeric_columns(df)
+        ## Columns without any value can neither locate neighbors nor be filled from them
+        self.columns_ = [column for column in columns if df[column].notna().any()]
+        if not self.columns_:
+            logging.info("No numeric column with values to impute from; KNN imputation will leave the data unchanged.")
+            return self
+
+        complete = np.ones(len(df), dtype=bool)
+        for column in self.columns_:
+            complete &= df[column].notna().to_numpy()
+        donor_rows = np.flatnonzero(complete)
+        if len(donor_rows) == 0:
+            raise ValueError("KNN imputation needs at least one row without missing values in the feature columns.")
+        if self.max_donors is not None and len(donor_rows) > self.max_donors:
+            rng = np.random.default_rng(self.random_state)
+            donor_rows = np.sort(rng.choice(donor_rows, self.max_donors, replace=False))
+
+        donors = np.column_stack([df[column].to_numpy(dtype="float64")[donor_rows] for column in self.columns_])
+        self.mean_ = donors.mean(axis=0)
+        self.scale_ = donors.std(axis=0)
+        self.scale_[self.scale_ == 0] = 1.0
+        self.donors_ = (donors - self.mean_) / self.scale_
+        self._indexes = {}
+        logging.info(f"KNN imputer indexed {len(donor_rows)} complete rows over {len(self.columns_)} columns.")
+        return self
+
+    def _index(self, observed: np.ndarray) -> NearestNeighbors:
+        '''The neighbor index over the observed columns of a missing pattern, built once per pattern'''
+        key = observed.tobytes()
+        if key not in self._indexes:
+            self._indexes[key] = NearestNeighbors(
+                n_neighbors=min(self.n_neighbors, len(self.donors_)), algorithm=self.algorithm, n_jobs=self.n_jobs
+            ).fit(self.donors_[:, observed])
+        return self._indexes[key]
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        '''Apply KNN Fills
+
+        This method is used to fill missing numeric values from the nearest donors, batch by batch.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy. Default is False.
+
+        Returns:
+            pd.DataFrame: The dataframe with missing numeric values filled.
+        '''
+        if self.columns_ is None:
+            raise ValueError("KNNFillMissingValues must be fitted before transform() is called.")
+        if not self.columns_:
+            return df if inplace else df.copy()
+
+        imputed = {column: ([], []) for column in self.columns_}
+        for start in range(0, len(df), self.batch_size):
+            batch = (_batch_matrix(df, self.columns_, start, start + self.batch_size) - self.mean_) / self.scale_
+            missing = np.isnan(batch)
+            rows = np.flatnonzero(missing.any(axis=1))
+            if len(rows) == 0:
+                continue
+            patterns, pattern_of_row = np.unique(missing[rows], axis=0, return_inverse=True)
+            for pattern_index, pattern in enumerate(patterns):
+                pattern_rows = rows[pattern_of_row.ravel() == pattern_index]
+                observed = ~pattern
+                if observed.any():
+                    distances, neighbors = self._index(observed).kneighbors(batch[pattern_rows][:, observed])
+                    neighbor_values = self.donors_[neighbors][:, :, pattern]
+                    if self.weights == "distance":
+                        ## Exact matches get all the weight, as in sklearn's KNNImputer
+                        with np.errstate(divide="ignore"):
+                            weights = 1.0 / distances
+                        exact = np.isinf(weights)
+                        weights[exact.any(axis=1)] = exact[exact.any(axis=1)]
+                        fills = np.einsum("rk,rkc->rc", weights, neighbor_values) / weights.sum(axis=1, keepdims=True)
+                    else:
+                        fills = neighbor_values.mean(axis=1)
+                else:
+                    ## Nothing observed to measure distances with: the donor mean
+                    fills = np.zeros((len(pattern_rows), pattern.sum()))
+                fills = fills * self.scale_[pattern] + self.mean_[pattern]
+                for position, column_index in enumerate(np.flatnonzero(pattern)):
+                    imputed[self.columns_[column_index]][0].append(start + pattern_rows)
+                    imputed[self.columns_[column_index]][1].append(fills[:, position])
+
+        df_filled = df if inplace else df.copy()
+        for column, (row_parts, value_parts) in imputed.items():
+            if row_parts:
+                _write_imputed(df_filled, column, np.concatenate(row_parts), np.concatenate(value_parts))
+        return df_filled
+
+    def handle(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        '''Fill Missing Values with KNN
+
+        This method is used to fill missing numeric values from the nearest complete rows of the same dataframe.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy. Default is False.
+
+        Returns:
+            pd.DataFrame: The dataframe with missing numeric values filled.
+        '''
+        logging.info(f"Filling missing values with {self.n_neighbors} nearest neighbors ({self.algorithm}).")
+        df_cleaned = self.fit(df).transform(df, inplace=inplace)
+        logging.info("Missing values filled.")
+        return df_cleaned
+
+
+## Concrete class for filling missing values by regressing each column on the others
+# Missing values start at the column means. Then, round after round, every column with gaps is
+# regressed (ridge, on standardized columns) on all other columns using the rows where it is
+# observed, and its gaps are replaced by the predictions. The rounds stop once the largest change
+# of an imputed value falls below tol times the largest observed magnitude, or after max_iter rounds.
+# The normal equations are accumulated batch by batch, and the learned sequence of regressions is
+# replayed batch by batch in transform(), because every row is imputed from its own values only.
+class IterativeFillMissingValues(MissingValuesHandler):
+    def __init__(self, features=None, max_iter=10, tol=1e-3, alpha=1.0, batch_size=100_000,
+                 max_fit_rows=100_000, random_state=0):
+        '''Iterative Fill Missing Values
+
+        This class is used to fill missing numeric values with round-robin regressions on the other columns.
+
+        Args:
+            features (list): The numeric columns used as regressors and filled. All numeric columns when None.
+            max_iter (int): The maximum number of imputation rounds. Default is 10.
+            tol (float): Stop once no imputed value changes by more than tol times the largest observed magnitude. Default is 1e-3.
+            alpha (float): Ridge penalty of the regressions on standardized columns. Default is 1.0.
+            batch_size (int): The number of rows processed at a time. Default is 100000.
+            max_fit_rows (int): Learn the regressions from a sample of at most this many rows. All rows when None. Default is 100000.
+            random_state (int): Seed of the row sample. Default is 0.
+        '''
+        self.features = features
+        self.max_iter = max_iter
+        self.tol = tol
+        self.alpha = alpha
+        self.batch_size = batch_size
+        self.max_fit_rows = max_fit_rows
+        self.random_state = random_state
+        self.columns_ = None
+
+    def _design(self, values: np.ndarray, column_index: int) -> np.ndarray:
+        '''Standardized other columns plus an intercept, the regressors of one column'''
+        others = np.arange(values.shape[1]) != column_index
+        design = (values[:, others] - self.mean_[others]) / self.scale_[others]
+        return np.column_stack([design, np.ones(len(values))])
+
+    def _predict(self, values: np.ndarray, column_index: int, coefficients: np.ndarray) -> np.ndarray:
+        return np.clip(self._design(values, column_index) @ coefficients, self.min_[column_index], self.max_[column_index])
+
+    def fit(self, df: pd.DataFrame) -> "IterativeFillMissingValues":
+        '''Fit Regressions
+
+        This method is used to learn the sequence of regressions, running the imputation rounds on df.
+
+        Args:
+            df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+            IterativeFillMissingValues: The fitted strategy.
+        '''
+        columns = self.features if self.features is not None else _numeric_columns(df)
+        self.columns_ = [column for column in columns if df[column].notna().any()]
+        self.sequence_ = []
+        if not self.columns_:
+            logging.info("No numeric column with values to impute from; iterative imputation will leave the data unchanged.")
+            return self
+        if self.max_fit_rows is not None and len(df) > self.max_fit_rows:
+            rng = np.random.default_rng(self.random_state)
+            df = df.iloc[np.sort(rng.choice(len(df), self.max_fit_rows, replace=False))]
+
+        values = _batch_matrix(df, self.columns_, 0, len(df))
+        missing = np.isnan(values)
+        ## Column by column, so the reductions never allocate another full matrix
+        observed_columns = [values[~missing[:, index], index] for index in range(len(self.columns_))]
+        self.mean_ = np.array([column.mean() for column in observed_columns])
+        self.scale_ = np.array([column.std() for column in observed_columns])
+        self.scale_[self.scale_ == 0] = 1.0
+        self.min_ = np.array([column.min() for column in observed_columns])
+        self.max_ = np.array([column.max() for column in observed_columns])
+        magnitude = max(np.abs(self.min_).max(), np.abs(self.max_).max())
+        del observed_columns
+        np.copyto(values, self.mean_, where=missing)
+
+        ## Fewest gaps first, like sklearn's IterativeImputer
+        order = [index for index in np.argsort(missing.sum(axis=0), kind="stable") if missing[:, index].any()]
+        threshold = self.tol * magnitude
+        penalty = np.full(len(self.columns_), self.alpha)
+        penalty[-1] = 0.0  ## the intercept is not penalized
+
+        for round_index in range(self.max_iter):
+            change = 0.0
+            for column_index in order:
+                observed = ~missing[:, column_index]
+                gram = np.diag(penalty)
+                moment = np.zeros(len(self.columns_))
+                for start in range(0, len(values), self.batch_size):
+                    batch_observed = observed[start:start + self.batch_size]
+                    design = self._design(values[start:start + self.batch_size][batch_observed], column_index)
+                    gram += design.T @ design
+                    moment += design.T @ values[start:start + self.batch_size][batch_observed, column_index]
+                coefficients = np.linalg.solve(gram, moment)
+                self.sequence_.append((column_index, coefficients))
+
+                gaps = np.flatnonzero(~observed)
+                for start in range(0, len(gaps), self.batch_size):
+                    rows = gaps[start:start + self.batch_size]
+                    predictions = self._predict(values[rows], column_index, coefficients)
+                    change = max(change, np.abs(predictions - values[rows, column_index]).max())
+                    values[rows, column_index] = predictions
+            logging.info(f"Iterative imputation round {round_index + 1}: largest change {change:.6g}.")
+            if change < threshold:
+                break
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        '''Apply Regressions
 
+        This method is used to fill missing numeric values by replaying the learned regressions, batch by batch.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy. Default is False.
+
+        Returns:
+            pd.DataFrame: The dataframe with missing numeric values filled.
+        '''
+        if self.columns_ is None:
+            raise ValueError("IterativeFillMissingValues must be fitted before transform() is called.")
+        if not self.columns_:
+            return df if inplace else df.copy()
+
+        imputed = {column: ([], []) for column in self.columns_}
+        for start in range(0, len(df), self.batch_size):
+            values = _batch_matrix(df, self.columns_, start, start + self.batch_size)
+            missing = np.isnan(values)
+            if not missing.any():
+                continue
+            np.copyto(values, self.mean_, where=missing)
+            for column_index, coefficients in self.sequence_:
+                rows = np.flatnonzero(missing[:, column_index])
+                if len(rows):
+                    values[rows, column_index] = self._predict(values[rows], column_index, coefficients)
+            for column_index, column in enumerate(self.columns_):
+                rows = np.flatnonzero(missing[:, column_index])
+                if len(rows):
+                    imputed[column][0].append(start + rows)
+                    imputed[column][1].append(values[rows, column_index])
+
+        df_filled = df if inplace else df.copy()
+        for column, (row_parts, value_parts) in imputed.items():
+            if row_parts:
+                _write_imputed(df_filled, column, np.concatenate(row_parts), np.concatenate(value_parts))
+        return df_filled
+
+    def handle(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        '''Fill Missing Values Iteratively
+
+        This method is used to fill missing numeric values with regressions learned on the same dataframe.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill missing values for.
+            inplace (bool): Fill df itself instead of a copy. Default is False.
+
+        Returns:
+            pd.DataFrame: The dataframe with missing numeric values filled.
+        '''
+        logging.info(f"Filling missing values iteratively with at most {self.max_iter} rounds.")
+        df_cleaned = self.fit(df).transform(df, inplace=inplace)
         logging.info("Missing values filled.")
         return df_cleaned
 
 ## Context class for handling missing values
 class MissingValueHandler:
-    def __init__(self, strategy: MissingValuesHandler):
+    def __init__(self, strategy: MissingValuesHandler, inplace: bool = False, cache: TransformCache = None):
         '''Initialize Missing Value Handler
 
         This class is used to initialize the missing value handler with a specific missing value handling strategy.
 
         Args:
             strategy (MissingValuesHandler): The strategy to be used for handling missing values.
+            inplace (bool): Let the strategy modify the input frame and reuse its column buffers instead of
+                copying it. The input must not be used afterwards. Default is False.
+            cache (TransformCache): Reuse the result when the same strategy was already applied to a frame
+                with the same contents. Default is None (no caching).
         '''
         self.strategy = strategy
+        self.inplace = inplace
+        self.cache = cache
 
     def set_strategy(self, strategy: MissingValuesHandler):
         '''Set Strategy
@@ -127,4 +770,23 @@ class MissingValueHandler:
             pd.DataFrame: The dataframe with missing values handled.
         '''
         logging.info(f"Handling missing values using strategy: {self.strategy}")
-        return self.strategy.handle(df)
\ No newline at end of file
+        if self.cache is not None:
+            return self.cache.apply(
+                df, "handle_missing_values", self.strategy, lambda frame: self.strategy.handle(frame, inplace=self.inplace)
+            )
+        return self.strategy.handle(df, inplace=self.inplace)
+
+    def handle_missing_values_chunks(self, chunks: ChunkedData) -> ChunkedData:
+        '''Handle Missing Values over Chunks
+
+        This method is used to handle missing values in a stream of dataframe chunks without
+        concatenating them.
+
+        Args:
+            chunks (ChunkedData): The chunk stream to handle missing values for.
+
+        Returns:
+            ChunkedData: A lazy chunk stream with missing values handled.
+        '''
+        logging.info(f"Handling missing values over chunks using strategy: {self.strategy}")
+        return self.strategy.handle_chunks(chunks)
\ No newline at end of file
@@ -0,0 +1,126 @@
+import glob
+import json
+import logging
+import os
+import tempfile
+from typing import List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from src.ingest_cache import hash_file
+from src.ingest_data import IngestData
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+WATERMARK_FILE = "watermark.json"
+
+
+## Incremental (delta) ingestion with watermarks
+# The persisted dataset is a directory of Arrow part files, one per run that found new data, plus a
+# watermark recording the content hashes of processed archives and the largest key seen so far.
+# A run only parses archives it has not seen, keeps only rows past the key watermark, and appends
+# them as a new part, so its cost grows with the new data rather than with the whole history.
+class IncrementalIngestor:
+    def __init__(self, ingestor: IngestData, state_dir: str, key_column: Optional[str] = "Order"):
+        """
+        Initializes the IncrementalIngestor.
+
+        Parameters:
+        ingestor (IngestData): The ingestor used to parse each new archive.
+        state_dir (str): The directory holding the watermark and the persisted dataset parts.
+        key_column (str): Monotonically increasing row key, such as "Order" or "PID". Rows at or
+            below the recorded maximum are skipped even inside new archives. None disables the key watermark.
+        """
+        self.ingestor = ingestor
+        self.state_dir = state_dir
+        self.key_column = key_column
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _load_watermark(self) -> dict:
+        path = os.path.join(self.state_dir, WATERMARK_FILE)
+        if not os.path.exists(path):
+            return {"processed": {}, "max_key": None, "parts": []}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_watermark(self, watermark: dict):
+        ## Replace atomically, so an interrupted run leaves the previous watermark intact
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(watermark, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.state_dir, WATERMARK_FILE))
+
+    def ingest(self, file_path: Union[str, Sequence[str]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Ingests only archives and rows that are new since the last run and appends them to the dataset.
+
+        Parameters:
+        file_path (str or list): An archive path, a glob pattern, or a list of archive paths.
+
+        Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The delta ingested by this run and the merged dataset.
+        """
+        paths = sorted(glob.glob(file_path)) if isinstance(file_path, str) else list(file_path)
+        watermark = self._load_watermark()
+
+        new_paths = {}
+        for path in paths:
+            digest = hash_file(path)
+            if digest not in watermark["processed"]:
+                new_paths[digest] = path
+        logging.info(f"Found {len(new_paths)} new of {len(paths)} archives.")
+
+        frames, max_key = [], watermark["max_key"]
+        for path in new_paths.values():
+            ## Pushing the key watermark into the parser so already ingested rows are never decoded
+            filters = None
+            if self.key_column is not None and max_key is not None:
+                filters = [(self.key_column, ">", max_key)]
+            df = self.ingestor.ingest(path, filters=filters)
+
+            ## Advancing the watermark per archive, so overlapping archives in one run add no duplicates
+            if self.key_column is not None and len(df) > 0:
+                max_key = df[self.key_column].max().item()
+            frames.append(df)
+        delta = pd.concat(frames, ignore_index=True) if frames else None
+
+        if delta is not None and len(delta) > 0:
+            part_name = f"part-{len(watermark['parts']):05d}.arrow"
+            feather.write_feather(delta, os.path.join(self.state_dir, part_name), compression="uncompressed")
+            watermark["parts"].append(part_name)
+            watermark["max_key"] = max_key
+            logging.info(f"Appended {len(delta)} new rows as {part_name}.")
+
+        watermark["processed"].update(new_paths)
+        self._save_watermark(watermark)
+
+        merged = self.load_merged(watermark["parts"])
+        if delta is None or len(delta) == 0:
+            delta = merged.head(0)
+        return delta, merged
+
+    def load_merged(self, parts: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Loads the merged dataset from its memory-mapped part files.
+
+        Parameters:
+        parts (list): The part files to load. Defaults to those recorded in the watermark.
+
+        Returns:
+        pd.DataFrame: The merged dataset.
+        """
+        parts = self._load_watermark()["parts"] if parts is None else parts
+        if len(parts) == 0:
+            return pd.DataFrame()
+        tables = [feather.read_table(os.path.join(self.state_dir, part), memory_map=True) for part in parts]
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas(split_blocks=True)
+
+    def reset(self):
+        """Removes the watermark and the persisted dataset, so the next run re-ingests everything."""
+        for name in os.listdir(self.state_dir):
+            if name == WATERMARK_FILE or (name.startswith("part-") and name.endswith(".arrow")):
+                os.remove(os.path.join(self.state_dir, name))
+        logging.info(f"Reset incremental ingestion state in {self.state_dir}.")
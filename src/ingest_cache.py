@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "insightflow", "ingest")
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Computes the content hash of a file.
+
+    Parameters:
+    file_path (str): The file to hash.
+
+    Returns:
+    str: The hex digest of the file contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def evict_lru(directory: str, max_bytes: int, suffix: str = ".arrow", companions: tuple = ()) -> List[str]:
+    """
+    Removes the least recently used entries of a cache directory until they fit within max_bytes.
+
+    Entries are the files ending in `suffix`, ordered by modification time, which readers refresh
+    on every hit. Files sharing an entry's name with one of the `companions` suffixes go with it.
+
+    Parameters:
+    directory (str): The cache directory.
+    max_bytes (int): The size cap of the entries.
+    suffix (str): The file suffix of an entry.
+    companions (tuple): Suffixes of the files removed together with each entry (e.g. ".json").
+
+    Returns:
+    list: The names of the evicted entries.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(suffix):
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except FileNotFoundError:  ## Evicted by a concurrent run
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+    evicted = []
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        stem = name[: -len(suffix)]
+        for path in [name] + [stem + companion for companion in companions]:
+            try:
+                os.remove(os.path.join(directory, path))
+            except FileNotFoundError:
+                pass
+        total_bytes -= size
+        evicted.append(name)
+    return evicted
+
+
+## Content-addressed columnar cache for ingested data
+# Entries are uncompressed Arrow IPC (Feather v2) files named "<archive hash>-<options hash>.arrow",
+# so an unchanged archive parsed with the same options is loaded memory-mapped instead of re-parsed.
+# Recency is tracked through file modification times, which keeps the cache safe to share between
+# concurrent pipeline runs without an index file.
+class IngestCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the IngestCache.
+
+        Parameters:
+        cache_dir (str): The directory holding the cached Arrow files.
+        max_bytes (int): The total size above which least recently used entries are evicted.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._hashes = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def hash_file(self, file_path: str) -> str:
+        """
+        Computes the content hash of a file, memoized on its path, size and modification time.
+
+        Parameters:
+        file_path (str): The file to hash.
+
+        Returns:
+        str: The hex digest of the file contents.
+        """
+        stat = os.stat(file_path)
+        memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._hashes:
+            self._hashes[memo_key] = hash_file(file_path)
+        return self._hashes[memo_key]
+
+    def key(self, file_path: str, options: dict) -> str:
+        """
+        Builds the cache key for a file and the options it is parsed with.
+
+        Parameters:
+        file_path (str): The source file.
+        options (dict): JSON-serializable parse options that affect the parsed result.
+
+        Returns:
+        str: The cache key.
+        """
+        options_hash = hashlib.blake2b(
+            json.dumps(options, sort_keys=True, default=str).encode(), digest_size=8
+        ).hexdigest()
+        return f"{self.hash_file(file_path)}-{options_hash}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.arrow")
+
+    def load_table(self, key: str, columns: Optional[List[str]] = None) -> Optional[pa.Table]:
+        """
+        Loads a cached entry as a memory-mapped Arrow table.
+
+        Parameters:
+        key (str): The cache key.
+        columns (list): Only map these columns. All columns when None.
+
+        Returns:
+        pa.Table: The cached table, or None on a cache miss.
+        """
+        path = self._path(key)
+        try:
+            table = feather.read_table(path, columns=columns, memory_map=True)
+        except FileNotFoundError:
+            logging.info(f"Ingest cache miss for key {key}.")
+            return None
+        os.utime(path)  ## Mark the entry as recently used
+        logging.info(f"Ingest cache hit for key {key}.")
+        return table
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Loads a cached entry as a DataFrame.
+
+        Parameters:
+        key (str): The cache key.
+
+        Returns:
+        pd.DataFrame: The cached data, or None on a cache miss.
+        """
+        table = self.load_table(key)
+        if table is None:
+            return None
+        ## split_blocks lets null-free numeric columns stay zero-copy views of the mapped file
+        return table.to_pandas(split_blocks=True)
+
+    def store(self, key: str, df: pd.DataFrame):
+        """
+        Stores a DataFrame under the given key and evicts old entries above the size cap.
+
+        Parameters:
+        key (str): The cache key.
+        df (pd.DataFrame): The data to cache.
+        """
+        ## Write to a temporary file first so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(df, tmp_path, compression="uncompressed")
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        logging.info(f"Stored ingest cache entry {key}.")
+        self._evict()
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Removes cached entries.
+
+        Parameters:
+        file_path (str): Only remove the entries of this source file. Removes everything when None.
+        """
+        prefix = f"{self.hash_file(file_path)}-" if file_path is not None else ""
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name.endswith(".arrow"):
+                os.remove(os.path.join(self.cache_dir, name))
+        logging.info(f"Invalidated ingest cache entries{f' for {file_path}' if file_path else ''}.")
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits within max_bytes."""
+        for name in evict_lru(self.cache_dir, self.max_bytes):
+            logging.info(f"Evicted ingest cache entry {name}.")
@@ -1,62 +1,605 @@
+import ast
+import functools
+import glob
+import logging
+import operator
 import os
+import re
 import zipfile
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from pandas.api.types import union_categoricals
+
+from src.chunked_data import ChunkedData
+from src.column_stats import ATTRS_KEY, ColumnStats
+from src.ingest_cache import IngestCache
+from src.ingest_schema import IngestSchema
+from src.precision import cast_columns, float_dtype
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+## Rows per parsed chunk when predicates are evaluated while reading
+PUSHDOWN_CHUNKSIZE = 100_000
+
+## CSV parser backends: pandas' C engine, pyarrow's multithreaded reader converted to NumPy-backed
+## columns, or the pyarrow reader keeping Arrow-backed (pd.ArrowDtype) columns
+ENGINES = ("c", "pyarrow", "pyarrow_dtypes")
+
+## pandas' default missing-value markers, so both parsers agree on what is null
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+## A row predicate as (column, operator, value)
+Filter = Tuple[str, str, Any]
+
+FILTER_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda values, value: values.isin(value),
+    "not in": lambda values, value: ~values.isin(value),
+}
+
+
+def _parse_filters(filters: Optional[Sequence]) -> List[Filter]:
+    """Normalize predicates given as (column, op, value) sequences or strings such as: Yr Sold >= 2008"""
+    parsed = []
+    for predicate in filters or []:
+        if isinstance(predicate, str):
+            ## Symbolic operators first, so "in" inside a column name is never mistaken for one
+            match = re.match(r"^\s*(.+?)\s*(==|!=|>=|<=|>|<)\s*(.+?)\s*$", predicate) or re.match(
+                r"^\s*(.+?)\s+(not in|in)\s+(.+?)\s*$", predicate
+            )
+            if match is None:
+                raise ValueError(f"Could not parse filter '{predicate}'")
+            column, op, value = match.groups()
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                pass  ## Bare words compare as strings
+            predicate = (column.strip("'\"` "), op, value)
+
+        column, op, value = predicate
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f"Unsupported filter operator '{op}'")
+        parsed.append((column, op, value))
+    return parsed
+
+
+def _needed_columns(columns: Optional[List[str]], filters: List[Filter]) -> Optional[List[str]]:
+    """Columns that must be decoded: the projection plus every column a predicate reads"""
+    if columns is None:
+        return None
+    return list(columns) + [column for column, _, _ in filters if column not in columns]
+
+
+def _combine(filters: List[Filter], resolve: Callable[[str], Any]) -> Any:
+    """AND together the predicates, with `resolve` turning a column name into a Series or Arrow field"""
+    return functools.reduce(
+        operator.and_, [FILTER_OPERATORS[op](resolve(column), value) for column, op, value in filters]
+    )
+
+
+def _filter_frame(df: pd.DataFrame, columns: Optional[List[str]], filters: List[Filter]) -> pd.DataFrame:
+    """Apply the predicates and the projection to a parsed frame"""
+    if filters:
+        df = df[_combine(filters, lambda column: df[column])]
+    if columns is not None and list(df.columns) != list(columns):
+        df = df[columns]
+    return df
+
+
+def _filter_table(table: pa.Table, columns: Optional[List[str]], filters: List[Filter]) -> pa.Table:
+    """Apply the predicates and the projection to an Arrow table without converting it to pandas"""
+    if filters:
+        ## The operators build pyarrow compute expressions when applied to pc.field()
+        table = table.filter(_combine(filters, pc.field))
+    if columns is not None:
+        table = table.select(columns)
+    return table
 
 
 ## Defining the abstract class for data ingestion
 class IngestData(ABC):
     @abstractmethod
-    def ingest(self, file_path: str) -> pd.DataFrame:
-        """Abstract method to ingest data from a file"""
+    def ingest(
+        self, file_path: str, columns: Optional[List[str]] = None, filters: Optional[Sequence] = None
+    ) -> pd.DataFrame:
+        """Abstract method to ingest data from a file, optionally projected to `columns` and filtered by `filters`"""
         pass
 
+    @abstractmethod
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Abstract method to ingest data from a file as DataFrame chunks of at most `chunksize` rows"""
+        pass
+
+    def ingest_chunked(
+        self,
+        file_path: str,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence] = None,
+    ) -> ChunkedData:
+        """Return a re-iterable chunk stream over the file, holding at most one chunk in memory"""
+        if isinstance(file_path, str):
+            file_path = os.path.abspath(file_path)
+        return ChunkedData(lambda: self.iter_chunks(file_path, chunksize, columns, filters))
+
 
 ## Defining the class for ingesting data from a csv file
 class IngestCSVData(IngestData):
-    def ingest(self, file_path: str) -> pd.DataFrame:
-        """Ingest data from a csv file"""
-        
+    def __init__(
+        self,
+        member: Optional[str] = None,
+        cache: Optional[IngestCache] = None,
+        schema_path: Optional[str] = None,
+        downcast_floats: bool = False,
+        compute_stats: bool = False,
+        engine: str = "c",
+        precision: Optional[str] = None,
+    ):
+        """Initialize the CSV ingestor
+
+        Parameters:
+        member (str): Name of the CSV member to read when the archive holds several CSV files.
+        cache (IngestCache): Columnar cache used to skip CSV parsing for unchanged archives.
+        schema_path (str): JSON file holding the ingest schema. It is inferred and written on first use.
+        downcast_floats (bool): Store float columns as float32 when inferring the schema.
+        compute_stats (bool): Compute column statistics in one pass and attach them to the ingested frame.
+        engine (str): The CSV parser backend, one of "c", "pyarrow" or "pyarrow_dtypes".
+        precision (str): Parse float columns as "float32" or "float64", overriding the schema. None keeps
+            the schema's float types (float64 without a schema).
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of {ENGINES}.")
+        float_dtype(precision)  ## Validates the precision
+        self.member = member
+        self.cache = cache
+        self.schema_path = schema_path
+        self.downcast_floats = downcast_floats
+        self.compute_stats = compute_stats
+        self.engine = engine
+        self.precision = precision
+        self._schema = None
+
+    def _parse_options(self, schema: Optional[IngestSchema]) -> dict:
+        """Options that change the parsed result and therefore key the cache"""
+        options = {"member": self.member, "schema": schema.to_dict() if schema is not None else None}
+
+        ## Both pyarrow engines parse the same Arrow table and differ only in how it is converted,
+        ## while the C engine keeps its original keys
+        if self.engine != "c":
+            options["parser"] = "pyarrow"
+        return options
+
+    def _resolve_schema(self, file_path: str) -> Optional[IngestSchema]:
+        """Load the persisted schema, inferring and saving it from a full parse on first use"""
+
+        if self.schema_path is None:
+            return None
+        if self._schema is None:
+            if os.path.exists(self.schema_path):
+                self._schema = IngestSchema.load(self.schema_path)
+            else:
+                with self._open_csv(file_path) as csv_file:
+                    df = pd.read_csv(csv_file)
+                self._schema = IngestSchema.infer(df, downcast_floats=self.downcast_floats)
+                self._schema.save(self.schema_path)
+        ## The parser builds float columns in the requested precision; the persisted schema is left as it is
+        return self._schema if self.precision is None else self._schema.with_precision(self.precision)
+
+    def _resolve_member(self, zip_ref: zipfile.ZipFile) -> str:
+        """Pick the CSV member to read from the archive"""
+
+        csv_members = [name for name in zip_ref.namelist() if name.endswith('.csv')]
+
+        if self.member is not None:
+            if self.member not in csv_members:
+                raise ValueError(f"CSV member '{self.member}' not found in archive")
+            return self.member
+
+        if len(csv_members) == 0:
+            raise ValueError("No CSV file found in archive")
+        if len(csv_members) > 1:
+            raise ValueError(
+                f"Multiple CSV files found in archive: {csv_members}. Pass `member` to select one."
+            )
+        return csv_members[0]
+
+    def _validate(self, file_path: str):
+        """Check that the file exists and is a .zip archive or a plain .csv file"""
+
         ## Ensure the file exists
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file '{file_path}' does not exist.")
         
-        ## Ensuring that the file is .zip
-        if not file_path.endswith('.zip'):
-            raise ValueError("File must be a .zip file")
-        
-        ## Create a directory named "extracted_data" in the root directory
-        extracted_dir = os.path.abspath(os.path.join("..", "extracted_data"))  # Root directory
-        os.makedirs(extracted_dir, exist_ok=True)  # Create the directory if it doesn't exist
-        
-        ## Extracting the file
+        ## Ensuring that the file is .zip or .csv
+        if not file_path.endswith(('.zip', '.csv')):
+            raise ValueError("File must be a .zip or .csv file")
+
+    @contextmanager
+    def _open_csv(self, file_path: str) -> Iterator[IO[bytes]]:
+        """Open the CSV file, or the CSV member for streaming straight out of the archive"""
+        if file_path.endswith('.csv'):
+            with open(file_path, 'rb') as csv_file:
+                yield csv_file
+            return
+
         with zipfile.ZipFile(file_path, 'r') as zip_ref:
-            zip_ref.extractall(extracted_dir)
-        
-        ## Finding the extracted CSV file
-        extracted_files = os.listdir(extracted_dir)
-        csv_files = [f for f in extracted_files if f.endswith('.csv')]
-
-        if len(csv_files) == 0:
-            raise ValueError("No CSV file found in extracted data")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found in extracted data")
-        
-        ## Reading the CSV file into a pandas dataframe
-        df = pd.read_csv(os.path.join(extracted_dir, csv_files[0]))
+            with zip_ref.open(self._resolve_member(zip_ref)) as csv_file:
+                yield csv_file
+
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table to pandas, keeping Arrow-backed columns for the pyarrow_dtypes engine"""
+        if self.engine == "pyarrow_dtypes":
+            ## Dictionary columns still become pandas categoricals, which downstream code relies on
+            return table.to_pandas(
+                types_mapper=lambda arrow_type: None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+            )
+        ## split_blocks lets null-free numeric columns stay zero-copy views of the Arrow buffers
+        return table.to_pandas(split_blocks=True)
+
+    def _from_arrow(self, table: pa.Table, schema: Optional[IngestSchema]) -> pd.DataFrame:
+        """Convert a table parsed by pyarrow and align its categories to the schema"""
+        df = self._to_pandas(table)
+        if schema is None:
+            return df
+        ## The reader already decoded the schema types; Arrow-backed columns must not be cast back to NumPy
+        return schema.apply(df) if self.engine == "pyarrow" else schema.align_categories(schema.downcast_integers(df))
+
+    def _arrow_convert_options(
+        self, schema: Optional[IngestSchema], columns: Optional[List[str]]
+    ) -> pacsv.ConvertOptions:
+        """Convert options for the pyarrow reader, matching pandas' handling of missing values"""
+        return pacsv.ConvertOptions(
+            include_columns=columns if columns is not None else [],
+            column_types=schema.arrow_column_types() if schema is not None else None,
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        )
+
+    def _iter_arrow(
+        self,
+        file_path: str,
+        schema: Optional[IngestSchema],
+        chunksize: int,
+        columns: Optional[List[str]],
+        filters: List[Filter],
+    ) -> Iterator[pd.DataFrame]:
+        """Stream the CSV through the pyarrow reader, filtering each block and regrouping rows into chunks"""
+
+        with self._open_csv(file_path) as csv_file:
+            reader = pacsv.open_csv(
+                csv_file, convert_options=self._arrow_convert_options(schema, _needed_columns(columns, filters))
+            )
+            pending, start = [], 0
+            for batch in reader:
+                pending.append(_filter_table(pa.Table.from_batches([batch]), columns, filters))
+                table = pa.concat_tables(pending)
+                ## Emitting full chunks and keeping the remainder for the next block
+                while table.num_rows >= chunksize:
+                    chunk = self._from_arrow(table.slice(0, chunksize), schema)
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    yield chunk
+                    table = table.slice(chunksize)
+                pending = [table]
+
+            if pending and pending[0].num_rows > 0:
+                chunk = self._from_arrow(pending[0], schema)
+                chunk.index = pd.RangeIndex(start, start + len(chunk))
+                yield chunk
+
+    def _iter_parsed(
+        self,
+        file_path: str,
+        schema: Optional[IngestSchema],
+        chunksize: int,
+        columns: Optional[List[str]],
+        filters: List[Filter],
+    ) -> Iterator[pd.DataFrame]:
+        """Parse the CSV in chunks, decoding only the needed columns and dropping filtered rows per chunk"""
+
+        if self.engine != "c":
+            yield from self._iter_arrow(file_path, schema, chunksize, columns, filters)
+            return
+
+        for chunk in self._read_chunks(file_path, schema, chunksize, columns, filters):
+            chunk = _filter_frame(chunk, columns, filters)
+            ## Chunks the predicates emptied are skipped, like the Arrow reader does
+            if len(chunk) > 0:
+                yield chunk
+
+    def _read_chunks(
+        self,
+        file_path: str,
+        schema: Optional[IngestSchema],
+        chunksize: int,
+        columns: Optional[List[str]],
+        filters: List[Filter],
+    ) -> Iterator[pd.DataFrame]:
+        """Parse the CSV in chunks with the C parser, decoding only the needed columns, before filtering"""
+
+        ## The archive stays open only while the chunks are being consumed
+        with self._open_csv(file_path) as csv_file:
+            with pd.read_csv(
+                csv_file,
+                chunksize=chunksize,
+                usecols=_needed_columns(columns, filters),
+                dtype=schema.read_csv_dtypes() if schema is not None else None,
+            ) as reader:
+                for chunk in reader:
+                    yield schema.apply(chunk) if schema is not None else chunk
+
+    def _parse(
+        self, file_path: str, schema: Optional[IngestSchema], columns: Optional[List[str]], filters: List[Filter]
+    ) -> pd.DataFrame:
+        """Parse the whole CSV into one frame, evaluating predicates chunk by chunk when there are any"""
+
+        if self.engine != "c":
+            ## The multithreaded reader decodes the whole member; predicates run on the Arrow table
+            with self._open_csv(file_path) as csv_file:
+                table = pacsv.read_csv(
+                    csv_file, convert_options=self._arrow_convert_options(schema, _needed_columns(columns, filters))
+                )
+            return self._from_arrow(_filter_table(table, columns, filters), schema)
+
+        if filters:
+            ## Filtering chunk by chunk so rows that fail the predicates are never held together
+            frames, empty = [], None
+            for chunk in self._read_chunks(file_path, schema, PUSHDOWN_CHUNKSIZE, columns, filters):
+                chunk = _filter_frame(chunk, columns, filters)
+                if len(chunk) > 0:
+                    frames.append(chunk)
+                elif empty is None:
+                    empty = chunk
+            ## When no row matches, the first emptied chunk still carries the columns and dtypes
+            if not frames and empty is not None:
+                frames = [empty]
+            return pd.concat(frames, ignore_index=True)
+
+        ## Streaming the CSV member into pandas, with the schema dtypes applied by the parser
+        with self._open_csv(file_path) as csv_file:
+            df = pd.read_csv(
+                csv_file, usecols=columns, dtype=schema.read_csv_dtypes() if schema is not None else None
+            )
+        if schema is not None:
+            df = schema.apply(df)
+        return _filter_frame(df, columns, filters)
+
+    def ingest(
+        self, file_path: str, columns: Optional[List[str]] = None, filters: Optional[Sequence] = None
+    ) -> pd.DataFrame:
+        """Ingest data from a csv file inside a .zip archive without extracting it to disk
+
+        Parameters:
+        file_path (str): The archive or csv file to read.
+        columns (list): Only these columns are decoded and returned. All columns when None.
+        filters (list): Row predicates such as ("Yr Sold", ">=", 2008) or "Yr Sold >= 2008", combined with AND.
+        """
+        self._validate(file_path)
+        schema = self._resolve_schema(file_path)
+        filters = _parse_filters(filters)
+        pushdown = columns is not None or len(filters) > 0
+
+        ## Loading the parsed columns from the cache when the archive is unchanged,
+        ## with the projection and predicates evaluated on the memory-mapped Arrow table
+        df = None
+        if self.cache is not None:
+            cache_key = self.cache.key(file_path, self._parse_options(schema))
+            table = self.cache.load_table(cache_key, columns=_needed_columns(columns, filters))
+            if table is not None:
+                df = self._to_pandas(_filter_table(table, columns, filters))
+
+        if df is None:
+            df = self._parse(file_path, schema, columns, filters)
+
+            ## Only complete parses populate the cache, so every later projection can be served from it
+            if self.cache is not None and not pushdown:
+                self.cache.store(cache_key, df)
+
+        ## Without a schema the parser cannot be told the float types, so they are cast afterwards
+        if schema is None:
+            df = cast_columns(df, self.precision, inplace=True)
+
+        ## Attaching the statistics so downstream steps can skip their own scans
+        if self.compute_stats:
+            ColumnStats.from_frame(df)
 
         ## Returning the dataframe
         return df
 
+    def iter_chunks(
+        self,
+        file_path: str,
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the csv file inside a .zip archive as DataFrame chunks of at most `chunksize` rows"""
+        self._validate(file_path)
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        schema = self._resolve_schema(file_path)
+        filters = _parse_filters(filters)
+
+        ## Slicing cached record batches instead of parsing when the archive is unchanged
+        if self.cache is not None:
+            table = self.cache.load_table(
+                self.cache.key(file_path, self._parse_options(schema)), columns=_needed_columns(columns, filters)
+            )
+            if table is not None:
+                start = 0
+                for batch in _filter_table(table, columns, filters).to_batches(max_chunksize=chunksize):
+                    chunk = self._to_pandas(pa.Table.from_batches([batch]))
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    yield chunk if schema is not None else cast_columns(chunk, self.precision, inplace=True)
+                return
+
+        for chunk in self._iter_parsed(file_path, schema, chunksize, columns, filters):
+            yield chunk if schema is not None else cast_columns(chunk, self.precision, inplace=True)
+
+
+## Defining the class for ingesting many csv files or archives in parallel
+class IngestMultipleCSVData(IngestData):
+    def __init__(self, max_workers: Optional[int] = None, **kwargs):
+        """Initialize the multi-source ingestor
+
+        Parameters:
+        max_workers (int): Number of worker processes parsing files. Defaults to the number of cores.
+        kwargs: Options forwarded to the IngestCSVData used for every file.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.ingestor = IngestCSVData(**kwargs)
+
+    def _resolve_paths(self, file_path: Union[str, Sequence[str]]) -> List[str]:
+        """Expand a glob pattern, or take a list of paths as given, into an ordered list of files"""
+
+        paths = sorted(glob.glob(file_path)) if isinstance(file_path, str) else list(file_path)
+        if len(paths) == 0:
+            raise FileNotFoundError(f"No files match '{file_path}'.")
+
+        ## Resolving the schema once here so workers never race to infer and save it
+        self.ingestor._resolve_schema(paths[0])
+        return paths
+
+    @staticmethod
+    def _column_kind(dtype) -> str:
+        """Coarse dtype kind, so integer columns with missing values in some files still match"""
+        if isinstance(dtype, pd.CategoricalDtype):
+            return 'category'
+        return 'numeric' if dtype.kind in 'iuf' else dtype.kind
+
+    @staticmethod
+    def _signature(df: pd.DataFrame) -> tuple:
+        """What _check_schema compares: the columns, their dtypes and the columns without any value"""
+        return list(df.columns), dict(df.dtypes), {column for column in df.columns if df[column].isna().all()}
+
+    def _check_schema(self, reference: tuple, df: pd.DataFrame, path: str):
+        """Raise if a file's columns or column kinds differ from the first file's signature"""
+
+        columns, dtypes, empty_columns = reference
+        if list(df.columns) != columns:
+            raise ValueError(f"Columns of '{path}' do not match the first file.")
+        for column in df.columns:
+            if self._column_kind(df[column].dtype) != self._column_kind(dtypes[column]):
+                ## A column with no values at all parses as float and matches anything
+                if column in empty_columns or df[column].isna().all():
+                    continue
+                raise ValueError(
+                    f"Column '{column}' of '{path}' has dtype {df[column].dtype}, "
+                    f"expected {dtypes[column]}."
+                )
+
+    @staticmethod
+    def _align_categories(frames: List[pd.DataFrame]):
+        """Give categorical columns the union of categories so concatenation keeps them categorical"""
+
+        for column in frames[0].select_dtypes(include='category').columns:
+            categories = union_categoricals([df[column] for df in frames]).categories
+            for df in frames:
+                df[column] = df[column].cat.set_categories(categories)
+
+    def ingest(
+        self,
+        file_path: Union[str, Sequence[str]],
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence] = None,
+    ) -> pd.DataFrame:
+        """Ingest every matching file in a process pool and concatenate them in path order"""
+        paths = self._resolve_paths(file_path)
+        logging.info(f"Ingesting {len(paths)} files with {self.max_workers} workers.")
+
+        ingest_file = functools.partial(self.ingestor.ingest, columns=columns, filters=filters)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = list(executor.map(ingest_file, paths))
+
+        reference = self._signature(frames[0])
+        for path, df in zip(paths, frames):
+            self._check_schema(reference, df, path)
+        self._align_categories(frames)
+        df = pd.concat(frames, ignore_index=True)
+
+        ## Merging the statistics each worker computed for its file instead of rescanning the result
+        if self.ingestor.compute_stats:
+            stats = ColumnStats()
+            for frame in frames:
+                stats.merge(frame.attrs[ATTRS_KEY])
+            stats.attach(df)
+        return df
+
+    def iter_chunks(
+        self,
+        file_path: Union[str, Sequence[str]],
+        chunksize: int,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Sequence] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield every matching file in path order as DataFrame chunks of at most `chunksize` rows
+
+        Files are parsed in a process pool, with at most `max_workers` parsed files held in memory
+        at a time. Categorical columns keep per-file categories.
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+        paths = self._resolve_paths(file_path)
+        ingest_file = functools.partial(self.ingestor.ingest, columns=columns, filters=filters)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            reference, start = None, 0
+            for index in range(len(paths)):
+                ## Keeping the pool busy with up to max_workers files ahead of the consumer
+                while len(pending) < self.max_workers and index + len(pending) < len(paths):
+                    next_path = paths[index + len(pending)]
+                    pending.append((next_path, executor.submit(ingest_file, next_path)))
+
+                path, future = pending.popleft()
+                df = future.result()
+                ## Only the first file's signature is kept, not its rows
+                reference = self._signature(df) if reference is None else reference
+                self._check_schema(reference, df, path)
+
+                for offset in range(0, len(df), chunksize):
+                    chunk = df.iloc[offset:offset + chunksize]
+                    chunk.index = pd.RangeIndex(start, start + len(chunk))
+                    start += len(chunk)
+                    yield chunk
+
 
 class DataIngestorFactory:
     @staticmethod
-    def get_ingestor(file_extension: str) -> IngestData:
-        """Factory method to return the appropriate data ingestor"""
+    def get_ingestor(file_extension: str, multiple: bool = False, **kwargs) -> IngestData:
+        """Factory method to return the appropriate data ingestor, forwarding options to its constructor"""
+
+        ## Checking if many files are ingested at once
+        if multiple and file_extension in ('.zip', '.csv'):
+            return IngestMultipleCSVData(**kwargs)
         
-        ## Checking if the file is a .zip file
-        if file_extension == '.zip':        
-            return IngestCSVData()
+        ## Checking if the file is a .zip or .csv file
+        if file_extension in ('.zip', '.csv'):        
+            return IngestCSVData(**kwargs)
         else:
             raise ValueError(f"No ingestor available for file type {file_extension}")
 
@@ -64,7 +607,7 @@ class DataIngestorFactory:
 ## Example usage
 if __name__ == "__main__":
     # Construct the correct file path
-    file_path = os.path.abspath(os.path.join("..", "data", "archive.zip"))  # Move up one level to the project root
+    file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "archive.zip"))  # Move up one level to the project root
     
     # Check if the file exists
     if not os.path.exists(file_path):
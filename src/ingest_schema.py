@@ -0,0 +1,214 @@
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+## Persisted column schema applied while parsing
+# The schema is inferred once from a full parse and saved as JSON. Later ingests hand its dtypes
+# straight to the CSV parser, so low-cardinality strings are built as categoricals without an
+# intermediate object frame. Integer columns are recorded in the smallest type that fit the file the
+# schema was inferred from, but later files may hold larger values or missing ones. They are parsed
+# in the parser's own type (int64, or float64 with missing values) and downcast afterwards, when the
+# values fit the schema type.
+class IngestSchema:
+    def __init__(self, dtypes: dict, categories: dict = None):
+        """
+        Initializes the IngestSchema.
+
+        Parameters:
+        dtypes (dict): Mapping of column name to dtype name.
+        categories (dict): Mapping of categorical column name to its ordered list of categories.
+        """
+        self.dtypes = dtypes
+        self.categories = categories or {}
+
+    @classmethod
+    def infer(
+        cls, df: pd.DataFrame, max_category_ratio: float = 0.5, downcast_floats: bool = False
+    ) -> "IngestSchema":
+        """
+        Infers a compact schema from a parsed DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): A DataFrame parsed without a schema.
+        max_category_ratio (float): String columns with at most this share of distinct values become categoricals.
+        downcast_floats (bool): Store float columns as float32 instead of float64.
+
+        Returns:
+        IngestSchema: The inferred schema.
+        """
+        logging.info("Inferring ingest schema.")
+        dtypes, categories = {}, {}
+        for column in df.columns:
+            series = df[column]
+            if pd.api.types.is_integer_dtype(series):
+                dtypes[column] = str(pd.to_numeric(series, downcast="integer").dtype)
+            elif pd.api.types.is_float_dtype(series):
+                dtypes[column] = "float32" if downcast_floats else "float64"
+            elif (
+                (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series))
+                and series.nunique() <= max_category_ratio * len(series)
+            ):
+                dtypes[column] = "category"
+                categories[column] = sorted(series.dropna().unique().tolist())
+            else:
+                dtypes[column] = str(series.dtype)
+        return cls(dtypes, categories)
+
+    @classmethod
+    def load(cls, path: str) -> "IngestSchema":
+        """
+        Loads a schema saved with save().
+
+        Parameters:
+        path (str): The JSON file to read.
+
+        Returns:
+        IngestSchema: The loaded schema.
+        """
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str):
+        """
+        Saves the schema as JSON.
+
+        Parameters:
+        path (str): The JSON file to write.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved ingest schema to {path}.")
+
+    def to_dict(self) -> dict:
+        return {"dtypes": self.dtypes, "categories": self.categories}
+
+    def with_precision(self, precision: str) -> "IngestSchema":
+        """
+        Returns a copy of the schema whose float columns are parsed in the given precision.
+
+        Parameters:
+        precision (str): "float32" or "float64".
+
+        Returns:
+        IngestSchema: The schema with every float dtype replaced.
+        """
+        dtypes = {
+            column: precision if dtype in ("float32", "float64") else dtype for column, dtype in self.dtypes.items()
+        }
+        return IngestSchema(dtypes, self.categories)
+
+    def read_csv_dtypes(self) -> dict:
+        """
+        Returns the dtype mapping to pass to pd.read_csv. Integer columns are left to the parser.
+
+        Returns:
+        dict: Mapping of column name to dtype name.
+        """
+        return {column: dtype for column, dtype in self.dtypes.items() if not _is_integer(dtype)}
+
+    def arrow_column_types(self) -> dict:
+        """
+        Returns the column types to pass to the pyarrow CSV reader.
+
+        Categoricals are read as dictionary-encoded strings and object columns as strings. Integer
+        columns are left to the reader.
+
+        Returns:
+        dict: Mapping of column name to pyarrow type.
+        """
+        column_types = {}
+        for column, dtype in self.dtypes.items():
+            if _is_integer(dtype):
+                continue
+            if dtype == "category":
+                column_types[column] = pa.dictionary(pa.int32(), pa.string())
+            elif dtype in ("object", "string", "str"):
+                column_types[column] = pa.string()
+            else:
+                column_types[column] = pa.from_numpy_dtype(np.dtype(dtype))
+        return column_types
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aligns the categoricals of a frame parsed with read_csv_dtypes() to the schema.
+
+        Categories are put in schema order so chunks and repeated ingests share the same codes.
+        Values unseen at inference time are kept, appended after the known categories. Integer
+        columns are downcast with downcast_integers().
+
+        Parameters:
+        df (pd.DataFrame): A frame parsed with read_csv_dtypes(), or any frame to cast to the schema.
+
+        Returns:
+        pd.DataFrame: The frame with schema dtypes and aligned categories.
+        """
+        mismatched = {
+            column: dtype for column, dtype in self.dtypes.items()
+            if column in df.columns and str(df[column].dtype) != dtype and not _is_integer(dtype)
+        }
+        if mismatched:
+            df = df.astype(mismatched)
+        return self.align_categories(self.downcast_integers(df))
+
+    def downcast_integers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts the schema's integer columns to their schema types where the parsed values fit.
+
+        Columns with missing values or values outside the schema type keep their parsed type (float64
+        for missing values in NumPy columns). Arrow-backed columns are cast to the Arrow type of the same width.
+
+        Parameters:
+        df (pd.DataFrame): A frame parsed with read_csv_dtypes() or arrow_column_types().
+
+        Returns:
+        pd.DataFrame: The frame with downcast integer columns.
+        """
+        for column, dtype in self.dtypes.items():
+            if column not in df.columns or not _is_integer(dtype):
+                continue
+            series = df[column]
+            target = np.dtype(dtype)
+            if isinstance(series.dtype, pd.ArrowDtype):
+                target = pd.ArrowDtype(pa.from_numpy_dtype(target))
+            if series.dtype == target:
+                continue
+            if not pd.api.types.is_integer_dtype(series) or series.hasnans:
+                logging.info(f"Column '{column}' has missing or non-integer values; kept as {series.dtype}.")
+                continue
+            info = np.iinfo(dtype)
+            if len(series) and (series.min() < info.min or series.max() > info.max):
+                logging.info(f"Column '{column}' has values outside {dtype}; kept as {series.dtype}.")
+                continue
+            df[column] = series.astype(target)
+        return df
+
+    def align_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Puts the categories of the schema's categorical columns in schema order, leaving other dtypes as they are.
+
+        Parameters:
+        df (pd.DataFrame): A frame whose categorical columns should share the schema's codes.
+
+        Returns:
+        pd.DataFrame: The frame with aligned categories.
+        """
+        for column, known in self.categories.items():
+            if column not in df.columns:
+                continue
+            unseen = df[column].cat.categories.difference(known).tolist()
+            if unseen:
+                logging.warning(f"Column '{column}' has categories missing from the schema: {unseen}")
+            df[column] = df[column].cat.set_categories(known + unseen)
+        return df
+
+
+def _is_integer(dtype: str) -> bool:
+    """Whether a schema dtype name is a NumPy integer type"""
+    return dtype.startswith(("int", "uint"))
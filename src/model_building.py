@@ -1,12 +1,16 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+from src.precision import cast_columns, float_dtype
+from src.sparse_frames import frame_to_csr, sparse_columns
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -31,6 +35,17 @@ class ModelBuildingStrategy(ABC):
 
 # Concrete Strategy for Linear Regression using scikit-learn
 class LinearRegressionStrategy(ModelBuildingStrategy):
+    def __init__(self, precision: Optional[str] = None):
+        """
+        Initializes the LinearRegressionStrategy.
+
+        Parameters:
+        precision (str): Fit in "float32" or "float64": numeric features and the target are cast first,
+            and scaling and the least-squares solve run in that type. None fits in float64.
+        """
+        float_dtype(precision)  ## Validates the precision
+        self.precision = precision
+
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
         """
         Builds and trains a linear regression model using scikit-learn.
@@ -49,14 +64,30 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
             raise TypeError("y_train must be a pandas Series.")
 
         logging.info("Initializing Linear Regression model with scaling.")
-
-        # Creating a pipeline with standard scaling and linear regression
-        pipeline = Pipeline(
-            [
-                ("scaler", StandardScaler()),  # Feature scaling
-                ("model", LinearRegression()),  # Linear regression model
-            ]
-        )
+        dtype = float_dtype(self.precision) or np.dtype("float64")
+        if self.precision is not None:
+            X_train = cast_columns(X_train, self.precision, integers=True)
+            y_train = y_train.astype(dtype)
+
+        if sparse_columns(X_train):
+            ## Sparse-backed columns (e.g. sparse one-hot indicators) stay sparse: the frame becomes a CSR
+            ## matrix, scaling skips centering (which would densify it) and the intercept absorbs the means
+            logging.info("Training on a sparse matrix built from the sparse-backed columns.")
+            pipeline = Pipeline(
+                [
+                    ("to_csr", FunctionTransformer(frame_to_csr, accept_sparse=True, kw_args={"dtype": dtype})),
+                    ("scaler", StandardScaler(with_mean=False)),
+                    ("model", LinearRegression()),
+                ]
+            )
+        else:
+            # Creating a pipeline with standard scaling and linear regression
+            pipeline = Pipeline(
+                [
+                    ("scaler", StandardScaler()),  # Feature scaling
+                    ("model", LinearRegression()),  # Linear regression model
+                ]
+            )
 
         logging.info("Training Linear Regression model.")
         pipeline.fit(X_train, y_train)  # Fit the pipeline to the training data
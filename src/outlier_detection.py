@@ -1,16 +1,146 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from scipy.stats import chi2
+from sklearn.covariance import MinCovDet
+from sklearn.ensemble import IsolationForest
+
+from src.chunked_data import ChunkedData
+from src.column_stats import ColumnStats, is_numeric_column
+from src.frame_buffers import write_column
+from src.sketches import QuantileSketch, RunningMoments
+from src.transform_cache import TransformCache
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+## Result of one outlier detection pass
+# Holds which rows contain outliers as a bitmask packed eight rows to a byte, and the lower and upper
+# fence of every column. Removing outliers drops the flagged rows and capping clips every column to
+# its fences, so both reuse one detection pass, and the result of a 1M-row frame takes 125 kB
+# instead of a rows x columns boolean frame.
+class OutlierDetectionResult:
+    def __init__(self, row_bits: np.ndarray, n_rows: int, lower: pd.Series, upper: pd.Series):
+        """
+        Initializes the OutlierDetectionResult.
+
+        Parameters:
+        row_bits (np.ndarray): The outlier flags of the rows, packed with np.packbits().
+        n_rows (int): The number of rows detection ran on.
+        lower (pd.Series): The lower fence of every column, NaN for none.
+        upper (pd.Series): The upper fence of every column, NaN for none.
+        """
+        self.row_bits = row_bits
+        self.n_rows = n_rows
+        self.lower = lower
+        self.upper = upper
+
+    @classmethod
+    def from_rows(cls, outlier_rows: np.ndarray, lower: pd.Series, upper: pd.Series) -> "OutlierDetectionResult":
+        """
+        Packs boolean row flags into a result.
+
+        Parameters:
+        outlier_rows (np.ndarray): True for every row containing an outlier.
+        lower (pd.Series): The lower fence of every column.
+        upper (pd.Series): The upper fence of every column.
+
+        Returns:
+        OutlierDetectionResult: The result.
+        """
+        return cls(np.packbits(outlier_rows), len(outlier_rows), lower, upper)
+
+    @classmethod
+    def from_column_outliers(
+        cls, column_outliers: Iterable[Tuple[str, np.ndarray]], n_rows: int, lower: pd.Series, upper: pd.Series
+    ) -> "OutlierDetectionResult":
+        """
+        Builds a result from per-column outlier flags, consumed one column at a time.
+
+        Parameters:
+        column_outliers (Iterable): Pairs of a column name and its boolean outlier flags.
+        n_rows (int): The number of rows.
+        lower (pd.Series): The lower fence of every column.
+        upper (pd.Series): The upper fence of every column.
+
+        Returns:
+        OutlierDetectionResult: The result.
+        """
+        outlier_rows = np.zeros(n_rows, dtype=bool)
+        for _, flags in column_outliers:
+            outlier_rows |= _as_flags(flags)
+        return cls.from_rows(outlier_rows, lower, upper)
+
+    @property
+    def outlier_rows(self) -> np.ndarray:
+        """True for every row containing an outlier"""
+        return np.unpackbits(self.row_bits, count=self.n_rows).view(bool)
+
+    @property
+    def n_outliers(self) -> int:
+        return int(np.unpackbits(self.row_bits, count=self.n_rows).sum())
+
+    def _check(self, df: pd.DataFrame):
+        if len(df) != self.n_rows:
+            raise ValueError(f"The detection result covers {self.n_rows} rows, the frame has {len(df)}.")
+
+    def remove(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drops the rows containing outliers.
+
+        Parameters:
+        df (pd.DataFrame): The frame detection ran on.
+
+        Returns:
+        pd.DataFrame: The rows without outliers. df itself when there are none.
+        """
+        self._check(df)
+        if self.n_outliers == 0:
+            return df
+        return df[~self.outlier_rows]
+
+    def cap(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Clips every column with fences to them.
+
+        Parameters:
+        df (pd.DataFrame): The frame detection ran on.
+        inplace (bool): Write into df's column buffers instead of a shallow copy's columns.
+
+        Returns:
+        pd.DataFrame: The capped frame.
+        """
+        self._check(df)
+        df_capped = df if inplace else df.copy(deep=False)
+        ## Column by column, so only one clipped column is allocated at a time
+        for column in df.columns:
+            if column not in self.lower.index:
+                continue
+            lower, upper = self.lower[column], self.upper[column]
+            if pd.isna(lower) and pd.isna(upper):
+                continue
+            clipped = df[column].clip(None if pd.isna(lower) else lower, None if pd.isna(upper) else upper)
+            if inplace:
+                write_column(df_capped, column, clipped.to_numpy())
+            else:
+                df_capped[column] = clipped
+        return df_capped
+
+
 # Abstract Base Class for Outlier Detection Strategy
 class OutlierDetectionStrategy(ABC):
+    ## Part of the transform cache key: bump it in a class whenever a change alters that class's results.
+    ## 2: capping clips to the strategy's fences instead of the 1%/99% quantiles
+    cache_version = 2
+
     @abstractmethod
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -24,60 +154,525 @@ class OutlierDetectionStrategy(ABC):
         """
         pass
 
+    def detect(self, df: pd.DataFrame) -> OutlierDetectionResult:
+        """
+        Detects outliers once, for removal and capping.
+
+        Strategies override this to avoid the boolean dataframe of detect_outliers(). By default the
+        rows with any outlier are flagged and each numeric column is fenced by its non-outlier values.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features for outlier detection.
+
+        Returns:
+        OutlierDetectionResult: The outlier rows and the column fences.
+        """
+        outliers = self.detect_outliers(df)
+        lower, upper = _inlier_range(df, lambda column: _as_flags(outliers[column]))
+        return OutlierDetectionResult.from_rows(outliers.any(axis=1).to_numpy(), lower, upper)
+
+    def chunk_detector(self, chunks: ChunkedData) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """
+        Learns the detection statistics in one pass over the chunks.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features for outlier detection.
+
+        Returns:
+        Callable: A function returning the boolean outlier dataframe for a single chunk.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support chunked outlier detection.")
+
 
 # Concrete Strategy for Z-Score Based Outlier Detection
 class ZScoreOutlierDetection(OutlierDetectionStrategy):
-    def __init__(self, threshold=3):
+    def __init__(self, threshold=3, n_jobs=1):
+        """
+        Initializes the ZScoreOutlierDetection.
+
+        Parameters:
+        threshold (float): Values more than this many standard deviations from the mean are outliers.
+        n_jobs (int): Threads folding chunks into the running moments in fit_chunks().
+        """
         self.threshold = threshold
+        self.n_jobs = n_jobs
+
+    def _statistics(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        stats = ColumnStats.for_frame(df)
+        mean = stats.mean(df.columns) if stats else df.mean()
+        std = stats.std(df.columns) if stats else df.std()
+        return mean, std
+
+    def _column_outliers(self, df: pd.DataFrame, mean: pd.Series, std: pd.Series) -> Iterator[tuple]:
+        ## Column by column, so float32 columns are scored in float32 and no full-frame float64
+        ## temporaries are allocated
+        for column in df.columns:
+            series = df[column]
+            if not (isinstance(series.dtype, np.dtype) and series.dtype.kind in "fiu"):
+                yield column, np.abs((series - mean[column]) / std[column]) > self.threshold
+                continue
+            dtype = series.dtype if series.dtype.kind == "f" else np.dtype("float64")
+            z_scores = np.subtract(series.to_numpy(), mean[column], dtype=dtype)
+            np.divide(z_scores, std[column], out=z_scores, dtype=dtype)
+            np.abs(z_scores, out=z_scores)
+            yield column, z_scores > self.threshold
 
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using the Z-score method.")
-        z_scores = np.abs((df - df.mean()) / df.std())
-        outliers = z_scores > self.threshold
+        mean, std = self._statistics(df)
+        outliers = pd.DataFrame(dict(self._column_outliers(df, mean, std)), index=df.index, columns=df.columns)
         logging.info(f"Outliers detected with Z-score threshold: {self.threshold}.")
         return outliers
 
+    def detect(self, df: pd.DataFrame) -> OutlierDetectionResult:
+        logging.info("Detecting outlier rows using the Z-score method.")
+        mean, std = self._statistics(df)
+        ## The fences are the values threshold standard deviations from the mean
+        result = OutlierDetectionResult.from_column_outliers(
+            self._column_outliers(df, mean, std), len(df),
+            lower=mean - self.threshold * std, upper=mean + self.threshold * std,
+        )
+        logging.info(f"Outliers detected in {result.n_outliers} rows with Z-score threshold: {self.threshold}.")
+        return result
+
+    def fit_chunks(self, chunks: ChunkedData) -> "ZScoreOutlierDetection":
+        """
+        Learns the mean and standard deviation of every numeric column in one pass over the chunks.
+
+        The chunks are folded into Welford running moments, which are merged across threads, so the
+        statistics match DataFrame.mean() and DataFrame.std() up to rounding for data of any size.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features for outlier detection.
+
+        Returns:
+        ZScoreOutlierDetection: The fitted strategy.
+        """
+        logging.info("Computing Z-score statistics over chunks.")
+        sketches = chunks.fold(lambda: _ColumnSketches(RunningMoments), _ColumnSketches.update, self.n_jobs)
+        self.mean_ = {column: moments.mean for column, moments in sketches.columns.items()}
+        ## Sample standard deviation, matching DataFrame.std()
+        self.std_ = {column: moments.std() for column, moments in sketches.columns.items()}
+        return self
+
+    def chunk_detector(self, chunks: ChunkedData) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        self.fit_chunks(chunks)
+        return lambda chunk: _chunk_outliers(
+            chunk, self.mean_,
+            lambda column, values: np.abs((values - self.mean_[column]) / self.std_[column]) > self.threshold,
+        )
+
 
 # Concrete Strategy for IQR Based Outlier Detection
 class IQROutlierDetection(OutlierDetectionStrategy):
+    def __init__(self, quantile_k=4096, n_jobs=1):
+        """
+        Initializes the IQROutlierDetection.
+
+        Parameters:
+        quantile_k (int): Level size of the quantile sketches in fit_chunks(). The quartiles are exact
+            up to this many values per column.
+        n_jobs (int): Threads folding chunks into the quantile sketches in fit_chunks().
+        """
+        self.quantile_k = quantile_k
+        self.n_jobs = n_jobs
+
+    def _fences(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        stats = ColumnStats.for_frame(df)
+        Q1 = stats.quantile(0.25, df.columns) if stats else df.quantile(0.25)
+        Q3 = stats.quantile(0.75, df.columns) if stats else df.quantile(0.75)
+        IQR = Q3 - Q1
+        return Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
+
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using the IQR method.")
-        Q1 = df.quantile(0.25)
-        Q3 = df.quantile(0.75)
-        IQR = Q3 - Q1
-        outliers = (df < (Q1 - 1.5 * IQR)) | (df > (Q3 + 1.5 * IQR))
+        lower, upper = self._fences(df)
+        outliers = (df < lower) | (df > upper)
         logging.info("Outliers detected using the IQR method.")
         return outliers
 
+    def detect(self, df: pd.DataFrame) -> OutlierDetectionResult:
+        logging.info("Detecting outlier rows using the IQR method.")
+        lower, upper = self._fences(df)
+        ## Column by column, so no boolean frame of the size of df is allocated
+        result = OutlierDetectionResult.from_column_outliers(
+            ((column, (df[column] < lower[column]) | (df[column] > upper[column])) for column in df.columns),
+            len(df), lower, upper,
+        )
+        logging.info(f"Outliers detected in {result.n_outliers} rows using the IQR method.")
+        return result
+
+    def fit_chunks(self, chunks: ChunkedData) -> "IQROutlierDetection":
+        """
+        Learns the IQR fences of every numeric column in one pass over the chunks.
+
+        The chunks are folded into KLL quantile sketches, which are merged across threads. Beyond
+        quantile_k values per column the quartiles are approximate, with a rank error on the order of
+        log(n / quantile_k) / quantile_k.
+
+        Parameters:
+        chunks (ChunkedData): The chunk stream containing features for outlier detection.
+
+        Returns:
+        IQROutlierDetection: The fitted strategy.
+        """
+        logging.info("Computing IQR fences over chunks.")
+        sketches = chunks.fold(
+            lambda: _ColumnSketches(lambda: QuantileSketch(self.quantile_k)), _ColumnSketches.update, self.n_jobs
+        )
+        self.lower_, self.upper_ = {}, {}
+        for column, sketch in sketches.columns.items():
+            Q1, Q3 = sketch.quantile([0.25, 0.75])
+            IQR = Q3 - Q1
+            self.lower_[column] = float(Q1 - 1.5 * IQR)
+            self.upper_[column] = float(Q3 + 1.5 * IQR)
+        return self
+
+    def chunk_detector(self, chunks: ChunkedData) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        self.fit_chunks(chunks)
+        return lambda chunk: _chunk_outliers(
+            chunk, self.lower_,
+            lambda column, values: (values < self.lower_[column]) | (values > self.upper_[column]),
+        )
+
+
+# Abstract Base Class for Row-Level (Multivariate) Outlier Detection
+# The cell-wise detectors flag every extreme value, and removing each row with any flagged cell
+# discards far too many rows once there are dozens of features. These strategies score each row over
+# all its numeric features together and flag the rows whose score exceeds a cutoff learned by fit();
+# every cell of a flagged row is reported as an outlier. The model is learned from a sample of at most
+# max_fit_rows rows. Rows are scored in batches of batch_size rows, spread over n_jobs worker processes
+# that each receive the fitted strategy once. Missing values are replaced by the fitted column medians.
+class RowOutlierDetectionStrategy(OutlierDetectionStrategy):
+    def __init__(self, features=None, batch_size=50_000, n_jobs=-1, max_fit_rows=100_000, random_state=0):
+        """
+        Initializes the RowOutlierDetectionStrategy.
+
+        Parameters:
+        features (list): The numeric columns rows are scored on. All numeric columns when None.
+        batch_size (int): The number of rows scored at a time.
+        n_jobs (int): Worker processes scoring the batches. -1 or None uses all cores, 1 scores in this process.
+        max_fit_rows (int): Learn from a sample of at most this many rows. All rows when None.
+        random_state (int): Seed of the row sample and of the model.
+        """
+        self.features = features
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.max_fit_rows = max_fit_rows
+        self.random_state = random_state
+        self.columns_ = None
+
+    @abstractmethod
+    def _fit_matrix(self, X: np.ndarray):
+        """Learns the model and the score cutoff threshold_ from a complete float64 matrix"""
+        pass
+
+    @abstractmethod
+    def _score_matrix(self, X: np.ndarray) -> np.ndarray:
+        """Scores the rows of a complete float64 matrix; higher scores are more outlying"""
+        pass
+
+    def fit(self, df: pd.DataFrame) -> "RowOutlierDetectionStrategy":
+        """
+        Learns the row model from (a sample of) the rows of df.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features for outlier detection.
+
+        Returns:
+        RowOutlierDetectionStrategy: The fitted strategy.
+        """
+        columns = self.features if self.features is not None else [
+            column for column in df.columns if is_numeric_column(df[column])
+        ]
+        if not columns:
+            raise ValueError(f"{type(self).__name__} needs at least one numeric column.")
+        rows = np.arange(len(df))
+        if self.max_fit_rows is not None and len(df) > self.max_fit_rows:
+            rng = np.random.default_rng(self.random_state)
+            rows = np.sort(rng.choice(len(df), self.max_fit_rows, replace=False))
+
+        X = _row_matrix(df, columns, rows)
+        with np.errstate(all="ignore"):
+            medians = np.nanmedian(X, axis=0) if len(X) else np.zeros(len(columns))
+        self.columns_ = list(columns)
+        self.medians_ = np.where(np.isnan(medians), 0.0, medians)
+        self._fit_matrix(self._fill(X))
+        logging.info(f"Fitted {type(self).__name__} on {len(rows)} rows over {len(columns)} columns.")
+        return self
+
+    def _fill(self, X: np.ndarray) -> np.ndarray:
+        missing = np.isnan(X)
+        if missing.any():
+            X[missing] = np.take(self.medians_, np.nonzero(missing)[1])
+        return X
+
+    def _batches(self, df: pd.DataFrame) -> Iterator[np.ndarray]:
+        for start in range(0, len(df), self.batch_size):
+            yield self._fill(_row_matrix(df, self.columns_, slice(start, start + self.batch_size)))
+
+    def score_samples(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Scores every row of df; rows scoring above threshold_ are outliers.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to score, with the fitted columns.
+
+        Returns:
+        pd.Series: The row scores, indexed like df. Higher scores are more outlying.
+        """
+        if self.columns_ is None:
+            raise ValueError(f"{type(self).__name__} must be fitted before score_samples() is called.")
+        n_jobs = (os.cpu_count() or 1) if self.n_jobs in (None, -1) else max(self.n_jobs, 1)
+        n_jobs = min(n_jobs, -(-len(df) // self.batch_size))
+        if n_jobs <= 1:
+            scores = [self._score_matrix(batch) for batch in self._batches(df)]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_scoring_worker, initargs=(self,)
+            ) as executor:
+                pending, scores = deque(), []
+                for batch in self._batches(df):
+                    pending.append(executor.submit(_score_in_worker, batch))
+                    ## Keeping two batches per worker in flight bounds the batches held in memory
+                    if len(pending) >= 2 * n_jobs:
+                        scores.append(pending.popleft().result())
+                scores.extend(future.result() for future in pending)
+        scores = np.concatenate(scores) if scores else np.empty(0)
+        return pd.Series(scores, index=df.index, name="outlier_score")
+
+    def _outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info(f"Detecting outlier rows using {type(self).__name__}.")
+        outlier_rows = self.fit(df).score_samples(df).to_numpy() > self.threshold_
+        logging.info(f"Flagged {int(outlier_rows.sum())} of {len(df)} rows as outliers.")
+        return outlier_rows
+
+    def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
+        outlier_rows = self._outlier_rows(df)
+        return pd.DataFrame(
+            np.repeat(outlier_rows[:, None], df.shape[1], axis=1), index=df.index, columns=df.columns
+        )
+
+    def detect(self, df: pd.DataFrame) -> OutlierDetectionResult:
+        ## Rows have no per-column fences; capping clips each column to the range of the inlier rows
+        outlier_rows = self._outlier_rows(df)
+        lower, upper = _inlier_range(df, lambda column: outlier_rows)
+        return OutlierDetectionResult.from_rows(outlier_rows, lower, upper)
+
+
+# Concrete Strategy for Isolation Forest Outlier Detection
+# Random trees, each grown on a subsample of max_samples rows, isolate a row by splitting on random
+# features at random thresholds; outliers are isolated in fewer splits. The row score is the anomaly
+# score of the original paper, between 0 and 1, and rows above 0.5 are outliers unless a
+# contamination fraction is given. Trees are built on n_jobs threads.
+class IsolationForestOutlierDetection(RowOutlierDetectionStrategy):
+    def __init__(self, n_estimators=100, max_samples=256, contamination="auto", **kwargs):
+        """
+        Initializes the IsolationForestOutlierDetection.
+
+        Parameters:
+        n_estimators (int): The number of trees.
+        max_samples (int): The rows subsampled for each tree.
+        contamination (float or str): The expected fraction of outliers, which sets the cutoff, or
+            "auto" for the cutoff of the original paper.
+        kwargs: Batching, parallelism and sampling options of RowOutlierDetectionStrategy.
+        """
+        super().__init__(**kwargs)
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        self.contamination = contamination
+
+    def _fit_matrix(self, X: np.ndarray):
+        self._model = IsolationForest(
+            n_estimators=self.n_estimators,
+            max_samples=min(self.max_samples, len(X)),
+            contamination=self.contamination,
+            n_jobs=self.n_jobs,
+            random_state=self.random_state,
+        ).fit(X)
+        self.threshold_ = float(-self._model.offset_)
+
+    def _score_matrix(self, X: np.ndarray) -> np.ndarray:
+        return -self._model.score_samples(X)
+
+
+# Concrete Strategy for Robust Mahalanobis Distance Outlier Detection
+# The location and covariance of the rows are estimated with the Minimum Covariance Determinant,
+# which fits the most concentrated subset of the rows and so is not dragged by the outliers it is
+# meant to find. The row score is the squared Mahalanobis distance under that fit. For normally
+# distributed rows it follows a chi-squared distribution with one degree of freedom per feature, and
+# rows above its `quantile` quantile are outliers.
+class RobustMahalanobisOutlierDetection(RowOutlierDetectionStrategy):
+    def __init__(self, quantile=0.975, support_fraction=None, **kwargs):
+        """
+        Initializes the RobustMahalanobisOutlierDetection.
+
+        Parameters:
+        quantile (float): The chi-squared quantile used as the cutoff.
+        support_fraction (float): The fraction of rows the covariance is fitted on. None uses
+            scikit-learn's default of (n_rows + n_features + 1) / 2 rows.
+        kwargs: Batching, parallelism and sampling options of RowOutlierDetectionStrategy.
+        """
+        super().__init__(**kwargs)
+        if not 0 < quantile < 1:
+            raise ValueError(f"quantile must be between 0 and 1, got {quantile}.")
+        self.quantile = quantile
+        self.support_fraction = support_fraction
+
+    def _fit_matrix(self, X: np.ndarray):
+        mcd = MinCovDet(support_fraction=self.support_fraction, random_state=self.random_state).fit(X)
+        self.location_ = mcd.location_
+        self.precision_ = mcd.get_precision()
+        self.threshold_ = float(chi2.ppf(self.quantile, X.shape[1]))
+
+    def _score_matrix(self, X: np.ndarray) -> np.ndarray:
+        centered = X - self.location_
+        return np.sum((centered @ self.precision_) * centered, axis=1)
+
+
+def _as_flags(flags) -> np.ndarray:
+    """Outlier flags as a boolean array; missing values, which pandas comparisons may keep, are not outliers"""
+    if isinstance(flags, np.ndarray) and flags.dtype == bool:
+        return flags
+    return pd.Series(flags).to_numpy(dtype=bool, na_value=False)
+
+
+def _inlier_range(df: pd.DataFrame, outliers_of: Callable[[str], np.ndarray]) -> Tuple[pd.Series, pd.Series]:
+    """The smallest and largest non-outlier value of every numeric column, NaN when it has none"""
+    lower, upper = {}, {}
+    for column in df.columns:
+        if not is_numeric_column(df[column]):
+            continue
+        values = df[column].to_numpy(dtype="float64", na_value=np.nan)[~outliers_of(column)]
+        values = values[~np.isnan(values)]
+        lower[column] = values.min() if len(values) else np.nan
+        upper[column] = values.max() if len(values) else np.nan
+    return pd.Series(lower, dtype="float64"), pd.Series(upper, dtype="float64")
+
+
+def _row_matrix(df: pd.DataFrame, columns: list, rows) -> np.ndarray:
+    """The given rows (positions or a slice) of the given columns as a float64 matrix, with NaN for missing values"""
+    return np.column_stack([df[column].iloc[rows].to_numpy(dtype="float64", na_value=np.nan) for column in columns])
+
+
+## The fitted strategy of a scoring worker process, sent once when the worker starts
+_scoring_strategy = None
+
+
+def _init_scoring_worker(strategy: RowOutlierDetectionStrategy):
+    global _scoring_strategy
+    _scoring_strategy = strategy
+
+
+def _score_in_worker(X: np.ndarray) -> np.ndarray:
+    return _scoring_strategy._score_matrix(X)
+
+
+## Per-column sketches of the numeric columns, folded over chunks
+# One object per thread of ChunkedData.fold(); the objects are merged when every chunk is folded in.
+class _ColumnSketches:
+    def __init__(self, new_sketch: Callable[[], object]):
+        self._new_sketch = new_sketch
+        self.columns = {}
+
+    def update(self, chunk: pd.DataFrame):
+        for column in chunk.columns:
+            if not is_numeric_column(chunk[column]):
+                continue
+            if column not in self.columns:
+                self.columns[column] = self._new_sketch()
+            self.columns[column].update(chunk[column].to_numpy(dtype="float64", na_value=np.nan))
+
+    def merge(self, other: "_ColumnSketches"):
+        for column, sketch in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(sketch)
+            else:
+                self.columns[column] = sketch
+
+
+def _chunk_outliers(
+    chunk: pd.DataFrame, fitted: dict, is_outlier: Callable[[str, np.ndarray], np.ndarray]
+) -> pd.DataFrame:
+    """Flags the outliers of one chunk in the fitted columns; missing values are never outliers"""
+    columns = [column for column in chunk.columns if column in fitted]
+    ## Constant columns divide by a zero standard deviation, as in DataFrame arithmetic, without warnings
+    with np.errstate(divide="ignore", invalid="ignore"):
+        outliers = {
+            column: is_outlier(column, chunk[column].to_numpy(dtype="float64", na_value=np.nan))
+            for column in columns
+        }
+    return pd.DataFrame(outliers, index=chunk.index, columns=columns)
+
 
 # Context Class for Outlier Detection and Handling
 class OutlierDetector:
-    def __init__(self, strategy: OutlierDetectionStrategy):
+    def __init__(self, strategy: OutlierDetectionStrategy, inplace: bool = False, cache: TransformCache = None):
+        ## With inplace, capping writes into the input frame's column buffers instead of a copy
         self._strategy = strategy
+        self.inplace = inplace
+        ## With a cache, results for a frame with unchanged contents and the same strategy are reused
+        self.cache = cache
 
     def set_strategy(self, strategy: OutlierDetectionStrategy):
         logging.info("Switching outlier detection strategy.")
         self._strategy = strategy
 
+    def detect(self, df: pd.DataFrame) -> OutlierDetectionResult:
+        logging.info("Executing outlier detection strategy.")
+        return self._strategy.detect(df)
+
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Executing outlier detection strategy.")
+        if self.cache is not None:
+            return self.cache.apply(df, "detect_outliers", self._strategy, self._strategy.detect_outliers)
         return self._strategy.detect_outliers(df)
 
-    def handle_outliers(self, df: pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        outliers = self.detect_outliers(df)
+    def handle_outliers(self, df: pd.DataFrame, method="remove", columns=None, **kwargs) -> pd.DataFrame:
+        ## With columns, only those columns are checked, and the rows are removed from (or the columns
+        ## capped in) the whole frame, so columns of any other type are kept
+        if columns is not None:
+            missing = [column for column in columns if column not in df.columns]
+            if missing:
+                raise ValueError(f"Columns {missing} do not exist in the DataFrame.")
+            ## Categorical, text and boolean columns have no mean or quantiles to put fences at
+            non_numeric = [column for column in columns if not is_numeric_column(df[column])]
+            if non_numeric:
+                raise ValueError(f"Outliers can only be detected in numeric columns; {non_numeric} are not numeric.")
+            columns = list(columns)
+        if self.cache is not None:
+            return self.cache.apply(
+                df, "handle_outliers", self._strategy, lambda frame: self._handle_outliers(frame, method, columns),
+                options={"method": method, "columns": columns},
+            )
+        return self._handle_outliers(df, method, columns)
+
+    def _handle_outliers(self, df: pd.DataFrame, method: str, columns=None) -> pd.DataFrame:
+        if method not in ("remove", "cap"):
+            logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
+            return df
+
+        ## One detection pass serves both methods
+        if columns is not None:
+            logging.info(f"Detecting outliers in columns {columns} only.")
+        result = self._strategy.detect(df if columns is None else df[columns])
         if method == "remove":
             logging.info("Removing outliers from the dataset.")
-            df_cleaned = df[(~outliers).all(axis=1)]
-        elif method == "cap":
-            logging.info("Capping outliers in the dataset.")
-            df_cleaned = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=1)
+            df_cleaned = result.remove(df)
         else:
-            logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
-            return df
+            logging.info("Capping outliers in the dataset.")
+            df_cleaned = result.cap(df, inplace=self.inplace)
 
         logging.info("Outlier handling completed.")
         return df_cleaned
 
+    def handle_outliers_chunks(self, chunks: ChunkedData, method="remove") -> ChunkedData:
+        if method != "remove":
+            raise ValueError(f"Outlier handling method '{method}' is not supported on chunks.")
+        detector = self._strategy.chunk_detector(chunks)
+        logging.info("Removing outliers from the chunk stream.")
+        return chunks.map(lambda chunk: chunk[(~detector(chunk)).all(axis=1)])
+
     def visualize_outliers(self, df: pd.DataFrame, features: list):
         logging.info(f"Visualizing outliers for features: {features}")
         for feature in features:
@@ -91,7 +686,7 @@ class OutlierDetector:
 # Example usage
 if __name__ == "__main__":
     # # Example dataframe
-    df = pd.read_csv("../extracted_data/AmesHousing.csv")
+    df = pd.read_csv("../data/archive.zip")
     df_numeric = df.select_dtypes(include=[np.number]).dropna()
 
     # # Initialize the OutlierDetector with the Z-Score based Outlier Detection Strategy
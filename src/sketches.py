@@ -0,0 +1,292 @@
+import numpy as np
+import pandas as pd
+
+
+## Mergeable, bounded-memory summaries of a column
+# Every sketch is updated with whole arrays (one vectorized call per chunk) and can be merged with
+# another sketch of the same kind, so statistics can be accumulated over chunks or computed in
+# parallel over shards and combined afterwards.
+
+
+## Running count, mean, variance, min and max
+# Chunks are folded in with Chan et al.'s parallel form of Welford's algorithm, which stays
+# numerically stable where accumulating sum and sum of squares would cancel.
+class RunningMoments:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, values: np.ndarray):
+        """
+        Folds a batch of values into the moments. Missing values are ignored.
+
+        Parameters:
+        values (np.ndarray): The numeric values to add.
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        batch = RunningMoments()
+        batch.count = len(values)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other: "RunningMoments"):
+        """
+        Merges another set of moments into this one.
+
+        Parameters:
+        other (RunningMoments): The moments to merge.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def sum(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def sumsq(self) -> float:
+        return self.m2 + self.count * self.mean**2
+
+    def variance(self, ddof: int = 1) -> float:
+        return self.m2 / (self.count - ddof) if self.count > ddof else np.nan
+
+    def std(self, ddof: int = 1) -> float:
+        return float(np.sqrt(self.variance(ddof)))
+
+
+## KLL-style quantile sketch
+# Values are buffered in level 0. Whenever a level holds more than k items it is sorted and every
+# other item, starting at a random offset, is promoted to the next level with twice the weight.
+# The sketch is exact (and matches pandas' linear interpolation) until more than k values are seen;
+# beyond that the rank error is on the order of log(n / k) / k.
+class QuantileSketch:
+    def __init__(self, k: int = 4096, seed: int = None):
+        """
+        Initializes the QuantileSketch.
+
+        Parameters:
+        k (int): The number of items each level holds before it is compacted.
+        seed (int): Seed for the random compaction offsets.
+        """
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """
+        Adds a batch of values to the sketch. Missing values are ignored.
+
+        Parameters:
+        values (np.ndarray): The numeric values to add.
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compact()
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merges another sketch into this one.
+
+        Parameters:
+        other (QuantileSketch): The sketch to merge.
+        """
+        self.n += other.n
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compact()
+
+    def _compact(self):
+        level, presorted = 0, False
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = items if presorted else np.sort(items)
+                ## An odd item out stays behind, so promoted pairs never straddle levels
+                keep, pairs = items[: len(items) % 2], items[len(items) % 2:]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                ## Promoting into an empty level keeps the items sorted, so a large batch is sorted only once
+                presorted = len(self.levels[level + 1]) == 0
+                self.levels[level + 1] = promoted if presorted else np.concatenate([self.levels[level + 1], promoted])
+            else:
+                presorted = False
+            level += 1
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def quantile(self, q):
+        """
+        Estimates one or more quantiles.
+
+        Parameters:
+        q (float or array-like): The quantiles to estimate, between 0 and 1.
+
+        Returns:
+        float or np.ndarray: The estimated quantiles. NaN when the sketch is empty.
+        """
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        if self.is_exact:
+            return np.quantile(self.levels[0], q)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 2**level) for level, level_items in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        ranks = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1], side="left")
+        return items[order][np.minimum(ranks, len(items) - 1)]
+
+
+## Misra-Gries heavy hitters
+# Keeps at most `capacity` counters. While the number of distinct values stays within capacity every
+# count is exact; past that, counts are underestimated by at most n / (capacity + 1), and every value
+# more frequent than that is guaranteed to be kept.
+class HeavyHitters:
+    def __init__(self, capacity: int = 256):
+        """
+        Initializes the HeavyHitters sketch.
+
+        Parameters:
+        capacity (int): The maximum number of counters kept.
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.is_exact = True
+
+    def update(self, values: pd.Series):
+        """
+        Adds a batch of values. Missing values are ignored.
+
+        Parameters:
+        values (pd.Series): The values to count.
+        """
+        counts = pd.Series(values).value_counts(dropna=True)
+        ## Categoricals report unused categories with a zero count and a CategoricalIndex
+        counts = counts[counts > 0]
+        counts.index = pd.Index(np.asarray(counts.index))
+        self._add(counts)
+
+    def merge(self, other: "HeavyHitters"):
+        """
+        Merges another sketch into this one.
+
+        Parameters:
+        other (HeavyHitters): The sketch to merge.
+        """
+        self.is_exact = self.is_exact and other.is_exact
+        self._add(other.counts)
+
+    def _add(self, counts: pd.Series):
+        counts = counts.astype("int64")
+        self.counts = counts if self.counts.empty else self.counts.add(counts, fill_value=0).astype("int64")
+        if len(self.counts) > self.capacity:
+            ## Subtract the (capacity + 1)-th largest count from all counters and drop the non-positive ones
+            threshold = np.partition(self.counts.to_numpy(), -(self.capacity + 1))[-(self.capacity + 1)]
+            self.counts = self.counts[self.counts > threshold] - threshold
+            self.is_exact = False
+
+    def top(self, n: int = 10) -> pd.Series:
+        """
+        Returns the most frequent values, ties broken by the smaller value like Series.mode().
+
+        Parameters:
+        n (int): The number of values to return.
+
+        Returns:
+        pd.Series: Counts of the most frequent values, indexed by value.
+        """
+        if self.counts.empty:
+            return self.counts
+        ordered = self.counts.sort_index(kind="stable")
+        return ordered.iloc[np.argsort(-ordered.to_numpy(), kind="stable")[:n]]
+
+
+## HyperLogLog distinct-count estimator
+# 2**precision one-byte registers; the standard error is about 1.04 / sqrt(2**precision).
+class DistinctCounter:
+    def __init__(self, precision: int = 12):
+        """
+        Initializes the DistinctCounter.
+
+        Parameters:
+        precision (int): The number of hash bits used to pick a register.
+        """
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype="uint8")
+
+    def update(self, values: pd.Series):
+        """
+        Adds a batch of values. Missing values are ignored.
+
+        Parameters:
+        values (pd.Series): The values to count.
+        """
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(values.to_numpy())
+        register = (hashes >> np.uint64(64 - self.precision)).astype("int64")
+        remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+
+        ## Position of the leftmost 1-bit within the remaining 64 - precision bits
+        bit_length = np.zeros(len(remainder), dtype="int64")
+        nonzero = remainder > 0
+        bit_length[nonzero] = np.floor(np.log2(remainder[nonzero].astype("float64"))).astype("int64") + 1
+        rank = 64 - self.precision - bit_length + 1
+
+        ## Maximum rank per register without ufunc.at: mark every (register, rank) pair seen,
+        ## then take the highest marked rank of each register
+        seen = np.zeros((len(self.registers), 66 - self.precision), dtype=bool)
+        seen[register, rank] = True
+        highest = seen.shape[1] - 1 - np.argmax(seen[:, ::-1], axis=1)
+        highest[~seen.any(axis=1)] = 0
+        np.maximum(self.registers, highest.astype("uint8"), out=self.registers)
+
+    def merge(self, other: "DistinctCounter"):
+        """
+        Merges another counter into this one.
+
+        Parameters:
+        other (DistinctCounter): The counter to merge.
+        """
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype("float64"))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)  ## Linear counting for small cardinalities
+        return float(estimate)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+## Helpers for frames holding sparse-backed columns
+# One-hot indicators in sparse mode are pandas SparseDtype columns: only the rows holding a 1 are
+# stored. Models take such frames as a SciPy CSR matrix built straight from the stored positions, so
+# the indicators are never densified on the way to training.
+
+
+def sparse_columns(df: pd.DataFrame) -> list:
+    """
+    Lists the sparse-backed columns of a frame.
+
+    Parameters:
+    df (pd.DataFrame): The frame to inspect.
+
+    Returns:
+    list: The names of the columns with a SparseDtype.
+    """
+    return [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+
+
+def frame_to_csr(df: pd.DataFrame, dtype: np.dtype = np.float64) -> sp.csr_matrix:
+    """
+    Converts a numeric frame to a floating-point CSR matrix, keeping the column order.
+
+    Sparse columns with a zero fill value contribute their stored entries directly; dense columns
+    contribute their nonzero (including NaN) entries.
+
+    Parameters:
+    df (pd.DataFrame): The numeric frame to convert.
+    dtype (np.dtype): The type of the matrix entries. Default is float64.
+
+    Returns:
+    sp.csr_matrix: The matrix, one row per row of df and one column per column of df.
+    """
+    rows, columns, data = [], [], []
+    for j in range(df.shape[1]):
+        series = df.iloc[:, j]
+        if isinstance(series.dtype, pd.SparseDtype) and series.sparse.fill_value == 0:
+            positions = series.array.sp_index.to_int_index().indices
+            values = series.array.sp_values.astype(dtype)
+        else:
+            dense = series.to_numpy(dtype=dtype, na_value=np.nan)
+            positions = np.flatnonzero(dense)
+            values = dense[positions]
+        rows.append(positions)
+        columns.append(np.full(len(positions), j))
+        data.append(values)
+    if not data:
+        return sp.csr_matrix(df.shape, dtype=dtype)
+    return sp.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(columns))), shape=df.shape
+    )
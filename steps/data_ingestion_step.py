@@ -1,26 +1,139 @@
+import glob
+import os
+from typing import Annotated, List, Optional, Tuple
+
 import pandas as pd
+from src.chunked_data import ChunkedData
+from src.ingest_cache import IngestCache
+from src.incremental_ingest import IncrementalIngestor
 from src.ingest_data import DataIngestorFactory
+from steps.feature_store_materializer import FeatureStoreMaterializer
 from zenml import step
 
 
-@step
-def data_ingestion_step(file_path: str) -> pd.DataFrame:
+@step(output_materializers=FeatureStoreMaterializer)
+def data_ingestion_step(
+    file_path: str,
+    use_cache: bool = True,
+    schema_path: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[str]] = None,
+    engine: str = "c",
+    precision: Optional[str] = None,
+) -> pd.DataFrame:
     '''Data Ingestion Step
     
     This step is used to ingest data from a file path.
     
     Args:
-        file_path (str): The path to the file to ingest.
+        file_path (str): The path to the file to ingest, or a glob pattern matching several files.
+        use_cache (bool): Load the parsed data from the columnar ingest cache when the file is unchanged.
+        schema_path (str): JSON ingest schema applied while parsing. It is inferred and saved on first use.
+        columns (list): Only these columns are decoded. All columns when None.
+        filters (list): Row predicates such as "Yr Sold >= 2008", combined with AND and evaluated while reading.
+        engine (str): CSV parser backend: "c" (pandas), "pyarrow" (multithreaded, NumPy-backed columns)
+            or "pyarrow_dtypes" (multithreaded, Arrow-backed columns). See benchmarks/ingest_benchmark.py.
+        precision (str): Parse float columns as "float32" or "float64". None keeps the schema's float types.
         
     Returns:
         pd.DataFrame: The ingested data.
     '''
     
-    ## Detect the file type
-    file_extension = ".zip"  # Assuming the file is a ZIP file
+    ## Detect the file type, and whether the path is a glob over many files
+    file_extension = os.path.splitext(file_path)[1]
+    multiple = glob.has_magic(file_path)
 
     ## Ingest the data
-    data_ingestor = DataIngestorFactory.get_ingestor(file_extension) 
+    data_ingestor = DataIngestorFactory.get_ingestor(
+        file_extension,
+        multiple=multiple,
+        cache=IngestCache() if use_cache else None,
+        schema_path=schema_path,
+        engine=engine,
+        precision=precision,
+    )
+    
+    df = data_ingestor.ingest(file_path, columns=columns, filters=filters)
+    return df
+
+
+@step
+def chunked_data_ingestion_step(
+    file_path: str,
+    chunksize: int = 100_000,
+    use_cache: bool = True,
+    schema_path: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[str]] = None,
+    engine: str = "c",
+    precision: Optional[str] = None,
+) -> ChunkedData:
+    '''Chunked Data Ingestion Step
+    
+    This step is used to ingest data from a file path as a lazy stream of DataFrame chunks,
+    so downstream consumers never need to hold the whole dataset in memory.
+    
+    Args:
+        file_path (str): The path to the file to ingest, or a glob pattern matching several files.
+        chunksize (int): The maximum number of rows per chunk.
+        use_cache (bool): Slice the chunks out of the columnar ingest cache when the file is unchanged.
+        schema_path (str): JSON ingest schema applied while parsing. It is inferred and saved on first use.
+        columns (list): Only these columns are decoded. All columns when None.
+        filters (list): Row predicates such as "Yr Sold >= 2008", combined with AND and evaluated while reading.
+        engine (str): CSV parser backend: "c", "pyarrow" or "pyarrow_dtypes".
+        precision (str): Parse float columns as "float32" or "float64". None keeps the schema's float types.
+        
+    Returns:
+        ChunkedData: A re-iterable stream of DataFrame chunks.
+    '''
     
-    df = data_ingestor.ingest(file_path) 
-    return df
\ No newline at end of file
+    ## Detect the file type, and whether the path is a glob over many files
+    file_extension = os.path.splitext(file_path)[1]
+    multiple = glob.has_magic(file_path)
+
+    ## Hand the chunk stream on without concatenating it
+    data_ingestor = DataIngestorFactory.get_ingestor(
+        file_extension,
+        multiple=multiple,
+        cache=IngestCache() if use_cache else None,
+        schema_path=schema_path,
+        engine=engine,
+        precision=precision,
+    )
+    return data_ingestor.ingest_chunked(file_path, chunksize, columns=columns, filters=filters)
+
+
+@step(output_materializers=FeatureStoreMaterializer)
+def incremental_data_ingestion_step(
+    file_path: str,
+    state_dir: str = "data/incremental",
+    key_column: Optional[str] = "Order",
+    use_cache: bool = True,
+    schema_path: Optional[str] = None,
+) -> Tuple[Annotated[pd.DataFrame, "delta_data"], Annotated[pd.DataFrame, "merged_data"]]:
+    '''Incremental Data Ingestion Step
+    
+    This step is used to ingest only the archives and rows that are new since the last run,
+    appending them to a persisted dataset.
+    
+    Args:
+        file_path (str): The path to the archive to ingest, or a glob pattern matching several archives.
+        state_dir (str): The directory holding the watermark and the persisted dataset.
+        key_column (str): Monotonically increasing row key used as the row watermark.
+        use_cache (bool): Load the parsed data from the columnar ingest cache when a file is unchanged.
+        schema_path (str): JSON ingest schema applied while parsing. It is inferred and saved on first use.
+        
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The rows new in this run and the merged dataset.
+    '''
+    
+    ## Detect the file type
+    file_extension = os.path.splitext(file_path)[1]
+
+    ## Ingest the new data and append it to the persisted dataset
+    data_ingestor = DataIngestorFactory.get_ingestor(
+        file_extension, cache=IngestCache() if use_cache else None, schema_path=schema_path
+    )
+    incremental_ingestor = IncrementalIngestor(data_ingestor, state_dir, key_column=key_column)
+    delta, merged = incremental_ingestor.ingest(file_path)
+    return delta, merged
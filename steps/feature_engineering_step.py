@@ -1,34 +1,87 @@
+from typing import List, Optional
+
 import pandas as pd
 from src.feature_engineering import (
     FeatureEngineer,
-    LogTransformation,
-    MinMaxScaling,
-    OneHotEncoding,
-    StandardScaling,
+    FeatureEngineeringPipeline,
+    make_strategy,
 )
+from src.transform_cache import TransformCache
+from steps.feature_store_materializer import FeatureStoreMaterializer
 from zenml import step
 
 
-@step
+@step(output_materializers=FeatureStoreMaterializer)
 def feature_engineering_step(
-    df: pd.DataFrame, strategy: str = "log", features: list = None
+    df: pd.DataFrame,
+    strategy: str = "log",
+    features: list = None,
+    inplace: bool = False,
+    sparse: bool = False,
+    target_column: Optional[str] = None,
+    n_features: int = 64,
+    transform_cache: bool = False,
+    n_jobs: Optional[int] = None,
+    precision: Optional[str] = None,
 ) -> pd.DataFrame:
-    """Performs feature engineering using FeatureEngineer and selected strategy."""
+    """Performs feature engineering using FeatureEngineer and selected strategy.
+
+    Strategies: "log", "standard_scaling", "minmax_scaling", "onehot_encoding", "feature_hashing"
+    (n_features columns whatever the number of categories) and "target_encoding" (one column per
+    feature, encoded out-of-fold with target_column).
+
+    With inplace=True the loaded input frame is transformed instead of a copy, which is safe in a
+    pipeline because every step loads its own input. With sparse=True "onehot_encoding" and
+    "feature_hashing" produce sparse-backed columns, which model_building_step trains on without densifying.
+    With transform_cache=True the result is reused from the TransformCache when a frame with the same
+    contents was already transformed with the same strategy. "log", "standard_scaling" and
+    "minmax_scaling" process blocks of features on n_jobs threads (all cores when None) and store
+    their output in precision ("float32" or "float64"; None keeps their defaults).
+    """
 
     # Ensure features is a list, even if not provided
     if features is None:
         features = []  # or raise an error if features are required
 
-    if strategy == "log":
-        engineer = FeatureEngineer(LogTransformation(features))
-    elif strategy == "standard_scaling":
-        engineer = FeatureEngineer(StandardScaling(features))
-    elif strategy == "minmax_scaling":
-        engineer = FeatureEngineer(MinMaxScaling(features))
-    elif strategy == "onehot_encoding":
-        engineer = FeatureEngineer(OneHotEncoding(features))
-    else:
-        raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
+    params = {}
+    if strategy in ("log", "standard_scaling", "minmax_scaling"):
+        params["n_jobs"] = n_jobs
+        params["precision"] = precision
+    if strategy in ("onehot_encoding", "feature_hashing"):
+        params["sparse"] = sparse
+    if strategy == "feature_hashing":
+        params["n_features"] = n_features
+    if strategy == "target_encoding":
+        if target_column is None:
+            raise ValueError("The target_encoding strategy needs a target_column.")
+        params["target"] = target_column
+    cache = TransformCache() if transform_cache else None
+    engineer = FeatureEngineer(make_strategy(strategy, features, **params), inplace=inplace, cache=cache)
+
+    transformed_df = engineer.apply_feature_engineering(df)
+    return transformed_df
+
+
+@step(output_materializers=FeatureStoreMaterializer)
+def feature_engineering_pipeline_step(
+    df: pd.DataFrame,
+    spec: List[dict],
+    n_jobs: Optional[int] = None,
+    inplace: bool = False,
+    transform_cache: bool = False,
+) -> pd.DataFrame:
+    """Performs several feature engineering strategies in one pass over the frame.
+
+    The spec lists the column groups with their ordered strategies, e.g.
+    [{"features": ["SalePrice", "Gr Liv Area"], "strategies": ["log", "standard_scaling"]},
+     {"features": ["Neighborhood"], "strategies": ["onehot_encoding"]}].
+    Independent groups run concurrently on n_jobs threads. transform_cache=True reuses the result for
+    unchanged input, as in feature_engineering_step.
+    """
+    cache = TransformCache() if transform_cache else None
+    engineer = FeatureEngineer(
+        FeatureEngineeringPipeline.from_spec(spec, n_jobs=n_jobs), inplace=inplace, cache=cache
+    )
 
     transformed_df = engineer.apply_feature_engineering(df)
     return transformed_df
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import tempfile
+from typing import Any, ClassVar, Dict, Tuple, Type
+
+import pandas as pd
+from src.feature_store import DEFAULT_STORE_DIR, DEFAULT_STORE_MAX_BYTES, FrameHandle
+from src.ingest_cache import evict_lru
+from zenml.enums import ArtifactType
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils
+
+FRAME_FILENAME = "frame.arrow"
+
+
+class FeatureStoreMaterializer(BaseMaterializer):
+    """Stores DataFrames as uncompressed Arrow files and loads them memory-mapped.
+
+    Steps pass the artifact (a handle to the file) instead of a parsed copy, and a step loading it
+    gets numeric columns as read-only views of the mapped file. With a local artifact store the file
+    is mapped in place; with a remote one it is downloaded once into a size-capped local cache and mapped from there.
+    """
+
+    ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (pd.DataFrame,)
+    ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+
+    def _local_path(self) -> str:
+        """Local file to map: the artifact itself, or a cached download of a remote artifact"""
+        path = os.path.join(self.uri, FRAME_FILENAME)
+        if not io_utils.is_remote(path):
+            return path
+        os.makedirs(DEFAULT_STORE_DIR, exist_ok=True)
+        return os.path.join(DEFAULT_STORE_DIR, f"{hashlib.blake2b(path.encode(), digest_size=16).hexdigest()}.arrow")
+
+    def load(self, data_type: Type[Any]) -> pd.DataFrame:
+        """Memory-maps the stored frame.
+
+        Args:
+            data_type: The type of the data to read.
+
+        Returns:
+            The DataFrame, with numeric columns backed by the mapped file.
+        """
+        path = os.path.join(self.uri, FRAME_FILENAME)
+        local_path = self._local_path()
+        if local_path == path:
+            return FrameHandle.open(local_path).load()
+
+        if os.path.exists(local_path):
+            ## Marks the copy as recently used
+            os.utime(local_path)
+        else:
+            ## Download to a temporary name so an interrupted copy is never mistaken for a complete one
+            fd, tmp_path = tempfile.mkstemp(dir=DEFAULT_STORE_DIR, suffix=".tmp")
+            os.close(fd)
+            try:
+                fileio.copy(path, tmp_path, overwrite=True)
+                os.replace(tmp_path, local_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        df = FrameHandle.open(local_path).load()
+        ## The frame stays valid if its own copy is evicted: the mapping outlives the file
+        evict_lru(DEFAULT_STORE_DIR, DEFAULT_STORE_MAX_BYTES)
+        return df
+
+    def save(self, df: pd.DataFrame) -> None:
+        """Writes the frame as an uncompressed Arrow file.
+
+        Args:
+            df: The DataFrame to write.
+        """
+        path = os.path.join(self.uri, FRAME_FILENAME)
+        if not io_utils.is_remote(path):
+            fileio.makedirs(self.uri)
+            FrameHandle.write(df, path)
+            return
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, FRAME_FILENAME)
+            FrameHandle.write(df, tmp_path)
+            fileio.copy(tmp_path, path, overwrite=True)
+
+    def extract_metadata(self, df: pd.DataFrame) -> Dict[str, "MetadataType"]:
+        """Extracts the shape and dtypes, without the full-column statistics the default materializer computes.
+
+        Args:
+            df: The DataFrame to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        return {
+            "shape": df.shape,
+            "dtype": {str(key): DType(value.type) for key, value in df.dtypes.items()},
+        }
@@ -1,27 +1,84 @@
+import os
+from typing import List, Optional
+
 import pandas as pd
 from zenml import step
-from src.handle_missing_values import MissingValueHandler, DropMissingValues, FillMissingValues
+from src.handle_missing_values import (
+    MissingValueHandler,
+    DropMissingValues,
+    FillMissingValues,
+    IterativeFillMissingValues,
+    KNNFillMissingValues,
+)
+from src.transform_cache import TransformCache
+from steps.feature_store_materializer import FeatureStoreMaterializer
 
-@step
-def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.DataFrame:
+@step(output_materializers=FeatureStoreMaterializer)
+def handle_missing_values_step(
+    df: pd.DataFrame,
+    strategy: str = "mean",
+    fill_values_path: Optional[str] = None,
+    inplace: bool = False,
+    features: Optional[List[str]] = None,
+    n_neighbors: int = 5,
+    n_jobs: int = -1,
+    max_iter: int = 10,
+    transform_cache: bool = False,
+) -> pd.DataFrame:
     '''Handle Missing Values Step
     
     This step is used to handle missing values in a dataframe.
     
     Args:
         df (pd.DataFrame): The dataframe to handle missing values for.
-        strategy (str): The strategy to use for handling missing values. Default is "mean".
+        strategy (str): The strategy to use for handling missing values: "drop", "mean", "median", "mode",
+            "constant", "knn" or "iterative". Default is "mean".
+        fill_values_path (str): JSON file holding the learned fill values. When it exists they are applied
+            without refitting; otherwise they are fitted on df and saved there. Default is None.
+        inplace (bool): Fill the loaded input frame instead of a copy. Safe in a pipeline, where every step
+            loads its own input. Default is False.
+        features (list): Numeric columns the "knn" and "iterative" strategies use and fill. All numeric
+            columns when None; a handful of informative columns keeps the KNN index fast on large data.
+        n_neighbors (int): Neighbors averaged by the "knn" strategy. Default is 5.
+        n_jobs (int): Threads answering the "knn" neighbor queries; -1 uses all cores. Default is -1.
+        max_iter (int): Maximum imputation rounds of the "iterative" strategy. Default is 10.
+        transform_cache (bool): Reuse the result from the TransformCache when a frame with the same contents was
+            already handled with the same strategy. Not used with fill_values_path. Default is False.
         
     Returns:
         pd.DataFrame: The dataframe with missing values handled.
     '''
     
+    cache = TransformCache() if transform_cache else None
     if strategy == "drop":
-        handler = MissingValueHandler(DropMissingValues(axis=0))  ## axis=0 means drop rows
-    elif strategy in ["mean", "median", "mode", "constant"]:
-        handler = MissingValueHandler(FillMissingValues(method=strategy))
-    else:
+        handler = MissingValueHandler(DropMissingValues(axis=0), cache=cache)  ## axis=0 means drop rows
+        return handler.handle_missing_values(df)
+    elif strategy == "knn":
+        handler = MissingValueHandler(
+            KNNFillMissingValues(n_neighbors=n_neighbors, features=features, n_jobs=n_jobs), inplace=inplace, cache=cache
+        )
+        return handler.handle_missing_values(df)
+    elif strategy == "iterative":
+        handler = MissingValueHandler(
+            IterativeFillMissingValues(features=features, max_iter=max_iter), inplace=inplace, cache=cache
+        )
+        return handler.handle_missing_values(df)
+    elif strategy not in ["mean", "median", "mode", "constant"]:
         raise ValueError(f"Invalid strategy: {strategy}")
 
-    df_cleaned = handler.handle_missing_values(df)
-    return df_cleaned
\ No newline at end of file
+    if fill_values_path is None and cache is not None:
+        handler = MissingValueHandler(FillMissingValues(method=strategy), inplace=inplace, cache=cache)
+        return handler.handle_missing_values(df)
+
+    if fill_values_path is not None and os.path.exists(fill_values_path):
+        ## Reusing the fill values learned on the training data, e.g. at inference
+        filler = FillMissingValues.load(fill_values_path)
+        if filler.method != strategy:
+            raise ValueError(f"Fill values in {fill_values_path} were fitted with method '{filler.method}', not '{strategy}'")
+    else:
+        filler = FillMissingValues(method=strategy).fit(df)
+        if fill_values_path is not None:
+            filler.save(fill_values_path)
+
+    df_cleaned = filler.transform(df, inplace=inplace)
+    return df_cleaned
@@ -1,13 +1,16 @@
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 import mlflow
+import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
+from src.precision import cast_columns, float_dtype
+from src.sparse_frames import frame_to_csr, sparse_columns
 from zenml import ArtifactConfig, step
 from zenml.client import Client
 from zenml import Model
@@ -25,7 +28,7 @@ model = Model(
 
 @step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: pd.DataFrame, y_train: pd.Series, precision: Optional[str] = None
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
     Builds and trains a Linear Regression model using scikit-learn wrapped in a pipeline.
@@ -33,6 +36,8 @@ def model_building_step(
     Parameters:
     X_train (pd.DataFrame): The training data features.
     y_train (pd.Series): The training data labels/target.
+    precision (str): Fit in "float32" or "float64". Numeric features and the target are cast first and the
+        one-hot indicators are built in that type. None fits in float64.
 
     Returns:
     Pipeline: The trained scikit-learn pipeline including preprocessing and the Linear Regression model.
@@ -43,32 +48,50 @@ def model_building_step(
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
 
-    # Identify categorical and numerical columns
+    # Cast the numeric features and the target to the requested precision
+    dtype = float_dtype(precision) or np.dtype("float64")
+    if precision is not None:
+        X_train = cast_columns(X_train, precision, integers=True)
+        y_train = y_train.astype(dtype)
+
+    # Identify categorical, numerical and sparse-backed (e.g. sparse one-hot) columns
+    sparse_cols = sparse_columns(X_train)
     categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
-    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
+    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns.drop(sparse_cols)
 
     logging.info(f"Categorical columns: {categorical_cols.tolist()}")
     logging.info(f"Numerical columns: {numerical_cols.tolist()}")
+    logging.info(f"Sparse columns: {sparse_cols}")
 
     # Define preprocessing for categorical and numerical features
     numerical_transformer = SimpleImputer(strategy="mean")
     categorical_transformer = Pipeline(
         steps=[
             ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore")),
+            ("onehot", OneHotEncoder(handle_unknown="ignore", dtype=dtype)),
         ]
     )
 
     # Bundle preprocessing for numerical and categorical data
-    preprocessor = ColumnTransformer(
-        transformers=[
-            ("num", numerical_transformer, numerical_cols),
-            ("cat", categorical_transformer, categorical_cols),
-        ]
-    )
+    transformers = [
+        ("num", numerical_transformer, numerical_cols),
+        ("cat", categorical_transformer, categorical_cols),
+    ]
+    if sparse_cols:
+        ## Sparse columns go to the model as CSR without densifying; the whole design matrix then stays
+        ## sparse (sparse_threshold=1), which LinearRegression fits directly
+        transformers.append(
+            ("sparse", FunctionTransformer(frame_to_csr, accept_sparse=True, kw_args={"dtype": dtype}), sparse_cols)
+        )
+    preprocessor = ColumnTransformer(transformers=transformers, sparse_threshold=1.0 if sparse_cols else 0.3)
 
     # Define the model training pipeline
-    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+    steps = [("preprocessor", preprocessor), ("model", LinearRegression())]
+    if sparse_cols:
+        ## On sparse input LinearRegression uses an iterative solver, which stops short of the
+        ## least-squares solution on unscaled columns; scaling without centering keeps the matrix sparse
+        steps.insert(1, ("scaler", StandardScaler(with_mean=False)))
+    pipeline = Pipeline(steps=steps)
 
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
@@ -89,7 +112,7 @@ def model_building_step(
         onehot_encoder.fit(X_train[categorical_cols])
         expected_columns = numerical_cols.tolist() + list(
             onehot_encoder.get_feature_names_out(categorical_cols)
-        )
+        ) + sparse_cols
         logging.info(f"Model expects the following columns: {expected_columns}")
 
     except Exception as e:
@@ -1,13 +1,37 @@
 import logging
 
+import numpy as np
 import pandas as pd
-from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+from src.outlier_detection import (
+    IQROutlierDetection,
+    IsolationForestOutlierDetection,
+    OutlierDetector,
+    RobustMahalanobisOutlierDetection,
+    ZScoreOutlierDetection,
+)
+from src.transform_cache import TransformCache
+from steps.feature_store_materializer import FeatureStoreMaterializer
 from zenml import step
 
 
-@step
-def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
-    """Detects and removes outliers using OutlierDetector."""
+@step(output_materializers=FeatureStoreMaterializer)
+def outlier_detection_step(
+    df: pd.DataFrame,
+    column_name: str,
+    transform_cache: bool = False,
+    strategy: str = "zscore",
+    targeted: bool = False,
+) -> pd.DataFrame:
+    """Detects and removes outliers using OutlierDetector.
+
+    strategy is "zscore" or "iqr", which flag single values, or "isolation_forest" or
+    "robust_mahalanobis", which score whole rows and only drop rows that are unusual as a whole.
+    By default every numeric column is checked and only the numeric columns are returned. With
+    targeted=True only column_name is checked, and its outlier rows are removed from the whole frame,
+    so the categorical columns reach model building.
+    With transform_cache=True the result is reused from the TransformCache when a frame with the same
+    contents was already cleaned.
+    """
     logging.info(f"Starting outlier detection step with DataFrame of shape: {df.shape}")
 
     if df is None:
@@ -21,10 +45,23 @@ def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
     if column_name not in df.columns:
         logging.error(f"Column '{column_name}' does not exist in the DataFrame.")
         raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
-        # Ensure only numeric columns are passed
-    df_numeric = df.select_dtypes(include=[int, float])
 
-    outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
-    outliers = outlier_detector.detect_outliers(df_numeric)
-    df_cleaned = outlier_detector.handle_outliers(df_numeric, method="remove")
+    if strategy == "zscore":
+        detection_strategy = ZScoreOutlierDetection(threshold=3)
+    elif strategy == "iqr":
+        detection_strategy = IQROutlierDetection()
+    elif strategy == "isolation_forest":
+        detection_strategy = IsolationForestOutlierDetection()
+    elif strategy == "robust_mahalanobis":
+        detection_strategy = RobustMahalanobisOutlierDetection()
+    else:
+        raise ValueError(f"Invalid strategy: {strategy}")
+
+    outlier_detector = OutlierDetector(detection_strategy, cache=TransformCache() if transform_cache else None)
+    if targeted:
+        df_cleaned = outlier_detector.handle_outliers(df, method="remove", columns=[column_name])
+    else:
+        # Ensure only numeric columns are passed
+        df_numeric = df.select_dtypes(include=[np.number])
+        df_cleaned = outlier_detector.handle_outliers(df_numeric, method="remove")
     return df_cleaned
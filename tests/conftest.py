@@ -0,0 +1,51 @@
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+from src.chunked_data import ChunkedData
+
+AMES_ARCHIVE = os.path.join(root_dir, "data", "archive.zip")
+
+## The strategies log every step at INFO; keep the test output readable
+logging.disable(logging.INFO)
+
+
+def chunked(df: pd.DataFrame, chunksize: int) -> ChunkedData:
+    """The frame as a re-iterable stream of chunks of at most chunksize rows"""
+    return ChunkedData(lambda: (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize)))
+
+
+@pytest.fixture
+def ames_archive() -> str:
+    return AMES_ARCHIVE
+
+
+@pytest.fixture
+def as_chunks():
+    """Splits a frame into a ChunkedData stream"""
+    return chunked
+
+
+@pytest.fixture
+def mixed_frame() -> pd.DataFrame:
+    """2,000 rows of float, integer and categorical columns with gaps and a few extreme values"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame({
+        "price": rng.lognormal(12, 0.4, n),
+        "area": rng.normal(1500, 300, n),
+        "rooms": rng.integers(1, 9, n),
+        "neighborhood": pd.Categorical(rng.choice(["north", "south", "east", "west"], n)),
+    })
+    df.loc[rng.choice(n, 25, replace=False), "area"] = 10_000.0
+    df.loc[rng.choice(n, 150, replace=False), "area"] = np.nan
+    df.loc[rng.choice(n, 80, replace=False), "price"] = np.nan
+    return df
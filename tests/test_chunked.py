@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.handle_missing_values import FillMissingValues, StreamingFillMissingValues
+from src.outlier_detection import IQROutlierDetection, OutlierDetector, ZScoreOutlierDetection
+
+
+@pytest.mark.parametrize("method", ["mean", "mode"])
+def test_chunked_fill_values_match_in_memory(mixed_frame, as_chunks, method):
+    expected = FillMissingValues(method).fit(mixed_frame).fill_values_
+    fitted = FillMissingValues(method).fit_chunks(as_chunks(mixed_frame, 300)).fill_values_
+    assert fitted.keys() == expected.keys()
+    for column, value in expected.items():
+        assert fitted[column] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("method", ["mean", "median", "mode"])
+def test_streaming_fill_values_match_in_memory(mixed_frame, as_chunks, method):
+    ## 2,000 rows stay below the quantile sketch size, so medians are exact. Modes are exact only for
+    ## columns with at most top_k_capacity distinct values; the float columns have thousands.
+    expected = FillMissingValues(method).fit(mixed_frame).fill_values_
+    fitted = StreamingFillMissingValues(method).fit_chunks(as_chunks(mixed_frame, 300)).fill_values_
+    assert fitted.keys() == expected.keys()
+    exact = [column for column in expected if method != "mode" or mixed_frame[column].nunique() <= 256]
+    assert exact
+    for column in exact:
+        assert fitted[column] == pytest.approx(expected[column])
+
+
+def test_streaming_fill_transforms_every_chunk(mixed_frame, as_chunks):
+    chunks = as_chunks(mixed_frame, 300)
+    filled = StreamingFillMissingValues("median").handle_chunks(chunks).to_frame()
+    expected = FillMissingValues("median").handle(mixed_frame)
+    pd.testing.assert_frame_equal(filled, expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("strategy", [ZScoreOutlierDetection(threshold=3), IQROutlierDetection()])
+def test_chunked_outlier_removal_matches_in_memory(mixed_frame, as_chunks, strategy):
+    numeric = mixed_frame.select_dtypes(include=[np.number])
+    expected = OutlierDetector(strategy).handle_outliers(numeric, method="remove")
+    removed = OutlierDetector(strategy).handle_outliers_chunks(as_chunks(numeric, 300), method="remove").to_frame()
+
+    assert len(expected) < len(numeric)
+    pd.testing.assert_frame_equal(removed, expected.reset_index(drop=True))
+
+
+def test_chunked_outlier_fences_match_in_memory(mixed_frame, as_chunks):
+    numeric = mixed_frame.select_dtypes(include=[np.number])
+    in_memory = IQROutlierDetection().detect(numeric)
+    fitted = IQROutlierDetection().fit_chunks(as_chunks(numeric, 300))
+    pd.testing.assert_series_equal(pd.Series(fitted.lower_), in_memory.lower, check_names=False)
+    pd.testing.assert_series_equal(pd.Series(fitted.upper_), in_memory.upper, check_names=False)
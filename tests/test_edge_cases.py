@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.chunked_data import ChunkedData
+from src.feature_engineering import LogTransformation, TargetEncoding
+from src.handle_missing_values import IterativeFillMissingValues, KNNFillMissingValues
+from src.ingest_data import IngestCSVData
+from src.outlier_detection import IQROutlierDetection, OutlierDetector, ZScoreOutlierDetection
+
+
+@pytest.mark.parametrize("strategy", [KNNFillMissingValues(), IterativeFillMissingValues()])
+def test_fills_leave_frames_without_numeric_values_unchanged(strategy):
+    df = pd.DataFrame({"name": ["a", None, "c"], "empty": [np.nan] * 3})
+    filled = strategy.handle(df)
+
+    assert strategy.columns_ == []
+    pd.testing.assert_frame_equal(filled, df)
+    assert filled is not df
+
+
+@pytest.mark.parametrize("strategy", [ZScoreOutlierDetection(), IQROutlierDetection()])
+def test_targeted_outliers_reject_non_numeric_columns(mixed_frame, strategy):
+    with pytest.raises(ValueError, match="not numeric"):
+        OutlierDetector(strategy).handle_outliers(mixed_frame, columns=["neighborhood"])
+
+
+def test_targeted_outliers_keep_the_other_columns(mixed_frame):
+    cleaned = OutlierDetector(ZScoreOutlierDetection()).handle_outliers(mixed_frame, columns=["area"])
+
+    assert list(cleaned.columns) == list(mixed_frame.columns)
+    assert len(cleaned) < len(mixed_frame)
+    assert cleaned["area"].max() < 10_000
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow", "pyarrow_dtypes"])
+def test_filter_without_matches_yields_no_chunks_and_an_empty_frame(ames_archive, engine):
+    ingestor = IngestCSVData(engine=engine)
+    filters = ["Yr Sold >= 2100"]
+
+    assert list(ingestor.iter_chunks(ames_archive, 500, filters=filters)) == []
+    df = ingestor.ingest(ames_archive, filters=filters)
+    matched = ingestor.ingest(ames_archive, filters=["Yr Sold >= 2009"])
+    assert df.shape == (0, 82)
+    assert list(df.columns) == list(matched.columns)
+    ## pyarrow makes integer columns with nulls float, so only the kind of each column is stable
+    assert (df.dtypes.map(pd.api.types.is_numeric_dtype) == matched.dtypes.map(pd.api.types.is_numeric_dtype)).all()
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_filtered_chunks_are_never_empty(ames_archive, engine):
+    chunks = IngestCSVData(engine=engine).iter_chunks(ames_archive, 500, filters=["Yr Sold >= 2009"])
+    assert [len(chunk) for chunk in chunks] == [500, 489]
+
+
+def test_empty_chunk_stream_materializes_as_an_empty_frame():
+    assert ChunkedData(lambda: iter([])).to_frame().empty
+
+
+def test_log_transformation_of_small_integers_is_float64():
+    df = pd.DataFrame({"rooms": np.arange(10, dtype="int16"), "area": np.arange(10, dtype="float32")})
+    transformed = LogTransformation(["rooms", "area"], n_jobs=1).apply_transformation(df)
+    assert transformed.dtypes.to_dict() == {"rooms": np.dtype("float64"), "area": np.dtype("float32")}
+
+
+def test_unsmoothed_target_encoding_falls_back_to_the_prior():
+    ## The single "rare" row lands in one fold, so the other folds have no rows of its category
+    df = pd.DataFrame({"category": ["common"] * 20 + ["rare"], "target": np.arange(21.0)})
+    encoded = TargetEncoding(["category"], "target", smoothing=0).apply_transformation(df)
+    assert not encoded["category"].isna().any()
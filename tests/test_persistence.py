@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import (
+    FeatureEngineeringPipeline,
+    FeatureEngineeringStrategy,
+    LogTransformation,
+    MinMaxScaling,
+    OneHotEncoding,
+    StandardScaling,
+    TargetEncoding,
+)
+from src.handle_missing_values import FillMissingValues, StreamingFillMissingValues
+
+
+@pytest.fixture
+def complete_frame(mixed_frame) -> pd.DataFrame:
+    return FillMissingValues("median").handle(mixed_frame)
+
+
+@pytest.mark.parametrize("make_strategy", [
+    lambda: LogTransformation(["price", "area"]),
+    lambda: StandardScaling(["price", "area", "rooms"]),
+    lambda: MinMaxScaling(["area", "rooms"], feature_range=(-1, 1)),
+    lambda: OneHotEncoding(["neighborhood"]),
+    lambda: TargetEncoding(["neighborhood"], "price", smoothing=5.0),
+    lambda: FeatureEngineeringPipeline.from_spec([
+        {"features": ["price", "area"], "strategies": ["log", "standard_scaling"]},
+        {"features": ["neighborhood"], "strategies": ["onehot_encoding"]},
+    ]),
+])
+def test_fitted_strategy_round_trips_through_json(complete_frame, tmp_path, make_strategy):
+    strategy = make_strategy()
+    strategy.fit(complete_frame)
+    path = str(tmp_path / "strategy.json")
+    strategy.save(path)
+    loaded = FeatureEngineeringStrategy.load(path)
+
+    assert type(loaded) is type(strategy)
+    new_rows = complete_frame.sample(300, random_state=1)
+    pd.testing.assert_frame_equal(loaded.transform(new_rows), strategy.transform(new_rows))
+
+
+@pytest.mark.parametrize("method", ["mean", "median", "mode", "constant"])
+def test_fill_values_round_trip_through_json(mixed_frame, tmp_path, method):
+    strategy = FillMissingValues(method, fill_value=0).fit(mixed_frame)
+    path = str(tmp_path / "fill_values.json")
+    strategy.save(path)
+    loaded = FillMissingValues.load(path)
+
+    assert loaded.fill_values_ == strategy.fill_values_
+    pd.testing.assert_frame_equal(loaded.transform(mixed_frame), strategy.transform(mixed_frame))
+
+
+def test_streaming_fill_values_round_trip_through_json(mixed_frame, as_chunks, tmp_path):
+    strategy = StreamingFillMissingValues("median", quantile_k=512).fit_chunks(as_chunks(mixed_frame, 500))
+    path = str(tmp_path / "fill_values.json")
+    strategy.save(path)
+    loaded = StreamingFillMissingValues.load(path)
+
+    assert loaded.quantile_k == 512
+    assert loaded.fill_values_ == strategy.fill_values_
+
+
+def test_unfitted_fill_cannot_be_saved(tmp_path):
+    with pytest.raises(ValueError):
+        FillMissingValues("mean").save(str(tmp_path / "fill_values.json"))
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from src.sketches import DistinctCounter, HeavyHitters, QuantileSketch, RunningMoments
+
+
+def test_running_moments_merge_matches_numpy():
+    values = np.random.default_rng(0).normal(10, 3, 10_000)
+    values[::17] = np.nan
+    left, right = RunningMoments(), RunningMoments()
+    left.update(values[:3_000])
+    right.update(values[3_000:])
+    left.merge(right)
+
+    observed = values[~np.isnan(values)]
+    assert left.count == len(observed)
+    assert np.isclose(left.mean, observed.mean())
+    assert np.isclose(left.std(), observed.std(ddof=1))
+    assert (left.min, left.max) == (observed.min(), observed.max())
+
+
+def test_quantile_sketch_is_exact_below_k():
+    values = np.random.default_rng(1).normal(size=3_000)
+    sketch, other = QuantileSketch(k=4096), QuantileSketch(k=4096)
+    sketch.update(values[:1_000])
+    other.update(values[1_000:])
+    sketch.merge(other)
+
+    assert sketch.is_exact
+    q = [0.0, 0.1, 0.25, 0.5, 0.75, 0.99, 1.0]
+    np.testing.assert_array_equal(sketch.quantile(q), np.quantile(values, q))
+
+
+def test_quantile_sketch_rank_error_above_k():
+    values = np.random.default_rng(2).permutation(100_000).astype("float64")
+    sketch = QuantileSketch(k=1024, seed=0)
+    for start in range(0, len(values), 10_000):
+        sketch.update(values[start:start + 10_000])
+
+    assert not sketch.is_exact
+    for q in (0.1, 0.5, 0.9):
+        assert abs(sketch.quantile(q) - q * len(values)) < 0.01 * len(values)
+
+
+def test_heavy_hitters_are_exact_within_capacity():
+    values = pd.Series(np.random.default_rng(3).integers(0, 50, 5_000))
+    sketch, other = HeavyHitters(capacity=64), HeavyHitters(capacity=64)
+    sketch.update(values[:2_000])
+    other.update(values[2_000:])
+    sketch.merge(other)
+
+    assert sketch.is_exact
+    expected = values.value_counts()
+    pd.testing.assert_series_equal(sketch.counts.sort_index(), expected.sort_index(), check_names=False)
+    assert sketch.top(1).index[0] == values.mode().iloc[0]
+
+
+def test_heavy_hitters_keep_frequent_values_past_capacity():
+    rng = np.random.default_rng(4)
+    values = pd.Series(np.concatenate([np.full(2_000, -1), rng.integers(0, 10_000, 8_000)]))
+    sketch = HeavyHitters(capacity=16)
+    for start in range(0, len(values), 1_000):
+        sketch.update(values[start:start + 1_000])
+
+    assert not sketch.is_exact
+    assert sketch.top(1).index[0] == -1
+
+
+def test_distinct_counter_estimate_and_merge():
+    left, right = DistinctCounter(), DistinctCounter()
+    left.update(pd.Series(np.arange(0, 30_000)))
+    right.update(pd.Series(np.arange(20_000, 50_000)))
+    left.merge(right)
+    assert abs(left.estimate() - 50_000) < 0.05 * 50_000
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import FeatureEngineer, LogTransformation, StandardScaling
+from src.handle_missing_values import FillMissingValues, MissingValueHandler
+from src.transform_cache import TransformCache
+
+
+@pytest.fixture
+def cache(tmp_path) -> TransformCache:
+    return TransformCache(str(tmp_path / "transform"))
+
+
+def test_second_run_is_a_hit_with_the_same_result(mixed_frame, cache):
+    first = MissingValueHandler(FillMissingValues("median"), cache=cache).handle_missing_values(mixed_frame)
+    second = MissingValueHandler(FillMissingValues("median"), cache=cache).handle_missing_values(mixed_frame)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    pd.testing.assert_frame_equal(second, first)
+    assert cache.stats()["entries"] == 1
+
+
+def test_hit_restores_the_fitted_state(mixed_frame, cache):
+    fitted = FillMissingValues("mean")
+    MissingValueHandler(fitted, cache=cache).handle_missing_values(mixed_frame)
+
+    restored = FillMissingValues("mean")
+    MissingValueHandler(restored, cache=cache).handle_missing_values(mixed_frame)
+    assert cache.hits == 1
+    assert restored.fill_values_ == fitted.fill_values_
+
+
+def test_changed_input_configuration_or_code_version_is_a_miss(mixed_frame, cache, monkeypatch):
+    features = ["price", "area"]
+    FeatureEngineer(LogTransformation(features), cache=cache).apply_feature_engineering(mixed_frame)
+
+    edited = mixed_frame.copy()
+    edited.loc[0, "area"] = 1.0
+    FeatureEngineer(LogTransformation(features), cache=cache).apply_feature_engineering(edited)
+    FeatureEngineer(LogTransformation(["price"]), cache=cache).apply_feature_engineering(mixed_frame)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    ## A fix that changes a strategy's results bumps its cache_version, so old entries are not served
+    monkeypatch.setattr(LogTransformation, "cache_version", LogTransformation.cache_version + 1)
+    FeatureEngineer(LogTransformation(features), cache=cache).apply_feature_engineering(mixed_frame)
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_eviction_keeps_the_cache_under_its_size_cap(tmp_path):
+    cache = TransformCache(str(tmp_path / "transform"), max_bytes=60_000)
+    for seed in range(6):
+        df = pd.DataFrame({"x": np.random.default_rng(seed).normal(size=2_000)})
+        FeatureEngineer(StandardScaling(["x"]), cache=cache).apply_feature_engineering(df)
+
+    stats = cache.stats()
+    assert 0 < stats["bytes"] <= 60_000
+    assert stats["entries"] < 6
+    names = {path.name for path in (tmp_path / "transform").iterdir()}
+    ## Fitted state is evicted with its entry
+    assert {name[:-len(".json")] for name in names if name.endswith(".json")} <= \
+        {name[:-len(".arrow")] for name in names if name.endswith(".arrow")}